@@ -16,16 +16,16 @@
         - get_monitor() -> EnhancedProcessingMonitor (line 187)
         - root() (line 196)
         - health_check(health_checker: SciRagHealthChecker = Depends(get_health_checker), monitor: EnhancedProcessingMonitor = Depends(get_monitor)) (line 206)
-        - get_metrics(monitor: EnhancedProcessingMonitor = Depends(get_monitor)) (line 232)
-        - query_documents(request: QueryRequest, background_tasks: BackgroundTasks, processor: EnhancedDocumentProcessor = Depends(get_document_processor), monitor: EnhancedProcessingMonitor = Depends(get_monitor)) (line 247)
-        - upload_document(request: DocumentUploadRequest, background_tasks: BackgroundTasks, processor: EnhancedDocumentProcessor = Depends(get_document_processor), monitor: EnhancedProcessingMonitor = Depends(get_monitor)) (line 293)
-        - get_config() (line 347)
-        - validate_config() (line 353)
-        - log_query(query: str, processing_time: float) (line 360)
-        - cleanup_temp_file(file_path: Path) (line 366)
-        - http_exception_handler(request, exc) (line 378)
-        - general_exception_handler(request, exc) (line 387)
-        - run_server() (line 397)
+        - get_metrics(monitor: EnhancedProcessingMonitor = Depends(get_monitor)) (line 233)
+        - query_documents(request: QueryRequest, background_tasks: BackgroundTasks, processor: EnhancedDocumentProcessor = Depends(get_document_processor), monitor: EnhancedProcessingMonitor = Depends(get_monitor)) (line 249)
+        - upload_document(request: DocumentUploadRequest, background_tasks: BackgroundTasks, processor: EnhancedDocumentProcessor = Depends(get_document_processor), monitor: EnhancedProcessingMonitor = Depends(get_monitor)) (line 295)
+        - get_config() (line 349)
+        - validate_config() (line 355)
+        - log_query(query: str, processing_time: float) (line 362)
+        - cleanup_temp_file(file_path: Path) (line 368)
+        - http_exception_handler(request, exc) (line 380)
+        - general_exception_handler(request, exc) (line 389)
+        - run_server() (line 399)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Production API server for Enhanced SciRAG.
@@ -214,6 +214,7 @@ async def health_check(
         
         # Get metrics
         metrics = monitor.get_metrics()
+        metrics['thresholds'] = dict(metrics['thresholds'])
         
         return HealthResponse(
             status=health_status['overall_status'],
@@ -233,6 +234,7 @@ async def get_metrics(monitor: EnhancedProcessingMonitor = Depends(get_monitor))
     """Get system metrics."""
     try:
         metrics = monitor.get_metrics()
+        metrics['thresholds'] = dict(metrics['thresholds'])
         return MetricsResponse(
             metrics=metrics,
             timestamp=time.strftime("%Y-%m-%dT%H:%M:%S")
@@ -3,20 +3,20 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - AssetProcessor (line 32):
-            - process_asset(text: str, source_id: str) -> Optional[AssetContent] (line 51)
-            - _process_figure(text: str, source_id: str) -> Optional[AssetContent] (line 77)
-            - _process_table(text: str, source_id: str) -> Optional[AssetContent] (line 97)
-            - _contains_figure(text: str) -> bool (line 117)
-            - _contains_table(text: str) -> bool (line 124)
-            - _extract_caption(text: str) -> Optional[str] (line 131)
-            - _extract_file_path(text: str) -> Optional[str] (line 145)
-            - _extract_alt_text(text: str) -> Optional[str] (line 154)
-            - _extract_label(text: str) -> Optional[str] (line 163)
-            - _extract_table_data(text: str) -> Optional[List[List[str]]] (line 172)
-            - extract_all_assets(text: str, source_id: str) -> List[AssetContent] (line 196)
-            - _split_into_asset_blocks(text: str) -> List[str] (line 219)
-            - get_asset_statistics(assets: List[AssetContent]) -> Dict[str, Any] (line 237)
+        - AssetProcessor (line 49):
+            - process_asset(text: str, source_id: str) -> Optional[AssetContent] (line 68)
+            - _process_figure(text: str, source_id: str) -> Optional[AssetContent] (line 98)
+            - _process_table(text: str, source_id: str) -> Optional[AssetContent] (line 118)
+            - _contains_figure(text: str) -> bool (line 138)
+            - _contains_table(text: str) -> bool (line 148)
+            - _extract_caption(text: str) -> Optional[str] (line 158)
+            - _extract_file_path(text: str) -> Optional[str] (line 172)
+            - _extract_alt_text(text: str) -> Optional[str] (line 181)
+            - _extract_label(text: str) -> Optional[str] (line 190)
+            - _extract_table_data(text: str) -> Optional[List[List[str]]] (line 199)
+            - extract_all_assets(text: str, source_id: str) -> List[AssetContent] (line 223)
+            - _split_into_asset_blocks(text: str) -> List[str] (line 246)
+            - get_asset_statistics(assets: List[AssetContent]) -> Dict[str, Any] (line 264)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Asset processing module for Enhanced SciRAG.
@@ -28,6 +28,23 @@ import re
 from typing import Dict, Any, Optional, List
 from .enhanced_chunk import AssetContent
 
+# Literal markers that must be present before the figure/table regexes can
+# match; a plain substring test is far cheaper than a regex scan for the
+# (common) negative case.
+_FIGURE_MARKERS = (
+    '\\begin{figure}',
+    '\\includegraphics',
+    '\\begin{picture}',
+    '\\begin{tikzpicture}'
+)
+
+_TABLE_MARKERS = (
+    '\\begin{table}',
+    '\\begin{tabular}',
+    '\\begin{array}',
+    '\\begin{longtable}'
+)
+
 
 class AssetProcessor:
     """Asset processor for figures, tables, and other visual content."""
@@ -62,6 +79,10 @@ class AssetProcessor:
         if not text:
             return None
         
+        # Every asset marker is a LaTeX command
+        if '\\' not in text:
+            return None
+        
         # Check for figures
         figure_content = self._process_figure(text, source_id)
         if figure_content:
@@ -116,6 +137,9 @@ class AssetProcessor:
     
     def _contains_figure(self, text: str) -> bool:
         """Check if text contains figure content."""
+        if not any(marker in text for marker in _FIGURE_MARKERS):
+            return False
+        
         for pattern in self.figure_patterns:
             if re.search(pattern, text, re.IGNORECASE):
                 return True
@@ -123,6 +147,9 @@ class AssetProcessor:
     
     def _contains_table(self, text: str) -> bool:
         """Check if text contains table content."""
+        if not any(marker in text for marker in _TABLE_MARKERS):
+            return False
+        
         for pattern in self.table_patterns:
             if re.search(pattern, text, re.IGNORECASE):
                 return True
@@ -3,17 +3,20 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - ContentClassifier (line 29):
-            - classify_content(text: str, metadata: Dict[str, Any]) -> ContentType (line 88)
-            - _is_equation(text: str) -> bool (line 136)
-            - _is_figure(text: str) -> bool (line 143)
-            - _is_table(text: str) -> bool (line 150)
-            - _is_definition(text: str) -> bool (line 157)
-            - _is_algorithm(text: str) -> bool (line 164)
-            - _is_code(text: str) -> bool (line 171)
-            - _is_example(text: str) -> bool (line 178)
-            - get_confidence_score(text: str, content_type: ContentType) -> float (line 194)
-            - classify_with_confidence(text: str, metadata: Dict[str, Any]) -> tuple[ContentType, float] (line 248)
+        - ContentClassifier (line 44):
+            - classify_content(text: str, metadata: Dict[str, Any]) -> ContentType (line 103)
+            - _is_equation(text: str) -> bool (line 151)
+            - _is_figure(text: str) -> bool (line 158)
+            - _is_table(text: str) -> bool (line 165)
+            - _is_definition(text: str) -> bool (line 172)
+            - _is_algorithm(text: str) -> bool (line 179)
+            - _is_code(text: str) -> bool (line 186)
+            - _is_example(text: str) -> bool (line 193)
+            - get_confidence_score(text: str, content_type: ContentType) -> float (line 209)
+            - classify_with_confidence(text: str, metadata: Dict[str, Any]) -> tuple[ContentType, float] (line 263)
+            - classify_with_span(text: str, metadata: Dict[str, Any]) -> Tuple[ContentType, float, Optional[Tuple[int, int]]] (line 280)
+            - locate_equation(text: str) -> Optional[Tuple[int, int]] (line 307)
+            - extract_equation(text: str) -> Optional[str] (line 325)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Content classification module for Enhanced SciRAG.
@@ -22,9 +25,21 @@ This module provides content type classification capabilities for different
 types of scientific content including equations, figures, tables, and definitions.
 """
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from .enhanced_chunk import ContentType
 
+# LaTeX equation forms, fused into a single alternation with one named group
+# per form so each chunk is scanned once
+_EQ_PATTERNS = (
+    r'\\begin\{equation\}(?P<equation>.*?)\\end\{equation\}',
+    r'\\begin\{align\}(?P<align>.*?)\\end\{align\}',
+    r'\\begin\{eqnarray\}(?P<eqnarray>.*?)\\end\{eqnarray\}',
+    r'\$(?P<dollar>[^$]+)\$',
+    r'\\\[(?P<bracket>[^\]]+)\\\]',
+    r'\\\((?P<paren>[^)]+)\\\)'
+)
+_EQUATION_RE = re.compile('|'.join(_EQ_PATTERNS), re.DOTALL)
+
 
 class ContentClassifier:
     """Content type classifier for scientific documents."""
@@ -260,4 +275,64 @@ class ContentClassifier:
         content_type = self.classify_content(text, metadata)
         confidence = self.get_confidence_score(text, content_type)
 
-        return content_type, confidence
\ No newline at end of file
+        return content_type, confidence
+
+    def classify_with_span(
+            self, text: str, metadata: Dict[str, Any]
+    ) -> Tuple[ContentType, float, Optional[Tuple[int, int]]]:
+        """
+        Classify content type and locate the equation body for equations.
+
+        A located equation always classifies the text as an equation, so
+        the remaining pattern checks are skipped in that case.
+
+        Args:
+            text: Content text to classify
+            metadata: Additional metadata
+
+        Returns:
+            Tuple of (ContentType, confidence_score, equation_span), where
+            equation_span is the (start, end) of the first equation body in
+            text, or None when no equation was located
+        """
+        equation_span = self.locate_equation(text)
+        if equation_span is not None:
+            content_type = ContentType.EQUATION
+        else:
+            content_type = self.classify_content(text, metadata)
+        confidence = self.get_confidence_score(text, content_type)
+
+        return content_type, confidence, equation_span
+
+    def locate_equation(self, text: str) -> Optional[Tuple[int, int]]:
+        """
+        Locate the body of the first LaTeX equation in text.
+
+        Args:
+            text: Content text
+
+        Returns:
+            (start, end) span of the equation body, or None
+        """
+        if '\\' not in text and '$' not in text:
+            return None
+
+        match = _EQUATION_RE.search(text)
+        if not match:
+            return None
+        return match.span(match.lastgroup)
+
+    def extract_equation(self, text: str) -> Optional[str]:
+        """
+        Extract the body of the first LaTeX equation in text.
+
+        Args:
+            text: Content text
+
+        Returns:
+            Stripped equation body, or None
+        """
+        span = self.locate_equation(text)
+        if span is None:
+            return None
+        return text[span[0]:span[1]].strip()
\ No newline at end of file
@@ -8,13 +8,13 @@
         - AssetContent (line 58):
         - GlossaryContent (line 70):
         - EnhancedChunk (line 79):
-            - to_dict() -> Dict[str, Any] (line 101)
-            - get_summary() -> Dict[str, Any] (line 128)
-            - is_mathematical() -> bool (line 158)
-            - is_asset() -> bool (line 163)
-            - is_glossary() -> bool (line 168)
-            - get_retrieval_text() -> str (line 173)
-            - get_metadata_summary() -> Dict[str, Any] (line 215)
+            - to_dict() -> Dict[str, Any] (line 104)
+            - get_summary() -> Dict[str, Any] (line 131)
+            - is_mathematical() -> bool (line 161)
+            - is_asset() -> bool (line 166)
+            - is_glossary() -> bool (line 171)
+            - get_retrieval_text() -> str (line 176)
+            - get_metadata_summary() -> Dict[str, Any] (line 218)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Enhanced chunk data structures for SciRAG with RAGBook integration.
@@ -24,7 +24,7 @@ mathematical content, assets, and glossary terms.
 """
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 
 class ContentType(Enum):
@@ -46,7 +46,7 @@ class MathematicalContent:
     equation_tex: str = ""
     math_norm: str = ""
     math_tokens: List[str] = field(default_factory=list)
-    math_kgrams: List[str] = field(default_factory=list)
+    math_kgrams: List[Tuple[str, ...]] = field(default_factory=list)
     math_canonical: Optional[str] = None
     variables: List[str] = field(default_factory=list)
     equation_type: str = "unknown"
@@ -75,7 +75,7 @@ class GlossaryContent:
     related_terms: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedChunk:
     """Enhanced chunk with support for mathematical content, assets, and glossary."""
 
@@ -92,6 +92,9 @@ class EnhancedChunk:
     asset_content: Optional[AssetContent] = None
     glossary_content: Optional[GlossaryContent] = None
 
+    # (start, end) of the equation body in text, located during classification
+    equation_span: Optional[Tuple[int, int]] = None
+
     # Processing metadata
     processing_version: str = "1.0"
     processing_time: float = 0.0
@@ -3,21 +3,22 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - EnhancedChunker (line 37):
-            - chunk_text(text: str, source_id: str, start_index: int = 0) -> List[EnhancedChunk] (line 71)
-            - _split_into_segments(text: str) -> List[str] (line 115)
-            - _split_into_sentences(text: str) -> List[str] (line 145)
-            - _contains_math(text: str) -> bool (line 151)
-            - _contains_figure(text: str) -> bool (line 167)
-            - _contains_table(text: str) -> bool (line 181)
-            - _create_chunk(text: str, source_id: str, chunk_index: int) -> Optional[EnhancedChunk] (line 195)
-            - _add_mathematical_content(chunk: EnhancedChunk) (line 226)
-            - _add_asset_content(chunk: EnhancedChunk) (line 237)
-            - _add_glossary_content(chunk: EnhancedChunk) (line 246)
-            - _extract_equation(text: str) -> Optional[str] (line 256)
-            - _get_overlap_text(text: str) -> str (line 275)
-            - chunk_document(document_text: str, source_id: str) -> List[EnhancedChunk] (line 290)
-            - get_chunk_statistics(chunks: List[EnhancedChunk]) -> Dict[str, Any] (line 303)
+        - EnhancedChunker (line 38):
+            - chunk_text(text: str, source_id: str, start_index: int = 0) -> List[EnhancedChunk] (line 72)
+            - _split_into_segments(text: str) -> List[str] (line 116)
+            - _split_into_sentences(text: str) -> List[str] (line 146)
+            - _contains_math(text: str) -> bool (line 152)
+            - _contains_figure(text: str) -> bool (line 168)
+            - _contains_table(text: str) -> bool (line 182)
+            - _create_chunk(text: str, source_id: str, chunk_index: int) -> Optional[EnhancedChunk] (line 196)
+            - _add_mathematical_content(chunk: EnhancedChunk) (line 234)
+            - _add_asset_content(chunk: EnhancedChunk) (line 248)
+            - _add_glossary_content(chunk: EnhancedChunk) (line 257)
+            - _extract_equation(text: str) -> Optional[str] (line 267)
+            - _get_overlap_text(text: str) -> str (line 271)
+            - chunk_document(document_text: str, source_id: str) -> List[EnhancedChunk] (line 286)
+            - chunk_documents(document_texts: List[str], source_ids: List[str]) -> List[List[EnhancedChunk]] (line 299)
+            - get_chunk_statistics(chunks: List[EnhancedChunk]) -> Dict[str, Any] (line 315)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Enhanced chunking module for Enhanced SciRAG.
@@ -197,20 +198,27 @@ class EnhancedChunker:
         if not text.strip():
             return None
         
-        # Classify content type
-        content_type, confidence = self.classifier.classify_with_confidence(text, {})
+        # Classify content type, locating the equation body for equations
+        content_type, confidence, equation_span = self.classifier.classify_with_span(text, {})
         
         # Create chunk ID
         chunk_id = f"{source_id}_chunk_{chunk_index}"
         
+        # Shift the equation span onto the stripped chunk text
+        stripped_text = text.strip()
+        if equation_span:
+            offset = len(text) - len(text.lstrip())
+            equation_span = (equation_span[0] - offset, equation_span[1] - offset)
+        
         # Create base chunk
         chunk = EnhancedChunk(
             id=chunk_id,
-            text=text.strip(),
+            text=stripped_text,
             source_id=source_id,
             chunk_index=chunk_index,
             content_type=content_type,
-            confidence=confidence
+            confidence=confidence,
+            equation_span=equation_span
         )
         
         # Add enhanced content based on type
@@ -226,8 +234,11 @@ class EnhancedChunker:
     def _add_mathematical_content(self, chunk: EnhancedChunk):
         """Add mathematical content to chunk."""
         try:
-            # Extract equation from text
-            equation = self._extract_equation(chunk.text)
+            # Reuse the equation located during classification when available
+            if chunk.equation_span:
+                equation = chunk.text[slice(*chunk.equation_span)].strip()
+            else:
+                equation = self._extract_equation(chunk.text)
             if equation:
                 math_content = self.math_processor.create_mathematical_content(equation)
                 chunk.mathematical_content = math_content
@@ -255,22 +266,7 @@ class EnhancedChunker:
     
     def _extract_equation(self, text: str) -> Optional[str]:
         """Extract equation from text."""
-        # Look for LaTeX equation environments
-        equation_patterns = [
-            r'\\begin\{equation\}(.*?)\\end\{equation\}',
-            r'\\begin\{align\}(.*?)\\end\{align\}',
-            r'\\begin\{eqnarray\}(.*?)\\end\{eqnarray\}',
-            r'\$([^$]+)\$',
-            r'\\\[([^\]]+)\\\]',
-            r'\\\(([^)]+)\\\)'
-        ]
-        
-        for pattern in equation_patterns:
-            match = re.search(pattern, text, re.DOTALL)
-            if match:
-                return match.group(1).strip()
-        
-        return None
+        return self.classifier.extract_equation(text)
     
     def _get_overlap_text(self, text: str) -> str:
         """Get overlap text from previous chunk."""
@@ -300,6 +296,22 @@ class EnhancedChunker:
         """
         return self.chunk_text(document_text, source_id, 0)
     
+    def chunk_documents(self, document_texts: List[str], source_ids: List[str]) -> List[List[EnhancedChunk]]:
+        """
+        Chunk a batch of documents with this chunker's shared state.
+        
+        Args:
+            document_texts: Full text of each document
+            source_ids: Source document ID for each document
+            
+        Returns:
+            List of enhanced chunks for each document, in input order
+        """
+        return [
+            self.chunk_text(document_text, source_id, 0)
+            for document_text, source_id in zip(document_texts, source_ids)
+        ]
+    
     def get_chunk_statistics(self, chunks: List[EnhancedChunk]) -> Dict[str, Any]:
         """
         Get statistics about chunks.
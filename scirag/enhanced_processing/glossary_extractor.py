@@ -3,17 +3,26 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - GlossaryExtractor (line 29):
-            - extract_glossary_terms(text: str, source_id: str) -> List[GlossaryContent] (line 61)
-            - _split_into_sentences(text: str) -> List[str] (line 98)
-            - _is_definition_sentence(sentence: str) -> bool (line 104)
-            - _extract_term(sentence: str) -> Optional[str] (line 114)
-            - _extract_definition(sentence: str) -> Optional[str] (line 134)
-            - _extract_context(sentence: str) -> Optional[str] (line 149)
-            - _extract_related_terms(sentence: str) -> List[str] (line 169)
-            - extract_glossary_from_document(document_text: str, source_id: str) -> List[GlossaryContent] (line 186)
-            - get_glossary_statistics(glossary_terms: List[GlossaryContent]) -> Dict[str, Any] (line 211)
-            - search_glossary_terms(glossary_terms: List[GlossaryContent], query: str) -> List[GlossaryContent] (line 247)
+        - GlossaryExtractor (line 111):
+            - extract_glossary_terms(text: str, source_id: str) -> List[GlossaryContent] (line 120)
+            - _analyze_sentence(sentence: str) -> Optional[GlossaryContent] (line 144)
+            - _split_into_sentences(text: str) -> List[str] (line 166)
+            - _iter_sentences(text: str) -> Iterator[str] (line 170)
+            - _is_definition_sentence(sentence: str) -> bool (line 177)
+            - _extract_term(sentence: str, match: Optional[re.Match] = None) -> Optional[str] (line 184)
+            - _extract_definition(sentence: str, match: Optional[re.Match] = None) -> Optional[str] (line 205)
+            - _extract_context(sentence: str) -> Optional[str] (line 223)
+            - _extract_related_terms(sentence: str) -> List[str] (line 237)
+            - extract_glossary_from_document(document_text: str, source_id: str) -> List[GlossaryContent] (line 258)
+            - get_glossary_statistics(glossary_terms: List[GlossaryContent]) -> Dict[str, Any] (line 284)
+            - build_search_index(glossary_terms: List[GlossaryContent]) -> 'GlossarySearchIndex' (line 326)
+            - search_glossary_terms(glossary_terms: List[GlossaryContent], query: str, index: Optional['GlossarySearchIndex'] = None) -> List[GlossaryContent] (line 341)
+        - _search_fields(term: GlossaryContent) -> Tuple[str, ...] (line 369)
+        - GlossarySearchIndex (line 380):
+            - _words_with_prefix(prefix: str) -> Iterator[str] (line 405)
+            - _suffix_matches(part: str, whole: bool) -> Iterator[str] (line 413)
+            - _postings_of(words: Iterable[str]) -> Set[int] (line 422)
+            - search(query: str) -> List[GlossaryContent] (line 429)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Glossary extraction module for Enhanced SciRAG.
@@ -21,42 +30,92 @@ Glossary extraction module for Enhanced SciRAG.
 This module provides capabilities for extracting and processing glossary terms,
 definitions, and related concepts from scientific documents.
 """
+import bisect
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
 from .enhanced_chunk import GlossaryContent
 
+# Raw pattern sources, kept for introspection via the instance attributes
+_DEFINITION_INDICATORS = (
+    r'\\textbf\{[^}]*definition[^}]*\}',
+    r'\\textit\{[^}]*definition[^}]*\}',
+    r'definition:',
+    r'def\.',
+    r'\\def\s+',
+    r'is defined as',
+    r'is the',
+    r'means',
+    r'refers to'
+)
+
+_TERM_MARKUP = (
+    r'\\textbf\{([^}]+)\}',
+    r'\\textit\{([^}]+)\}',
+    r'\\emph\{([^}]+)\}',
+    r'\\term\{([^}]+)\}'
+)
+
+_RELATED_INDICATORS = (
+    r'see also',
+    r'related to',
+    r'similar to',
+    r'cf\.',
+    r'compare with'
+)
+
+_CONTEXT_INDICATORS = (
+    r'in the context of',
+    r'in the field of',
+    r'in mathematics',
+    r'in physics',
+    r'in chemistry',
+    r'in biology',
+    r'in computer science'
+)
+
+# Compiled once at import time; the extraction helpers run per sentence.
+# All definition indicators are fused into one alternation so a single scan
+# both detects a definition sentence and locates the indicator, and the
+# resulting match is shared by the term/definition extraction steps.
+_DEF_ALT = re.compile(
+    '|'.join(f'(?:{p})' for p in _DEFINITION_INDICATORS), re.IGNORECASE
+)
+_DEFINITION_TAIL = re.compile(r'\s*([^.!?]+)')
+_TERM_PATTERNS = [re.compile(p, re.IGNORECASE) for p in _TERM_MARKUP]
+_REL_PATTERNS = [
+    re.compile(p + r'\s*([^.!?]+)', re.IGNORECASE) for p in _RELATED_INDICATORS
+]
+_CTX_PATTERNS = [
+    re.compile(p + r'\s*([^.!?]+)', re.IGNORECASE) for p in _CONTEXT_INDICATORS
+]
+
+# Lowercase substrings, at least one of which every indicator above needs in
+# order to match. A plain substring test rejects most sentences before any
+# regex runs.
+_DEF_KEYWORDS = ('def', 'is the', 'means', 'refers to')
+_RELATED_KEYWORDS = ('see also', 'related to', 'similar to', 'cf.', 'compare with')
+_CONTEXT_KEYWORDS = ('in the context of', 'in the field of', 'in mathematics',
+                     'in physics', 'in chemistry', 'in biology', 'in computer science')
+
+# Sentences are the runs of text between sentence punctuation
+_SENTENCE_RUN = re.compile(r'[^.!?]+')
+# Sentence spans over a whole document: runs of text between sentence
+# punctuation that never cross a paragraph break
+_SENTENCE_ITER = re.compile(r'(?:[^.!?\n]+|\n(?!\n))+')
+_CLEAN_TERM = re.compile(r'[^\w\s-]')
+_CLEAN_LATEX = re.compile(r'\\[a-zA-Z]+\{[^}]*\}')
+_CLEAN_BRACES = re.compile(r'[{}]')
+_TERM_SEPARATORS = re.compile(r'[,;]')
+
 
 class GlossaryExtractor:
     """Glossary term and definition extractor."""
     
     def __init__(self):
         """Initialize glossary extractor."""
-        self.definition_patterns = [
-            r'\\textbf\{[^}]*definition[^}]*\}',
-            r'\\textit\{[^}]*definition[^}]*\}',
-            r'definition:',
-            r'def\.',
-            r'\\def\s+',
-            r'is defined as',
-            r'is the',
-            r'means',
-            r'refers to'
-        ]
-        
-        self.term_patterns = [
-            r'\\textbf\{([^}]+)\}',
-            r'\\textit\{([^}]+)\}',
-            r'\\emph\{([^}]+)\}',
-            r'\\term\{([^}]+)\}'
-        ]
-        
-        self.related_terms_patterns = [
-            r'see also',
-            r'related to',
-            r'similar to',
-            r'cf\.',
-            r'compare with'
-        ]
+        self.definition_patterns = list(_DEFINITION_INDICATORS)
+        self.term_patterns = list(_TERM_MARKUP)
+        self.related_terms_patterns = list(_RELATED_INDICATORS)
     
     def extract_glossary_terms(self, text: str, source_id: str) -> List[GlossaryContent]:
         """
@@ -74,73 +133,88 @@ class GlossaryExtractor:
         
         glossary_terms = []
         
-        # Split text into sentences
-        sentences = self._split_into_sentences(text)
-        
-        for sentence in sentences:
-            if self._is_definition_sentence(sentence):
-                term = self._extract_term(sentence)
-                definition = self._extract_definition(sentence)
-                context = self._extract_context(sentence)
-                related_terms = self._extract_related_terms(sentence)
-                
-                if term and definition:
-                    glossary_content = GlossaryContent(
-                        term=term,
-                        definition=definition,
-                        context=context,
-                        related_terms=related_terms
-                    )
-                    glossary_terms.append(glossary_content)
+        # Stream sentences straight into analysis
+        for sentence in self._iter_sentences(text):
+            glossary_content = self._analyze_sentence(sentence)
+            if glossary_content:
+                glossary_terms.append(glossary_content)
         
         return glossary_terms
     
+    def _analyze_sentence(self, sentence: str) -> Optional[GlossaryContent]:
+        """Build a glossary entry from a definition sentence."""
+        sentence_lower = sentence.lower()
+        if not any(keyword in sentence_lower for keyword in _DEF_KEYWORDS):
+            return None
+        
+        match = _DEF_ALT.search(sentence)
+        if not match:
+            return None
+        
+        term = self._extract_term(sentence, match)
+        definition = self._extract_definition(sentence, match)
+        if not (term and definition):
+            return None
+        
+        return GlossaryContent(
+            term=term,
+            definition=definition,
+            context=self._extract_context(sentence),
+            related_terms=self._extract_related_terms(sentence)
+        )
+    
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences."""
-        # Simple sentence splitting
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return list(self._iter_sentences(text))
+    
+    def _iter_sentences(self, text: str) -> Iterator[str]:
+        """Iterate over the stripped, non-empty sentences of text."""
+        for sentence_match in _SENTENCE_RUN.finditer(text):
+            sentence = sentence_match.group().strip()
+            if sentence:
+                yield sentence
     
     def _is_definition_sentence(self, sentence: str) -> bool:
         """Check if sentence contains a definition."""
         sentence_lower = sentence.lower()
-        
-        for pattern in self.definition_patterns:
-            if re.search(pattern, sentence_lower):
-                return True
-        
-        return False
+        if not any(keyword in sentence_lower for keyword in _DEF_KEYWORDS):
+            return False
+        return _DEF_ALT.search(sentence) is not None
     
-    def _extract_term(self, sentence: str) -> Optional[str]:
+    def _extract_term(self, sentence: str,
+                      match: Optional[re.Match] = None) -> Optional[str]:
         """Extract term from definition sentence."""
         # Look for bold/italic terms
-        for pattern in self.term_patterns:
-            match = re.search(pattern, sentence, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        for pattern in _TERM_PATTERNS:
+            term_match = pattern.search(sentence)
+            if term_match:
+                return term_match.group(1).strip()
         
-        # Look for terms before definition indicators
-        for pattern in self.definition_patterns:
-            match = re.search(r'([^.!?]+?)\s+' + pattern, sentence, re.IGNORECASE)
-            if match:
-                term = match.group(1).strip()
-                # Clean up the term
-                term = re.sub(r'[^\w\s-]', '', term)
-                if term:
-                    return term
+        # Look for the term before the definition indicator
+        if match is None:
+            match = _DEF_ALT.search(sentence)
+        if match:
+            term = sentence[:match.start()].strip()
+            # Clean up the term
+            term = _CLEAN_TERM.sub('', term)
+            if term:
+                return term
         
         return None
     
-    def _extract_definition(self, sentence: str) -> Optional[str]:
+    def _extract_definition(self, sentence: str,
+                            match: Optional[re.Match] = None) -> Optional[str]:
         """Extract definition from sentence."""
-        # Look for definition after indicators
-        for pattern in self.definition_patterns:
-            match = re.search(pattern + r'\s*([^.!?]+)', sentence, re.IGNORECASE)
-            if match:
-                definition = match.group(1).strip()
+        # Look for definition after the indicator
+        if match is None:
+            match = _DEF_ALT.search(sentence)
+        if match:
+            tail = _DEFINITION_TAIL.match(sentence, match.end())
+            if tail:
+                definition = tail.group(1).strip()
                 # Clean up the definition
-                definition = re.sub(r'\\[a-zA-Z]+\{[^}]*\}', '', definition)
-                definition = re.sub(r'[{}]', '', definition)
+                definition = _CLEAN_LATEX.sub('', definition)
+                definition = _CLEAN_BRACES.sub('', definition)
                 if definition:
                     return definition
         
@@ -148,19 +222,13 @@ class GlossaryExtractor:
     
     def _extract_context(self, sentence: str) -> Optional[str]:
         """Extract context from sentence."""
-        # Look for context indicators
-        context_indicators = [
-            r'in the context of',
-            r'in the field of',
-            r'in mathematics',
-            r'in physics',
-            r'in chemistry',
-            r'in biology',
-            r'in computer science'
-        ]
+        sentence_lower = sentence.lower()
+        if not any(keyword in sentence_lower for keyword in _CONTEXT_KEYWORDS):
+            return None
         
-        for indicator in context_indicators:
-            match = re.search(indicator + r'\s*([^.!?]+)', sentence, re.IGNORECASE)
+        # Look for context indicators
+        for pattern in _CTX_PATTERNS:
+            match = pattern.search(sentence)
             if match:
                 return match.group(1).strip()
         
@@ -170,12 +238,16 @@ class GlossaryExtractor:
         """Extract related terms from sentence."""
         related_terms = []
         
-        for pattern in self.related_terms_patterns:
-            match = re.search(pattern + r'\s*([^.!?]+)', sentence, re.IGNORECASE)
+        sentence_lower = sentence.lower()
+        if not any(keyword in sentence_lower for keyword in _RELATED_KEYWORDS):
+            return related_terms
+        
+        for pattern in _REL_PATTERNS:
+            match = pattern.search(sentence)
             if match:
                 terms_text = match.group(1).strip()
                 # Split by common separators
-                terms = re.split(r'[,;]', terms_text)
+                terms = _TERM_SEPARATORS.split(terms_text)
                 for term in terms:
                     term = term.strip()
                     if term:
@@ -197,14 +269,15 @@ class GlossaryExtractor:
         if not document_text:
             return []
         
-        # Split document into paragraphs
-        paragraphs = document_text.split('\n\n')
-        
+        # Walk sentence spans over the whole document instead of splitting
+        # it into paragraphs first
         all_glossary_terms = []
-        for paragraph in paragraphs:
-            if paragraph.strip():
-                terms = self.extract_glossary_terms(paragraph, source_id)
-                all_glossary_terms.extend(terms)
+        for sentence_match in _SENTENCE_ITER.finditer(document_text):
+            sentence = sentence_match.group().strip()
+            if sentence:
+                glossary_content = self._analyze_sentence(sentence)
+                if glossary_content:
+                    all_glossary_terms.append(glossary_content)
         
         return all_glossary_terms
     
@@ -221,18 +294,24 @@ class GlossaryExtractor:
         if not glossary_terms:
             return {}
         
-        # Count terms with context
-        terms_with_context = sum(1 for term in glossary_terms if term.context)
-        
-        # Count terms with related terms
-        terms_with_related = sum(1 for term in glossary_terms if term.related_terms)
-        
-        # Calculate average definition length
-        definition_lengths = [len(term.definition) for term in glossary_terms if term.definition]
-        avg_definition_length = sum(definition_lengths) / len(definition_lengths) if definition_lengths else 0
+        # Gather all counts in a single pass over the terms
+        terms_with_context = 0
+        terms_with_related = 0
+        total_related_terms = 0
+        defined_terms = 0
+        total_definition_length = 0
+        for term in glossary_terms:
+            if term.context:
+                terms_with_context += 1
+            if term.related_terms:
+                terms_with_related += 1
+                total_related_terms += len(term.related_terms)
+            if term.definition:
+                defined_terms += 1
+                total_definition_length += len(term.definition)
         
-        # Count related terms
-        total_related_terms = sum(len(term.related_terms) for term in glossary_terms)
+        # Average definition length over terms that have a definition
+        avg_definition_length = total_definition_length / defined_terms if defined_terms else 0
         
         return {
             'total_terms': len(glossary_terms),
@@ -244,13 +323,34 @@ class GlossaryExtractor:
             'total_related_terms': total_related_terms
         }
     
-    def search_glossary_terms(self, glossary_terms: List[GlossaryContent], query: str) -> List[GlossaryContent]:
+    def build_search_index(self, glossary_terms: List[GlossaryContent]) -> 'GlossarySearchIndex':
+        """
+        Build an inverted index for searching glossary terms.
+        
+        The index covers the glossary as it is now; build a new one after
+        modifying the glossary list or its terms.
+        
+        Args:
+            glossary_terms: List of GlossaryContent objects
+            
+        Returns:
+            GlossarySearchIndex to pass to search_glossary_terms
+        """
+        return GlossarySearchIndex(glossary_terms)
+    
+    def search_glossary_terms(self, glossary_terms: List[GlossaryContent], query: str,
+                              index: Optional['GlossarySearchIndex'] = None) -> List[GlossaryContent]:
         """
         Search glossary terms by query.
         
+        Matches are case-insensitive substrings of a term's name, definition,
+        context or related terms.
+        
         Args:
             glossary_terms: List of GlossaryContent objects
             query: Search query
+            index: Optional index from build_search_index(glossary_terms),
+                for repeated searches of an unchanged glossary
             
         Returns:
             List of matching GlossaryContent objects
@@ -258,29 +358,110 @@ class GlossaryExtractor:
         if not query or not glossary_terms:
             return []
         
+        if index is not None:
+            return index.search(query)
+        
         query_lower = query.lower()
-        matching_terms = []
+        return [term for term in glossary_terms
+                if any(query_lower in field for field in _search_fields(term))]
+
+
+def _search_fields(term: GlossaryContent) -> Tuple[str, ...]:
+    """Lowercased name, definition, context and related terms of a glossary term."""
+    fields = [term.term.lower()]
+    if term.definition:
+        fields.append(term.definition.lower())
+    if term.context:
+        fields.append(term.context.lower())
+    fields.extend(related_term.lower() for related_term in term.related_terms)
+    return tuple(fields)
+
+
+class GlossarySearchIndex:
+    """
+    Inverted word index over a snapshot of a glossary list.
+    
+    Each lowercased whitespace-separated word of a term's search fields maps
+    to the positions of the terms containing it. Every suffix of every word
+    is kept sorted as well, so the words ending with, or containing, a query
+    word are found by bisection instead of a scan of the vocabulary.
+    """
+    
+    def __init__(self, glossary_terms: List[GlossaryContent]):
+        self.terms = tuple(glossary_terms)
+        self._fields = [_search_fields(term) for term in self.terms]
         
-        for term in glossary_terms:
-            # Search in term name
-            if query_lower in term.term.lower():
-                matching_terms.append(term)
-                continue
-            
-            # Search in definition
-            if term.definition and query_lower in term.definition.lower():
-                matching_terms.append(term)
-                continue
-            
-            # Search in context
-            if term.context and query_lower in term.context.lower():
-                matching_terms.append(term)
-                continue
+        postings: Dict[str, Set[int]] = {}
+        for i, fields in enumerate(self._fields):
+            for field in fields:
+                for word in field.split():
+                    postings.setdefault(word, set()).add(i)
+        self._postings = postings
+        self._words = sorted(postings)
+        # (suffix, word) pairs, sorted by suffix
+        self._suffixes = sorted(
+            (word[start:], word) for word in self._words for start in range(len(word)))
+    
+    def _words_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield the indexed words starting with prefix."""
+        words = self._words
+        for i in range(bisect.bisect_left(words, prefix), len(words)):
+            if not words[i].startswith(prefix):
+                break
+            yield words[i]
+    
+    def _suffix_matches(self, part: str, whole: bool) -> Iterator[str]:
+        """Yield the indexed words ending with part, or containing it if not whole."""
+        suffixes = self._suffixes
+        for i in range(bisect.bisect_left(suffixes, (part,)), len(suffixes)):
+            suffix, word = suffixes[i]
+            if suffix != part if whole else not suffix.startswith(part):
+                break
+            yield word
+    
+    def _postings_of(self, words: Iterable[str]) -> Set[int]:
+        """Get the positions of terms containing any of words."""
+        positions: Set[int] = set()
+        for word in words:
+            positions.update(self._postings.get(word, ()))
+        return positions
+    
+    def search(self, query: str) -> List[GlossaryContent]:
+        """
+        Get the indexed terms containing query, as search_glossary_terms does.
+        
+        Args:
+            query: Search query
             
-            # Search in related terms
-            for related_term in term.related_terms:
-                if query_lower in related_term.lower():
-                    matching_terms.append(term)
-                    break
+        Returns:
+            List of matching GlossaryContent objects, in glossary order
+        """
+        query_lower = query.lower()
+        query_words = query_lower.split()
         
-        return matching_terms
\ No newline at end of file
+        # Interior words of a substring match are whole indexed words, the
+        # first ends one and the last starts one; a lone word may sit
+        # anywhere inside one. Each entry lists the words a query word may be.
+        if len(query_words) > 1:
+            word_sets = [{word} for word in query_words[1:-1]]
+            word_sets.append(set(self._suffix_matches(query_words[0], whole=True)))
+            word_sets.append(set(self._words_with_prefix(query_words[-1])))
+        else:
+            word_sets = [set(self._suffix_matches(word, whole=False))
+                         for word in query_words]
+        
+        candidates: Optional[Set[int]] = None
+        for words in word_sets:
+            postings = self._postings_of(words)
+            candidates = postings if candidates is None else candidates & postings
+            if not candidates:
+                return []
+        
+        if candidates is None:
+            # Whitespace-only query; no words to look up
+            candidates = range(len(self.terms))
+        
+        return [
+            self.terms[i] for i in sorted(candidates)
+            if any(query_lower in field for field in self._fields[i])
+        ]
@@ -3,18 +3,26 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - MathematicalProcessor (line 30):
-            - _check_sympy_availability() -> bool (line 43)
-            - process_equation(equation_tex: str) -> Dict[str, Any] (line 51)
-            - _normalize_latex(equation_tex: str) -> str (line 96)
-            - _tokenize_equation(equation: str) -> List[str] (line 138)
-            - _generate_kgrams(tokens: List[str], k: int = 3) -> List[str] (line 147)
-            - _calculate_complexity(equation_tex: str) -> float (line 159)
-            - _classify_equation_type(equation_tex: str) -> str (line 186)
-            - _canonicalize_equation(equation_tex: str) -> Optional[str] (line 211)
-            - _create_empty_result() -> Dict[str, Any] (line 231)
-            - _create_fallback_result(equation_tex: str, error: str) -> Dict[str, Any] (line 242)
-            - create_mathematical_content(equation_tex: str) -> MathematicalContent (line 254)
+        - _SympyTimeout (line 93):
+        - MathematicalProcessor (line 113):
+            - _check_sympy_availability() -> bool (line 126)
+            - process_equation(equation_tex: str) -> Dict[str, Any] (line 134)
+            - _cache_config() -> Tuple[Any, ...] (line 179)
+            - _compute_equation(equation_tex: str, canonicalize: bool = True) -> Dict[str, Any] (line 189)
+            - _normalize_latex(equation_tex: str) -> str (line 231)
+            - _tokenize_equation(equation: str) -> List[str] (line 249)
+            - _generate_kgrams(tokens: List[str], k: int = 3) -> List[Tuple[str, ...]] (line 258)
+            - _iter_kgrams(tokens: List[str], k: int = 3) -> Iterator[Tuple[str, ...]] (line 262)
+            - _calculate_complexity(equation_tex: str, tokens: Optional[List[str]] = None) -> float (line 270)
+            - _classify_equation_type(equation_tex: str) -> str (line 307)
+            - _canonicalize_equation(equation_tex: str) -> Optional[str] (line 321)
+            - _canonicalize_cached(equation_tex: str) -> Optional[str] (line 347)
+            - _create_empty_result() -> Dict[str, Any] (line 365)
+            - _create_fallback_result(equation_tex: str, error: str) -> Dict[str, Any] (line 376)
+            - create_mathematical_content(equation_tex: str) -> MathematicalContent (line 388)
+        - _sympy_time_limit(seconds: float) -> Iterator[None] (line 413)
+        - _sympify_and_simplify(equation_tex: str) -> str (line 435)
+        - clear_equation_cache() (line 446)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Mathematical processing module for Enhanced SciRAG.
@@ -22,10 +30,85 @@ Mathematical processing module for Enhanced SciRAG.
 This module provides mathematical content processing capabilities using RAGBook's
 mathematical processing functions.
 """
+import contextlib
+import functools
+import logging
 import re
-from typing import Dict, List, Any, Optional
+import signal
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from .enhanced_chunk import MathematicalContent
 
+# Patterns are compiled once at import time; they run for every equation
+_LATEX_ENV_STRIP = re.compile(r'\\(?:begin|end)\{(?:equation|align|eqnarray)\}')
+
+_LATEX_REPLACEMENTS = [
+    (re.compile(pattern), replacement) for pattern, replacement in {
+        r'\\frac\{([^}]+)\}\{([^}]+)\}': r'(\1)/(\2)',
+        r'\\sqrt\{([^}]+)\}': r'sqrt(\1)',
+        r'\\sum_\{([^}]+)\}\^\{([^}]+)\}': r'sum(\1 to \2)',
+        r'\\int_\{([^}]+)\}\^\{([^}]+)\}': r'int(\1 to \2)'
+    }.items()
+]
+
+# Greek letter commands lose their backslash; one scan strips all of them
+_GREEK_LETTERS = (
+    'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'theta', 'lambda',
+    'mu', 'pi', 'sigma', 'tau', 'phi', 'omega'
+)
+_GREEK_RE = re.compile(r'\\(?=' + '|'.join(_GREEK_LETTERS) + ')')
+
+_TOKEN_RE = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*|\d+\.?\d*|[+\-*/=<>(){}[\]^_|\\]')
+_LATEX_CMD_RE = re.compile(r'\\[a-zA-Z]+')
+_VAR_RE = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*')
+_NUM_RE = re.compile(r'\d+\.?\d*')
+
+# Equation type indicators, one named group per category
+_TYPE_RE = re.compile(
+    r'(?P<fraction>\\frac|/)'
+    r'|(?P<summation>\\sum)'
+    r'|(?P<integral>\\int)'
+    r'|(?P<radical>\\sqrt)'
+    r'|(?P<set_membership>\\in\b)'
+    r'|(?P<set_relation>\\subset)'
+    r'|(?P<equation>=)'
+)
+_TYPE_PRIORITY = (
+    'fraction', 'summation', 'integral', 'radical',
+    'equation', 'set_membership', 'set_relation'
+)
+
+# SymPy cannot parse these LaTeX constructs, so skip it for them outright
+_SYMPY_UNPARSEABLE = ('\\begin', '\\frac', '\\int', '\\sum', '\\sqrt')
+
+# Wall-clock bound for sympify + simplify on a single equation (seconds).
+# SymPy runs synchronously and is interrupted with SIGALRM, which is only
+# possible on the main thread of a platform with setitimer; elsewhere the
+# call runs unbounded.
+_SYMPY_TIMEOUT = 0.5
+_sympy_timeout_logged = False
+
+
+class _SympyTimeout(Exception):
+    """Raised inside SymPy when canonicalization exceeds _SYMPY_TIMEOUT."""
+
+logger = logging.getLogger(__name__)
+
+# Memoized process_equation results. Scientific corpora repeat the same
+# equations across sections and papers, so identical LaTeX skips
+# normalization, tokenization and SymPy canonicalization entirely. Keys are
+# (processor class, processor configuration, equation); values are tuples
+# of (key, value, was_list) triples with list values frozen to tuples, so
+# cached entries are immutable. Least recently used entries come first.
+_EQUATION_CACHE_SIZE = 4096
+_equation_cache: "OrderedDict[tuple, Tuple[Tuple[str, Any, bool], ...]]" = OrderedDict()
+_equation_cache_lock = threading.Lock()
+
+# Single-character classes counted with bytes.translate rather than regex
+_OPERATOR_BYTES = b'+-*/=<>^'
+_BRACKET_BYTES = b'(){}[]|'
+
 
 class MathematicalProcessor:
     """Mathematical content processor using RAGBook's math processing."""
@@ -57,15 +140,65 @@ class MathematicalProcessor:
             
         Returns:
             Dictionary containing processed mathematical content
+        
+        Results are memoized per processor class, ``_cache_config()`` and
+        unique equation; each call returns a fresh dictionary with fresh
+        lists, so callers may mutate it without touching the cache. Results
+        whose SymPy canonicalization timed out are not cached, so the
+        equation is canonicalized again on its next occurrence.
         """
         if not equation_tex:
             return self._create_empty_result()
         
+        key = (type(self), self._cache_config(), equation_tex)
+        with _equation_cache_lock:
+            cached = _equation_cache.get(key)
+            if cached is not None:
+                _equation_cache.move_to_end(key)
+        
+        if cached is None:
+            try:
+                result = self._compute_equation(equation_tex)
+            except _SympyTimeout:
+                return self._compute_equation(equation_tex, canonicalize=False)
+            
+            cached = tuple(
+                (name, tuple(value), True) if isinstance(value, list) else (name, value, False)
+                for name, value in result.items()
+            )
+            with _equation_cache_lock:
+                _equation_cache[key] = cached
+                while len(_equation_cache) > _EQUATION_CACHE_SIZE:
+                    _equation_cache.popitem(last=False)
+        
+        return {
+            name: list(value) if was_list else value
+            for name, value, was_list in cached
+        }
+    
+    def _cache_config(self) -> Tuple[Any, ...]:
+        """
+        Instance configuration that affects ``process_equation`` results.
+        
+        Part of the result cache key. Subclasses whose results depend on
+        further instance state must extend it, or their instances would
+        share cached results.
+        """
+        return (self.enable_sympy and self._sympy_available,)
+    
+    def _compute_equation(self, equation_tex: str,
+                          canonicalize: bool = True) -> Dict[str, Any]:
+        """
+        Run the full processing pipeline for a single equation.
+        
+        Raises ``_SympyTimeout`` when SymPy canonicalization times out.
+        """
         try:
             # Basic LaTeX normalization
             math_norm = self._normalize_latex(equation_tex)
             
-            # Tokenize the normalized equation
+            # Tokenize the normalized equation once; the token list is
+            # shared by k-gram generation and complexity scoring
             math_tokens = self._tokenize_equation(math_norm)
             
             # Generate k-grams
@@ -77,18 +210,20 @@ class MathematicalProcessor:
                 'math_norm': math_norm,
                 'math_tokens': math_tokens,
                 'math_kgrams': math_kgrams,
-                'complexity_score': self._calculate_complexity(equation_tex),
+                'complexity_score': self._calculate_complexity(equation_tex, math_tokens),
                 'equation_type': self._classify_equation_type(equation_tex)
             }
             
             # Add SymPy processing if available
-            if self.enable_sympy and self._sympy_available:
+            if canonicalize and self.enable_sympy and self._sympy_available:
                 canonical = self._canonicalize_equation(equation_tex)
                 if canonical:
                     result['math_canonical'] = canonical
             
             return result
             
+        except _SympyTimeout:
+            raise
         except Exception as e:
             # Return fallback result
             return self._create_fallback_result(equation_tex, str(e))
@@ -102,36 +237,12 @@ class MathematicalProcessor:
         normalized = equation_tex.strip()
         
         # Remove common LaTeX commands
-        normalized = re.sub(r'\\begin\{equation\}', '', normalized)
-        normalized = re.sub(r'\\end\{equation\}', '', normalized)
-        normalized = re.sub(r'\\begin\{align\}', '', normalized)
-        normalized = re.sub(r'\\end\{align\}', '', normalized)
-        normalized = re.sub(r'\\begin\{eqnarray\}', '', normalized)
-        normalized = re.sub(r'\\end\{eqnarray\}', '', normalized)
+        normalized = _LATEX_ENV_STRIP.sub('', normalized)
         
         # Replace common LaTeX symbols
-        replacements = {
-            r'\\frac\{([^}]+)\}\{([^}]+)\}': r'(\1)/(\2)',
-            r'\\sqrt\{([^}]+)\}': r'sqrt(\1)',
-            r'\\sum_\{([^}]+)\}\^\{([^}]+)\}': r'sum(\1 to \2)',
-            r'\\int_\{([^}]+)\}\^\{([^}]+)\}': r'int(\1 to \2)',
-            r'\\alpha': 'alpha',
-            r'\\beta': 'beta',
-            r'\\gamma': 'gamma',
-            r'\\delta': 'delta',
-            r'\\epsilon': 'epsilon',
-            r'\\theta': 'theta',
-            r'\\lambda': 'lambda',
-            r'\\mu': 'mu',
-            r'\\pi': 'pi',
-            r'\\sigma': 'sigma',
-            r'\\tau': 'tau',
-            r'\\phi': 'phi',
-            r'\\omega': 'omega'
-        }
-        
-        for pattern, replacement in replacements.items():
-            normalized = re.sub(pattern, replacement, normalized)
+        for pattern, replacement in _LATEX_REPLACEMENTS:
+            normalized = pattern.sub(replacement, normalized)
+        normalized = _GREEK_RE.sub('', normalized)
         
         return normalized.strip()
     
@@ -141,22 +252,23 @@ class MathematicalProcessor:
             return []
         
         # Split on common mathematical operators and symbols
-        tokens = re.findall(r'[a-zA-Z_][a-zA-Z0-9_]*|\d+\.?\d*|[+\-*/=<>(){}[\]^_|\\]', equation)
+        tokens = _TOKEN_RE.findall(equation)
         return tokens
     
-    def _generate_kgrams(self, tokens: List[str], k: int = 3) -> List[str]:
-        """Generate k-grams from tokens."""
+    def _generate_kgrams(self, tokens: List[str], k: int = 3) -> List[Tuple[str, ...]]:
+        """Generate k-grams from tokens as hashable token tuples."""
+        return list(self._iter_kgrams(tokens, k))
+    
+    def _iter_kgrams(self, tokens: List[str], k: int = 3) -> Iterator[Tuple[str, ...]]:
+        """Iterate over k-grams of tokens without building a list."""
         if not tokens or k <= 0:
-            return []
+            return iter(())
         
-        kgrams = []
-        for i in range(len(tokens) - k + 1):
-            kgram = ' '.join(tokens[i:i+k])
-            kgrams.append(kgram)
-        
-        return kgrams
+        # Zip k staggered views of the token list into sliding windows
+        return zip(*(tokens[i:] for i in range(k)))
     
-    def _calculate_complexity(self, equation_tex: str) -> float:
+    def _calculate_complexity(self, equation_tex: str,
+                              tokens: Optional[List[str]] = None) -> float:
         """Calculate equation complexity score."""
         if not equation_tex:
             return 0.0
@@ -165,21 +277,30 @@ class MathematicalProcessor:
         complexity = 0.0
         
         # Count LaTeX commands
-        latex_commands = len(re.findall(r'\\[a-zA-Z]+', equation_tex))
+        latex_commands = len(_LATEX_CMD_RE.findall(equation_tex))
         complexity += latex_commands * 0.5
         
+        # Single-byte classes: count by deleting them in one C-level pass
+        data = equation_tex.encode('utf-8')
+        size = len(data)
+        
         # Count mathematical operators
-        operators = len(re.findall(r'[+\-*/=<>^]', equation_tex))
+        operators = size - len(data.translate(None, _OPERATOR_BYTES))
         complexity += operators * 0.3
         
         # Count parentheses and brackets
-        brackets = len(re.findall(r'[(){}[\]|]', equation_tex))
+        brackets = size - len(data.translate(None, _BRACKET_BYTES))
         complexity += brackets * 0.2
         
-        # Count variables and numbers
-        variables = len(re.findall(r'[a-zA-Z_][a-zA-Z0-9_]*', equation_tex))
-        numbers = len(re.findall(r'\d+\.?\d*', equation_tex))
-        complexity += (variables + numbers) * 0.1
+        # Count variables and numbers, reusing the normalized tokens when the
+        # caller already has them instead of rescanning the raw LaTeX
+        if tokens is not None:
+            operands = sum(1 for token in tokens
+                           if token[0].isalnum() or token[0] == '_')
+        else:
+            operands = (len(_VAR_RE.findall(equation_tex)) +
+                        len(_NUM_RE.findall(equation_tex)))
+        complexity += operands * 0.1
         
         return min(complexity, 10.0)  # Cap at 10.0
     
@@ -188,43 +309,56 @@ class MathematicalProcessor:
         if not equation_tex:
             return "unknown"
         
-        equation_lower = equation_tex.lower()
+        # One scan collects every indicator present; the first category in
+        # priority order wins
+        found = {match.lastgroup for match in _TYPE_RE.finditer(equation_tex)}
+        for equation_type in _TYPE_PRIORITY:
+            if equation_type in found:
+                return equation_type
         
-        # Check for common equation types
-        if '\\frac' in equation_tex or '/' in equation_tex:
-            return "fraction"
-        elif '\\sum' in equation_tex or 'sum' in equation_lower:
-            return "summation"
-        elif '\\int' in equation_tex or 'int' in equation_lower:
-            return "integral"
-        elif '\\sqrt' in equation_tex or 'sqrt' in equation_lower:
-            return "radical"
-        elif '=' in equation_tex:
-            return "equation"
-        elif '\\in' in equation_tex or 'in' in equation_lower:
-            return "set_membership"
-        elif '\\subset' in equation_tex or 'subset' in equation_lower:
-            return "set_relation"
-        else:
-            return "expression"
+        return "expression"
     
     def _canonicalize_equation(self, equation_tex: str) -> Optional[str]:
-        """Canonicalize equation using SymPy."""
+        """
+        Canonicalize equation using SymPy.
+        
+        Raises ``_SympyTimeout`` when SymPy takes longer than
+        ``_SYMPY_TIMEOUT``; the timeout is not cached either, so the
+        equation is retried on its next occurrence.
+        """
+        global _sympy_timeout_logged
+        
         if not self._sympy_available or not equation_tex:
             return None
         
         try:
-            import sympy as sp
-            
-            # Parse the equation
-            expr = sp.sympify(equation_tex)
-            
-            # Simplify the expression
-            simplified = sp.simplify(expr)
-            
-            # Convert back to string
-            return str(simplified)
-            
+            return self._canonicalize_cached(equation_tex)
+        except _SympyTimeout:
+            if not _sympy_timeout_logged:
+                _sympy_timeout_logged = True
+                logger.warning(
+                    "SymPy canonicalization exceeded %.1fs; skipping slow equations",
+                    _SYMPY_TIMEOUT
+                )
+            raise
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _canonicalize_cached(equation_tex: str) -> Optional[str]:
+        """
+        Canonicalize a unique equation once, bounded by a timeout.
+        
+        A timeout raises ``_SympyTimeout`` out of this function so that
+        ``lru_cache`` does not store it.
+        """
+        if any(construct in equation_tex for construct in _SYMPY_UNPARSEABLE):
+            return None
+        
+        try:
+            with _sympy_time_limit(_SYMPY_TIMEOUT):
+                return _sympify_and_simplify(equation_tex)
+        except _SympyTimeout:
+            raise
         except Exception:
             return None
     
@@ -245,7 +379,7 @@ class MathematicalProcessor:
             'equation_tex': equation_tex,
             'math_norm': equation_tex,  # Use original as fallback
             'math_tokens': [equation_tex],  # Single token fallback
-            'math_kgrams': [equation_tex],  # Single k-gram fallback
+            'math_kgrams': [(equation_tex,)],  # Single k-gram fallback
             'complexity_score': 0.0,
             'equation_type': 'unknown',
             'error': error
@@ -272,4 +406,45 @@ class MathematicalProcessor:
             equation_type=result['equation_type'],
             math_canonical=result.get('math_canonical'),
             error=result.get('error')
-        )
\ No newline at end of file
+        )
+
+
+@contextlib.contextmanager
+def _sympy_time_limit(seconds: float) -> Iterator[None]:
+    """Interrupt the enclosed block with ``_SympyTimeout`` after `seconds`."""
+    if (not hasattr(signal, 'setitimer')
+            or threading.current_thread() is not threading.main_thread()):
+        yield
+        return
+    
+    def expire(signum, frame):
+        raise _SympyTimeout()
+    
+    previous_handler = signal.signal(signal.SIGALRM, expire)
+    previous_timer = signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+        # Re-arm a timer the caller had already set
+        if previous_timer[0]:
+            signal.setitimer(signal.ITIMER_REAL, *previous_timer)
+
+
+def _sympify_and_simplify(equation_tex: str) -> str:
+    """Parse and simplify an equation with SymPy."""
+    import sympy as sp
+    
+    # Parse the equation
+    expr = sp.sympify(equation_tex)
+    
+    # Simplify the expression and convert back to string
+    return str(sp.simplify(expr))
+
+
+def clear_equation_cache():
+    """Forget memoized equation results, including SymPy canonical forms."""
+    with _equation_cache_lock:
+        _equation_cache.clear()
+    MathematicalProcessor._canonicalize_cached.cache_clear()
@@ -3,21 +3,40 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
 
     Classes/Functions:
-        - EnhancedProcessingMonitor (line 36):
-            - record_success(operation: str, response_time: float) (line 71)
-            - record_error(operation: str, error_message: str) (line 85)
-            - record_memory_usage() (line 102)
-            - record_cpu_usage() (line 113)
-            - get_metrics() -> Dict[str, Any] (line 124)
-            - check_health() -> Dict[str, Any] (line 160)
-            - set_component_health(component: str, status: str, details: Optional[Dict[str, Any]] = None) (line 206)
-            - get_component_health(component: str) -> Optional[Dict[str, Any]] (line 221)
-            - get_error_history(limit: int = 100) -> List[Dict[str, Any]] (line 233)
-            - get_performance_history(hours: int = 24) -> Dict[str, List[Dict[str, Any]]] (line 245)
-            - export_metrics(format: str = 'json') -> str (line 285)
-            - reset_metrics() (line 321)
-            - set_threshold(metric: str, value: float) (line 334)
-            - get_thresholds() -> Dict[str, float] (line 348)
+        - _enable_queued_logging(logger: logging.Logger) (line 85)
+        - _stop_queued_logging() (line 106)
+        - _iso_timestamp(timestamp_ns: int) -> str (line 115)
+        - RingBuffer (line 120):
+            - append(value) (line 142)
+            - view() -> np.ndarray (line 152)
+            - to_array() -> np.ndarray (line 161)
+            - clear() (line 167)
+        - EnhancedProcessingMonitor (line 188):
+            - record_success(operation: str, response_time: float) (line 251)
+            - _reset_response_stats() (line 268)
+            - _append_response_time(response_time: float) (line 277)
+            - record_error(operation: str, error_message: str) (line 308)
+            - _store_error(operation: str, error_message: str, timestamp_ns: int) (line 324)
+            - _init_error_history() (line 340)
+            - record_memory_usage() (line 354)
+            - record_cpu_usage() (line 364)
+            - start_sampler(interval_hz: float = 1.0) (line 374)
+            - stop_sampler(timeout: Optional[float] = None) (line 398)
+            - _run_sampler(interval: float) (line 410)
+            - _take_sample() (line 429)
+            - _get_cpu_usage() -> float (line 434)
+            - _get_memory_usage() -> float (line 442)
+            - get_metrics() -> Dict[str, Any] (line 447)
+            - check_health() -> Dict[str, Any] (line 487)
+            - set_component_health(component: str, status: str, details: Optional[Dict[str, Any]] = None) (line 548)
+            - get_component_health(component: str) -> Optional[Dict[str, Any]] (line 560)
+            - get_error_history(limit: int = 100) -> List[Dict[str, Any]] (line 581)
+            - get_performance_history(hours: int = 24) -> Dict[str, List[Dict[str, Any]]] (line 605)
+            - _samples_since(timestamps: RingBuffer, values: RingBuffer, cutoff_ns: int) -> List[Dict[str, Any]] (line 640)
+            - export_metrics(format: str = 'json') -> str (line 654)
+            - reset_metrics() (line 686)
+            - set_threshold(metric: str, value: float) (line 703)
+            - get_thresholds() -> Dict[str, float] (line 717)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Monitoring module for Enhanced SciRAG.
@@ -25,13 +44,146 @@ Monitoring module for Enhanced SciRAG.
 This module provides comprehensive monitoring capabilities for the enhanced
 processing system including performance metrics, error tracking, and health checks.
 """
+import atexit
+import json
+import os
+import queue
+from array import array
 import time
+import threading
+import numpy as np
 import psutil
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Any, Mapping, Optional
+from datetime import datetime
+from types import MappingProxyType
 from collections import defaultdict, deque
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+_NS_PER_HOUR = 3600 * 10**9
+
+# CSV export rows, terminated like csv.writer's default dialect
+_CSV_HEADER = 'Metric,Value\r\n'
+_CSV_ROW = '{},{}\r\n'
+
+# Minimum time between two CPU readings; sooner calls reuse the last one
+_CPU_SAMPLE_MIN_INTERVAL_NS = 100 * 10**6
+
+
+# Background listener that owns the module logger's handlers once queued
+_log_listener: Optional[QueueListener] = None
+_log_listener_lock = threading.Lock()
+
+
+def _enable_queued_logging(logger: logging.Logger):
+    """Move the logger's own handlers behind a queue drained by a listener thread.
+
+    Afterwards, logging calls on the hot path only enqueue the record. Records
+    that propagate to ancestor handlers are left as they are.
+    """
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is not None or not logger.handlers:
+            return
+        handlers = logger.handlers[:]
+        log_queue = queue.SimpleQueue()
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(QueueHandler(log_queue))
+        _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _log_listener.start()
+        # Flush queued records before interpreter shutdown
+        atexit.register(_stop_queued_logging)
+
+
+def _stop_queued_logging():
+    """Stop the logging listener thread after it drains the queue."""
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is not None:
+            _log_listener.stop()
+            _log_listener = None
+
+
+def _iso_timestamp(timestamp_ns: int) -> str:
+    """Format a ``time.time_ns()`` timestamp as a local ISO 8601 string."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+class RingBuffer:
+    """Fixed-capacity ring buffer over a preallocated NumPy array."""
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Maximum number of values kept; older values are overwritten.
+                A zero capacity keeps nothing, like ``deque(maxlen=0)``
+            dtype: NumPy dtype of the stored values
+        """
+        if capacity < 0:
+            raise ValueError('ring buffer capacity must be non-negative')
+        self.capacity = capacity
+        self._buffer = np.empty(capacity, dtype=dtype)
+        self._head = 0
+        self._count = 0
+
+        # Appends come from worker threads and the sampler thread
+        self._lock = threading.Lock()
+
+    def append(self, value):
+        """Append a value, overwriting the oldest one when full."""
+        if not self.capacity:
+            return
+        with self._lock:
+            self._buffer[self._head] = value
+            self._head = (self._head + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+
+    def view(self) -> np.ndarray:
+        """
+        Get the stored values without copying.
+
+        The values are in storage order, which is only chronological until
+        the buffer wraps; use for order-independent statistics.
+        """
+        return self._buffer[:self._count]
+
+    def to_array(self) -> np.ndarray:
+        """Get a copy of the stored values in chronological order."""
+        if self._count < self.capacity:
+            return self._buffer[:self._count].copy()
+        return np.concatenate((self._buffer[self._head:], self._buffer[:self._head]))
+
+    def clear(self):
+        """Remove all values."""
+        with self._lock:
+            self._head = 0
+            self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int):
+        """Get a value by chronological position; negative indices count from the newest."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('ring buffer index out of range')
+        return self._buffer[(self._head - self._count + index) % self.capacity].item()
+
+    def __iter__(self):
+        return iter(self.to_array().tolist())
+
 
 class EnhancedProcessingMonitor:
     """Enhanced processing monitor for performance and health tracking."""
@@ -45,14 +197,28 @@ class EnhancedProcessingMonitor:
         """
         self.max_history = max_history
         self.logger = logging.getLogger(__name__)
+        _enable_queued_logging(self.logger)
 
-        # Metrics storage
+        # Metrics storage. Timestamps are integer time.time_ns() values;
+        # ISO strings are only produced when history is queried. Numeric
+        # series live in preallocated ring buffers, with each sample's
+        # timestamp in a parallel buffer.
         self.success_count = 0
         self.error_count = 0
-        self.response_times = deque(maxlen=max_history)
-        self.error_history = deque(maxlen=max_history)
-        self.memory_usage = deque(maxlen=max_history)
-        self.cpu_usage = deque(maxlen=max_history)
+        self.response_times = RingBuffer(max_history)
+        self._init_error_history()
+        self.memory_usage = RingBuffer(max_history)
+        self._memory_timestamps = RingBuffer(max_history, dtype=np.int64)
+        self.cpu_usage = RingBuffer(max_history)
+        self._cpu_timestamps = RingBuffer(max_history, dtype=np.int64)
+
+        # Running response time statistics over the response_times window,
+        # kept up to date on every record_success
+        self._stats_lock = threading.Lock()
+        self._reset_response_stats()
+
+        # Keeps each usage sample's timestamp and value buffers aligned
+        self._samples_lock = threading.Lock()
 
         # Performance thresholds
         self.thresholds = {
@@ -61,6 +227,8 @@ class EnhancedProcessingMonitor:
             'max_memory_usage': 80.0,  # 80%
             'max_cpu_usage': 80.0      # 80%
         }
+        # Live read-only view, so readers don't need a copy
+        self._thresholds_view = MappingProxyType(self.thresholds)
 
         # Component health
         self.component_health = {}
@@ -68,6 +236,18 @@ class EnhancedProcessingMonitor:
         # Start time for uptime calculation
         self.start_time = time.time()
 
+        # Cached process handle for per-process metrics, and non-blocking CPU
+        # sampling state. The first cpu_percent(interval=None) call only
+        # primes psutil's reference counters.
+        self._process = psutil.Process()
+        psutil.cpu_percent(interval=None)
+        self._last_cpu_sample_ns = time.monotonic_ns()
+        self._last_cpu_percent = 0.0
+
+        # Background sampler state
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+
     def record_success(self, operation: str, response_time: float):
         """
         Record successful operation.
@@ -76,12 +256,54 @@ class EnhancedProcessingMonitor:
             operation: Operation name
             response_time: Response time in seconds
         """
-        self.success_count += 1
+        with self._stats_lock:
+            self.success_count += 1
+            self._append_response_time(response_time)
+
+        # Log success; skip formatting the message when debug is off
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Operation '{operation}' completed in {response_time:.3f}s")
+
+    def _reset_response_stats(self):
+        """Reset the running response time statistics."""
+        self._rt_sum = 0.0
+        self._rt_seq = 0
+        # Monotonic queues of (sequence number, response time) whose fronts
+        # are the window maximum and minimum
+        self._rt_max = deque()
+        self._rt_min = deque()
+
+    def _append_response_time(self, response_time: float):
+        """Append a response time and fold it into the running statistics."""
+        window = self.response_times.capacity
+        if not window:
+            return
+        if len(self.response_times) == window:
+            # The oldest sample is about to be overwritten
+            self._rt_sum -= self.response_times[0]
+        self._rt_sum += response_time
         self.response_times.append(response_time)
 
-        # Log success
-        self.logger.debug(
-            f"Operation '{operation}' completed in {response_time:.3f}s")
+        seq = self._rt_seq
+        self._rt_seq += 1
+        if self._rt_seq % window == 0:
+            # Resynchronize once per window so rounding errors don't accumulate
+            self._rt_sum = float(self.response_times.view().sum())
+
+        while self._rt_max and self._rt_max[-1][1] <= response_time:
+            self._rt_max.pop()
+        self._rt_max.append((seq, response_time))
+        while self._rt_min and self._rt_min[-1][1] >= response_time:
+            self._rt_min.pop()
+        self._rt_min.append((seq, response_time))
+
+        # Drop samples that have left the window
+        oldest_seq = seq - window + 1
+        if self._rt_max[0][0] < oldest_seq:
+            self._rt_max.popleft()
+        if self._rt_min[0][0] < oldest_seq:
+            self._rt_min.popleft()
 
     def record_error(self, operation: str, error_message: str):
         """Record failed operation.
@@ -90,58 +312,160 @@ class EnhancedProcessingMonitor:
             operation: Operation name
             error_message: Error message
         """
-        self.error_count += 1
-        self.error_history.append({
-            'operation': operation,
-            'error': error_message,
-            'timestamp': datetime.now().isoformat()
-        })
+        timestamp_ns = time.time_ns()
+        with self._error_lock:
+            self.error_count += 1
+            if self.max_history:
+                self._store_error(operation, error_message, timestamp_ns)
 
         # Log error
         self.logger.error(f"Operation '{operation}' failed: {error_message}")
 
+    def _store_error(self, operation: str, error_message: str, timestamp_ns: int):
+        """Write an error into the next error history slot; call with the lock held."""
+        operation_id = self._operation_ids.get(operation)
+        if operation_id is None:
+            operation_id = len(self._operation_names)
+            self._operation_ids[operation] = operation_id
+            self._operation_names.append(operation)
+
+        head = self._error_head
+        self._error_operations[head] = operation_id
+        self._error_timestamps[head] = timestamp_ns
+        self._error_messages[head] = error_message
+        self._error_head = (head + 1) % self.max_history
+        if self._error_total < self.max_history:
+            self._error_total += 1
+
+    def _init_error_history(self):
+        """Allocate the error history ring buffer."""
+        # Structure of arrays: interned operation ids, timestamps and
+        # messages in preallocated slots, so recording an error allocates
+        # no per-error container
+        self._error_lock = threading.Lock()
+        self._operation_ids: Dict[str, int] = {}
+        self._operation_names: List[str] = []
+        self._error_operations = array('I', [0]) * self.max_history
+        self._error_timestamps = array('q', [0]) * self.max_history
+        self._error_messages: List[Optional[str]] = [None] * self.max_history
+        self._error_head = 0
+        self._error_total = 0
+
     def record_memory_usage(self):
         """Record current memory usage."""
         try:
             memory_percent = psutil.virtual_memory().percent
-            self.memory_usage.append({
-                'timestamp': datetime.now().isoformat(),
-                'usage_percent': memory_percent
-            })
+            with self._samples_lock:
+                self._memory_timestamps.append(time.time_ns())
+                self.memory_usage.append(memory_percent)
         except Exception as e:
             self.logger.warning(f"Failed to record memory usage: {e}")
 
     def record_cpu_usage(self):
         """Record current CPU usage."""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            self.cpu_usage.append({
-                'timestamp': datetime.now().isoformat(),
-                'usage_percent': cpu_percent
-            })
+            cpu_percent = self._get_cpu_usage()
+            with self._samples_lock:
+                self._cpu_timestamps.append(time.time_ns())
+                self.cpu_usage.append(cpu_percent)
         except Exception as e:
             self.logger.warning(f"Failed to record CPU usage: {e}")
 
+    def start_sampler(self, interval_hz: float = 1.0):
+        """
+        Start sampling memory and CPU usage on a background thread.
+
+        Callers no longer pay for sampling inline. The thread is paced by a
+        timerfd where available (Linux, Python 3.13+), otherwise by waits
+        on absolute monotonic deadlines, so the rate does not drift. Samples
+        only go to the in-memory history; the thread does no file I/O.
+
+        Args:
+            interval_hz: Sampling frequency in samples per second
+        """
+        if self._sampler_thread is not None and self._sampler_thread.is_alive():
+            return
+
+        self._sampler_stop.clear()
+        self._sampler_thread = threading.Thread(
+            target=self._run_sampler,
+            args=(1.0 / interval_hz,),
+            name='monitor-sampler',
+            daemon=True
+        )
+        self._sampler_thread.start()
+
+    def stop_sampler(self, timeout: Optional[float] = None):
+        """
+        Stop the background sampler started by start_sampler.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread to exit
+        """
+        self._sampler_stop.set()
+        if self._sampler_thread is not None:
+            self._sampler_thread.join(timeout)
+            self._sampler_thread = None
+
+    def _run_sampler(self, interval: float):
+        """Sampler thread body: record one sample per interval until stopped."""
+        if hasattr(os, 'timerfd_create'):
+            fd = os.timerfd_create(time.CLOCK_MONOTONIC)
+            try:
+                os.timerfd_settime(fd, initial=interval, interval=interval)
+                while not self._sampler_stop.is_set():
+                    os.read(fd, 8)  # Blocks until the next expiration
+                    self._take_sample()
+            finally:
+                os.close(fd)
+        else:
+            deadline = time.monotonic()
+            while True:
+                deadline += interval
+                if self._sampler_stop.wait(max(0.0, deadline - time.monotonic())):
+                    break
+                self._take_sample()
+
+    def _take_sample(self):
+        """Record one memory and CPU usage sample."""
+        self.record_memory_usage()
+        self.record_cpu_usage()
+
+    def _get_cpu_usage(self) -> float:
+        """Get system CPU usage since the previous reading without blocking."""
+        now_ns = time.monotonic_ns()
+        if now_ns - self._last_cpu_sample_ns >= _CPU_SAMPLE_MIN_INTERVAL_NS:
+            self._last_cpu_percent = float(psutil.cpu_percent(interval=None))
+            self._last_cpu_sample_ns = now_ns
+        return self._last_cpu_percent
+
+    def _get_memory_usage(self) -> float:
+        """Get this process's resident memory in MB."""
+        with self._process.oneshot():
+            return self._process.memory_info().rss / (1024 * 1024)
+
     def get_metrics(self) -> Dict[str, Any]:
         """
         Get current metrics.
 
         Returns:
-            Dictionary containing current metrics
+            Dictionary containing current metrics. 'thresholds' is a live
+            read-only view; copy it with dict() before serializing
         """
         total_operations = self.success_count + self.error_count
         error_rate = self.error_count / total_operations if total_operations > 0 else 0.0
 
         # Calculate response time statistics
-        if self.response_times:
-            avg_response_time = sum(self.response_times) / \
-                len(self.response_times)
-            max_response_time = max(self.response_times)
-            min_response_time = min(self.response_times)
-        else:
-            avg_response_time = 0.0
-            max_response_time = 0.0
-            min_response_time = 0.0
+        with self._stats_lock:
+            count = len(self.response_times)
+            if count:
+                avg_response_time = self._rt_sum / count
+                max_response_time = self._rt_max[0][1]
+                min_response_time = self._rt_min[0][1]
+            else:
+                avg_response_time = 0.0
+                max_response_time = 0.0
+                min_response_time = 0.0
 
         # Calculate uptime
         uptime = time.time() - self.start_time
@@ -156,7 +480,8 @@ class EnhancedProcessingMonitor:
             'min_response_time': min_response_time,
             'uptime_seconds': uptime,
             'uptime_hours': uptime / 3600,
-            'thresholds': self.thresholds.copy()
+            # Live read-only view; the thresholds rarely change
+            'thresholds': self._thresholds_view
         }
 
     def check_health(self) -> Dict[str, Any]:
@@ -164,38 +489,44 @@ class EnhancedProcessingMonitor:
         Check system health.
 
         Returns:
-            Dictionary containing health status
+            Dictionary containing health status and the values it was
+            judged on; use get_metrics for the full metrics
         """
-        metrics = self.get_metrics()
+        # Read the few values the checks need directly rather than
+        # building the full metrics dictionary
+        thresholds = self._thresholds_view
+        error_count = self.error_count
+        total_operations = self.success_count + error_count
+        error_rate = error_count / total_operations if total_operations > 0 else 0.0
+        with self._stats_lock:
+            count = len(self.response_times)
+            avg_response_time = self._rt_sum / count if count else 0.0
+        recent_memory = self.memory_usage[-1] if self.memory_usage else 0.0
+        recent_cpu = self.cpu_usage[-1] if self.cpu_usage else 0.0
 
         # Check thresholds
         health_issues = []
 
-        if metrics['avg_response_time'] > self.thresholds['max_response_time']:
+        if avg_response_time > thresholds['max_response_time']:
             health_issues.append(
-                f"High average response time: {metrics['avg_response_time']:.2f}s")
+                f"High average response time: {avg_response_time:.2f}s")
 
-        if metrics['error_rate'] > self.thresholds['max_error_rate']:
-            health_issues.append(
-                f"High error rate: {metrics['error_rate']:.2%}")
+        # Compare counts rather than the rate, which is 0 with no operations
+        if error_count > thresholds['max_error_rate'] * total_operations:
+            health_issues.append(f"High error rate: {error_rate:.2%}")
 
         # Check recent memory usage
-        if self.memory_usage:
-            recent_memory = self.memory_usage[-1]['usage_percent']
-            if recent_memory > self.thresholds['max_memory_usage']:
-                health_issues.append(
-                    f"High memory usage: {recent_memory:.1f}%")
+        if recent_memory > thresholds['max_memory_usage']:
+            health_issues.append(f"High memory usage: {recent_memory:.1f}%")
 
         # Check recent CPU usage
-        if self.cpu_usage:
-            recent_cpu = self.cpu_usage[-1]['usage_percent']
-            if recent_cpu > self.thresholds['max_cpu_usage']:
-                health_issues.append(f"High CPU usage: {recent_cpu:.1f}%")
+        if recent_cpu > thresholds['max_cpu_usage']:
+            health_issues.append(f"High CPU usage: {recent_cpu:.1f}%")
 
         # Determine overall health status
         if health_issues:
             status = 'unhealthy'
-        elif metrics['error_rate'] > 0.05:  # 5% error rate
+        elif error_count * 20 > total_operations:  # 5% error rate
             status = 'degraded'
         else:
             status = 'healthy'
@@ -203,9 +534,15 @@ class EnhancedProcessingMonitor:
         return {
             'status': status,
             'timestamp': datetime.now().isoformat(),
-            'metrics': metrics,
+            'error_rate': error_rate,
+            'avg_response_time': avg_response_time,
+            'memory_usage': recent_memory,
+            'cpu_usage': recent_cpu,
             'health_issues': health_issues,
-            'component_health': self.component_health.copy()
+            'component_health': {
+                component: self.get_component_health(component)
+                for component in self.component_health
+            }
         }
 
     def set_component_health(
@@ -218,11 +555,7 @@ class EnhancedProcessingMonitor:
             status: Health status ('healthy', 'degraded', 'unhealthy')
             details: Additional details about component health
         """
-        self.component_health[component] = {
-            'status': status,
-            'timestamp': datetime.now().isoformat(),
-            'details': details or {}
-        }
+        self.component_health[component] = (time.time_ns(), status, details or {})
 
     def get_component_health(self, component: str) -> Optional[Dict[str, Any]]:
         """
@@ -234,7 +567,16 @@ class EnhancedProcessingMonitor:
         Returns:
             Component health status or None if not found
         """
-        return self.component_health.get(component)
+        entry = self.component_health.get(component)
+        if entry is None:
+            return None
+
+        timestamp_ns, status, details = entry
+        return {
+            'status': status,
+            'timestamp': _iso_timestamp(timestamp_ns),
+            'details': details
+        }
 
     def get_error_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -246,7 +588,19 @@ class EnhancedProcessingMonitor:
         Returns:
             List of recent errors
         """
-        return list(self.error_history)[-limit:]
+        with self._error_lock:
+            # Slots of the stored errors from oldest to newest
+            start = self._error_head - self._error_total
+            slots = [(start + i) % self.max_history
+                     for i in range(self._error_total)[-limit:]]
+            return [
+                {
+                    'operation': self._operation_names[self._error_operations[slot]],
+                    'error': self._error_messages[slot],
+                    'timestamp': _iso_timestamp(self._error_timestamps[slot])
+                }
+                for slot in slots
+            ]
 
     def get_performance_history(
             self, hours: int = 24) -> Dict[str, List[Dict[str, Any]]]:
@@ -259,7 +613,7 @@ class EnhancedProcessingMonitor:
         Returns:
             Dictionary containing performance history
         """
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff_ns = time.time_ns() - hours * _NS_PER_HOUR
 
         # Filter response times
         recent_response_times = []
@@ -271,17 +625,11 @@ class EnhancedProcessingMonitor:
                 'response_time': response_time
             })
 
-        # Filter memory usage
-        recent_memory = [
-            entry for entry in self.memory_usage
-            if datetime.fromisoformat(entry['timestamp']) > cutoff_time
-        ]
-
-        # Filter CPU usage
-        recent_cpu = [
-            entry for entry in self.cpu_usage
-            if datetime.fromisoformat(entry['timestamp']) > cutoff_time
-        ]
+        # Filter memory and CPU usage
+        recent_memory = self._samples_since(
+            self._memory_timestamps, self.memory_usage, cutoff_ns)
+        recent_cpu = self._samples_since(
+            self._cpu_timestamps, self.cpu_usage, cutoff_ns)
 
         return {
             'response_times': recent_response_times,
@@ -289,6 +637,20 @@ class EnhancedProcessingMonitor:
             'cpu_usage': recent_cpu
         }
 
+    def _samples_since(self, timestamps: RingBuffer, values: RingBuffer,
+                       cutoff_ns: int) -> List[Dict[str, Any]]:
+        """Get usage samples newer than cutoff_ns as timestamped dicts."""
+        with self._samples_lock:
+            timestamps = timestamps.to_array()
+            values = values.to_array()
+
+        # Timestamps are appended in order, so the cutoff is a binary search
+        start = int(np.searchsorted(timestamps, cutoff_ns, side='right'))
+        return [
+            {'timestamp': _iso_timestamp(timestamp_ns), 'usage_percent': usage}
+            for timestamp_ns, usage in zip(timestamps[start:].tolist(), values[start:].tolist())
+        ]
+
     def export_metrics(self, format: str = 'json') -> str:
         """
         Export metrics in specified format.
@@ -300,28 +662,24 @@ class EnhancedProcessingMonitor:
             Exported metrics string
         """
         if format == 'json':
-            import json
-            return json.dumps(self.get_metrics(), indent=2)
+            # default=dict serializes the read-only thresholds view
+            if ORJSON_AVAILABLE:
+                return orjson.dumps(self.get_metrics(), default=dict,
+                                    option=orjson.OPT_INDENT_2).decode('utf-8')
+            return json.dumps(self.get_metrics(), default=dict, indent=2)
         elif format == 'csv':
-            import csv
-            import io
-
-            output = io.StringIO()
-            writer = csv.writer(output)
-
-            # Write header
-            writer.writerow(['Metric', 'Value'])
-
-            # Write metrics
+            # Metric names and values are plain scalars that never need
+            # quoting, so rows are formatted directly instead of via csv
+            rows = [_CSV_HEADER]
             metrics = self.get_metrics()
             for key, value in metrics.items():
-                if isinstance(value, dict):
+                if isinstance(value, Mapping):
                     for sub_key, sub_value in value.items():
-                        writer.writerow([f'{key}.{sub_key}', sub_value])
+                        rows.append(_CSV_ROW.format(f'{key}.{sub_key}', sub_value))
                 else:
-                    writer.writerow([key, value])
+                    rows.append(_CSV_ROW.format(key, value))
 
-            return output.getvalue()
+            return ''.join(rows)
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
@@ -329,10 +687,14 @@ class EnhancedProcessingMonitor:
         """Reset all metrics."""
         self.success_count = 0
         self.error_count = 0
-        self.response_times.clear()
-        self.error_history.clear()
+        with self._stats_lock:
+            self.response_times.clear()
+            self._reset_response_stats()
+        self._init_error_history()
         self.memory_usage.clear()
+        self._memory_timestamps.clear()
         self.cpu_usage.clear()
+        self._cpu_timestamps.clear()
         self.component_health.clear()
         self.start_time = time.time()
 
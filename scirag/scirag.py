@@ -3,27 +3,46 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - DocumentChunk (line 149):
-        - SciRag (line 159):
-            - _load_markdown_files() (line 210)
-            - load_markdown_files() -> List[Document] (line 214)
-            - split_documents() -> List[Document] (line 242)
-            - _get_drive_service() (line 264)
-            - upload_to_drive(folder_id: str) -> List[str] (line 286)
-            - create_vector_db(folder_id=folder_id) (line 323)
-            - get_chunks(query: str) (line 326)
-            - delete_vector_db() (line 329)
-            - get_response(query: str) (line 332)
+        - _save_drive_token(creds) (line 210)
+        - _schedule_drive_refresh(creds) (line 216)
+        - _refresh_drive_credentials(creds) (line 228)
+        - _get_drive_credentials() (line 241)
+        - DocumentChunk (line 267):
+        - SciRag (line 277):
+            - _load_markdown_files() (line 327)
+            - load_markdown_files() -> List[Document] (line 335)
+            - split_documents() -> List[Document] (line 363)
+            - _get_drive_service() (line 385)
+            - _get_thread_drive_http() (line 394)
+            - _list_drive_folder(folder_id: str) -> Dict[tuple, str] (line 403)
+            - _load_upload_manifest() -> Dict[str, Dict[str, Any]] (line 423)
+            - _save_upload_manifest(manifest: Dict[str, Dict[str, Any]]) (line 432)
+            - _file_md5(file_path: Path, manifest: Dict[str, Dict[str, Any]]) -> str (line 441)
+            - _upload_file_to_drive(file_path: Path, folder_id: str, existing: Optional[Dict[tuple, str]] = None, manifest: Optional[Dict[str, Dict[str, Any]]] = None) -> str (line 455)
+            - upload_to_drive(folder_id: str, max_workers: int = DRIVE_UPLOAD_WORKERS) -> List[str] (line 504)
+            - create_vector_db(folder_id=folder_id) (line 538)
+            - get_chunks(query: str) (line 541)
+            - delete_vector_db() (line 544)
+            - get_response(query: str) (line 547)
+            - get_chunks_batch(queries: List[str], concurrency: int = QUERY_BATCH_WORKERS) -> list (line 550)
+            - get_responses(queries: List[str], concurrency: int = QUERY_BATCH_WORKERS) -> list (line 567)
+            - _map_queries(func, queries: List[str], concurrency: int) -> list (line 582)
     --- END AUTO-GENERATED DOCSTRING ---
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 # from IPython.display import display, Markdown
 import asyncio
+import hashlib
+import io
+import json
 import time
 import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
+from datetime import datetime, timezone
 import numpy as np
 
 # Conditional Google Cloud imports
@@ -32,7 +51,9 @@ try:
     from google_auth_oauthlib.flow import InstalledAppFlow
     from google.auth.transport.requests import Request
     from googleapiclient.discovery import build
-    from googleapiclient.http import MediaFileUpload
+    from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+    from google_auth_httplib2 import AuthorizedHttp
+    import httplib2
     from google.genai.types import (
         GenerateContentConfig,
         Retrieval,
@@ -68,6 +89,15 @@ except ImportError:
     class MediaFileUpload:
         pass
 
+    class MediaIoBaseUpload:
+        pass
+
+    class AuthorizedHttp:
+        pass
+
+    class httplib2:
+        pass
+
     class GenerateContentConfig:
         pass
 
@@ -129,7 +159,8 @@ try:
                          markdown_files_path,
                          SCOPES,
                          display_name,
-                         folder_id)
+                         folder_id,
+                         REPO_DIR)
     CONFIG_AVAILABLE = True
 except ImportError:
     CONFIG_AVAILABLE = False
@@ -142,9 +173,96 @@ except ImportError:
     markdown_files_path = None
     SCOPES = []
     display_name = "corpus"
+    REPO_DIR = Path(__file__).resolve().parent.parent
     folder_id = None
 
 
+# User turn sent with each question; the static instructions live in rag_prompt
+QUERY_TEMPLATE = """
+Question: {}
+"""
+
+# Concurrent queries per get_chunks_batch / get_responses call
+QUERY_BATCH_WORKERS = 16
+
+# Local MD5s of uploaded files, reused while a file's size and mtime are unchanged
+UPLOAD_MANIFEST_NAME = ".upload_manifest.json"
+
+# Concurrent Drive uploads per upload_to_drive call
+DRIVE_UPLOAD_WORKERS = 8
+
+# Retries per Drive request on rate-limit and 5xx errors; googleapiclient
+# backs off exponentially between attempts
+DRIVE_NUM_RETRIES = 5
+
+# Files smaller than this go up in a single multipart request; larger ones
+# use a resumable upload session
+DRIVE_RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
+# Drive credentials are renewed in the background this long before expiry
+DRIVE_TOKEN_REFRESH_MARGIN = 60  # seconds
+
+# Drive credentials shared by every SciRag instance in the process
+_DRIVE_CREDS = None
+_DRIVE_CREDS_LOCK = threading.Lock()
+
+
+def _save_drive_token(creds):
+    """Persist Drive credentials so the next process can reuse them."""
+    with open('token.json', 'w') as token:
+        token.write(creds.to_json())
+
+
+def _schedule_drive_refresh(creds):
+    """Start a daemon timer that renews creds shortly before they expire."""
+    if creds.expiry is None or not creds.refresh_token:
+        return
+    # google-auth keeps expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    delay = (creds.expiry - now).total_seconds() - DRIVE_TOKEN_REFRESH_MARGIN
+    timer = threading.Timer(max(delay, 0), _refresh_drive_credentials, args=(creds,))
+    timer.daemon = True
+    timer.start()
+
+
+def _refresh_drive_credentials(creds):
+    """Renew creds off the request path, then schedule the next renewal."""
+    with _DRIVE_CREDS_LOCK:
+        try:
+            creds.refresh(Request())
+            _save_drive_token(creds)
+        except Exception as e:
+            # Requests still refresh expired credentials on demand
+            print(f"Warning: Could not refresh Google Drive credentials: {e}")
+            return
+    _schedule_drive_refresh(creds)
+
+
+def _get_drive_credentials():
+    """Load, refresh or obtain the process-wide Google Drive credentials."""
+    global _DRIVE_CREDS
+    with _DRIVE_CREDS_LOCK:
+        if _DRIVE_CREDS is None:
+            creds = None
+            if os.path.exists('token.json'):
+                creds = Credentials.from_authorized_user_file(
+                    'token.json', SCOPES)
+
+            if not creds or not creds.valid:
+                if creds and creds.expired and creds.refresh_token:
+                    creds.refresh(Request())
+                else:
+                    flow = InstalledAppFlow.from_client_secrets_file(
+                        REPO_DIR / 'credentials.json', SCOPES)
+                    creds = flow.run_local_server(port=0)
+
+                _save_drive_token(creds)
+
+            _DRIVE_CREDS = creds
+            _schedule_drive_refresh(creds)
+        return _DRIVE_CREDS
+
+
 @dataclass
 class DocumentChunk:
     """Represents a document chunk with context and metadata"""
@@ -167,6 +285,9 @@ class SciRag:
         self.credentials = credentials
         self.markdown_files_path = markdown_files_path
         self.drive_service = None
+        # httplib2 connections are not thread-safe; upload workers share the
+        # Drive service but each executes requests over its own connection
+        self._drive_local = threading.local()
         self.client = client
         self.corpus_name = corpus_name
         self.gen_model = gen_model
@@ -187,11 +308,7 @@ You must search your knowledge base calling your tool. The sources must be from
 You must report the source names in the sources field, if possible, the page number, equation number, table number, section number, etc.
 
 """
-        self.enhanced_query = lambda query: (
-            rf"""
-Question: {query}
-"""
-        )
+        self.enhanced_query = QUERY_TEMPLATE.format
 
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=CHUNK_SIZE,
@@ -208,7 +325,11 @@ Question: {query}
         self.cost_dict = cost_dict
 
     def _load_markdown_files(self):
-        markdown_files = list(self.markdown_files_path.glob("*.md"))
+        # A single scandir pass; entry types come from the directory listing,
+        # so only symlinks need a stat call
+        with os.scandir(self.markdown_files_path) as entries:
+            markdown_files = [Path(entry.path) for entry in entries
+                              if entry.name.endswith('.md') and entry.is_file()]
         return markdown_files
 
     def load_markdown_files(self) -> List[Document]:
@@ -264,60 +385,154 @@ Question: {query}
     def _get_drive_service(self):
         """Initialize and return Google Drive service."""
         if not self.drive_service:
-            creds = None
-            if os.path.exists('token.json'):
-                creds = Credentials.from_authorized_user_file(
-                    'token.json', SCOPES)
+            # cache_discovery=False skips the discovery-document file cache
+            self.drive_service = build(
+                'drive', 'v3', credentials=_get_drive_credentials(),
+                cache_discovery=False)
+        return self.drive_service
 
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                else:
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        REPO_DIR / 'credentials.json', SCOPES)
-                    creds = flow.run_local_server(port=0)
+    def _get_thread_drive_http(self):
+        """Return the calling thread's own authorized, keep-alive HTTP connection."""
+        http = getattr(self._drive_local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(_get_drive_credentials(),
+                                  http=httplib2.Http())
+            self._drive_local.http = http
+        return http
+
+    def _list_drive_folder(self, folder_id: str) -> Dict[tuple, str]:
+        """Map (name, md5Checksum) of every file in a Drive folder to its ID."""
+        service = self._get_drive_service()
+        existing = {}
+        page_token = None
+        while True:
+            result = service.files().list(
+                q=f"'{folder_id}' in parents and trashed = false",
+                fields="nextPageToken, files(id, name, md5Checksum)",
+                pageSize=1000,
+                pageToken=page_token
+            ).execute(num_retries=DRIVE_NUM_RETRIES)
+            for item in result.get('files', []):
+                existing.setdefault(
+                    (item['name'], item.get('md5Checksum')), item['id'])
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                return existing
+
+    @staticmethod
+    def _load_upload_manifest() -> Dict[str, Dict[str, Any]]:
+        """Load the local MD5 manifest, or an empty one."""
+        try:
+            with open(REPO_DIR / UPLOAD_MANIFEST_NAME) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_upload_manifest(manifest: Dict[str, Dict[str, Any]]):
+        """Write the local MD5 manifest."""
+        try:
+            with open(REPO_DIR / UPLOAD_MANIFEST_NAME, 'w') as f:
+                json.dump(manifest, f)
+        except OSError as e:
+            print(f"Warning: Could not save upload manifest: {e}")
+
+    @staticmethod
+    def _file_md5(file_path: Path, manifest: Dict[str, Dict[str, Any]]) -> str:
+        """MD5 of a file, from the manifest when size and mtime still match."""
+        st = file_path.stat()
+        key = str(file_path.resolve())
+        entry = manifest.get(key)
+        if (entry and entry['size'] == st.st_size
+                and entry['mtime_ns'] == st.st_mtime_ns):
+            return entry['md5']
+        with open(file_path, 'rb') as f:
+            md5 = hashlib.file_digest(f, 'md5').hexdigest()
+        manifest[key] = {'size': st.st_size,
+                         'mtime_ns': st.st_mtime_ns, 'md5': md5}
+        return md5
+
+    def _upload_file_to_drive(self, file_path: Path, folder_id: str,
+                              existing: Optional[Dict[tuple, str]] = None,
+                              manifest: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+        """
+        Upload one markdown file to a Google Drive folder and return its ID.
+
+        When the folder listing already has a file with the same name and
+        MD5, that file's ID is returned and nothing is uploaded.
+        """
+        if existing is not None:
+            md5 = self._file_md5(file_path, manifest if manifest is not None else {})
+            file_id = existing.get((file_path.name, md5))
+            if file_id is not None:
+                return file_id
+
+        file_metadata = {
+            'name': file_path.name,
+            'parents': [folder_id],
+            'mimeType': 'text/markdown'
+        }
+
+        # Small files are read whole in one call and sent from memory, so
+        # the upload never goes back to the file
+        with open(file_path, 'rb') as f:
+            small = os.fstat(f.fileno()).st_size < DRIVE_RESUMABLE_THRESHOLD
+            data = f.read() if small else None
+
+        if small:
+            media = MediaIoBaseUpload(
+                io.BytesIO(data),
+                mimetype='text/markdown',
+                resumable=False
+            )
+        else:
+            media = MediaFileUpload(
+                str(file_path),
+                mimetype='text/markdown',
+                resumable=True
+            )
 
-                with open('token.json', 'w') as token:
-                    token.write(creds.to_json())
+        file = self._get_drive_service().files().create(
+            body=file_metadata,
+            media_body=media,
+            fields='id'
+        ).execute(http=self._get_thread_drive_http(),
+                  num_retries=DRIVE_NUM_RETRIES)
 
-            self.drive_service = build('drive', 'v3', credentials=creds)
-        return self.drive_service
+        return file.get('id')
 
-    def upload_to_drive(self, folder_id: str) -> List[str]:
+    def upload_to_drive(self, folder_id: str,
+                        max_workers: int = DRIVE_UPLOAD_WORKERS) -> List[str]:
         """
         Upload all markdown files to the specified Google Drive folder.
 
+        Files are uploaded concurrently. Rate-limited requests are retried
+        with exponential backoff. Files whose name and content already exist
+        in the folder are skipped and their existing IDs returned.
+
         Args:
             folder_id (str): The ID of the Google Drive folder to upload to
+            max_workers (int): Maximum number of concurrent uploads
 
         Returns:
-            List[str]: List of file IDs of uploaded files
+            List[str]: List of file IDs of uploaded files, in file order
         """
-        service = self._get_drive_service()
         markdown_files = self._load_markdown_files()
-        uploaded_file_ids = []
+        if not markdown_files:
+            return []
 
-        for file_path in markdown_files:
-            file_metadata = {
-                'name': file_path.name,
-                'parents': [folder_id],
-                'mimeType': 'text/markdown'
-            }
+        # Build the service up front so workers never start an auth flow
+        self._get_drive_service()
+        existing = self._list_drive_folder(folder_id)
+        manifest = self._load_upload_manifest()
 
-            media = MediaFileUpload(
-                str(file_path),
-                mimetype='text/markdown',
-                resumable=True
-            )
-
-            file = service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id'
-            ).execute()
-
-            uploaded_file_ids.append(file.get('id'))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            uploaded_file_ids = list(executor.map(
+                lambda file_path: self._upload_file_to_drive(
+                    file_path, folder_id, existing, manifest),
+                markdown_files))
 
+        self._save_upload_manifest(manifest)
         return uploaded_file_ids
 
     def create_vector_db(self, folder_id=folder_id):
@@ -331,3 +546,42 @@ Question: {query}
 
     def get_response(self, query: str):
         pass
+
+    def get_chunks_batch(self, queries: List[str],
+                         concurrency: int = QUERY_BATCH_WORKERS) -> list:
+        """
+        Retrieve chunks for several queries concurrently.
+
+        Each query is an independent retrieval call, so their network
+        latency overlaps.
+
+        Args:
+            queries (List[str]): The queries to retrieve chunks for
+            concurrency (int): Maximum number of queries in flight
+
+        Returns:
+            list: get_chunks results, in the same order as queries
+        """
+        return self._map_queries(self.get_chunks, queries, concurrency)
+
+    def get_responses(self, queries: List[str],
+                      concurrency: int = QUERY_BATCH_WORKERS) -> list:
+        """
+        Answer several queries concurrently.
+
+        Args:
+            queries (List[str]): The questions to answer
+            concurrency (int): Maximum number of queries in flight
+
+        Returns:
+            list: get_response results, in the same order as queries
+        """
+        return self._map_queries(self.get_response, queries, concurrency)
+
+    @staticmethod
+    def _map_queries(func, queries: List[str], concurrency: int) -> list:
+        """Apply func to every query on a thread pool, preserving order."""
+        if len(queries) <= 1:
+            return [func(query) for query in queries]
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(queries))) as executor:
+            return list(executor.map(func, queries))
@@ -3,25 +3,36 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - EnhancedProcessingStats (line 59):
-        - SciRagEnhanced (line 70):
-            - _initialize_enhanced_processing() (line 158)
-            - load_documents_enhanced(file_paths: List[Union[str, Path]], source_ids: Optional[List[str]] = None) -> List[EnhancedChunk] (line 183)
-            - _load_documents_basic(file_paths: List[Union[str, Path]], source_ids: Optional[List[str]] = None) -> List[EnhancedChunk] (line 251)
-            - _load_document_basic(file_path: Path, source_id: str) -> List[EnhancedChunk] (line 260)
-            - _update_content_stats(chunks: List[EnhancedChunk]) (line 269)
-            - get_enhanced_response(query: str, content_types: Optional[List[ContentType]] = None, max_chunks: int = 10) -> str (line 279)
-            - _filter_chunks_by_type(content_types: Optional[List[ContentType]]) -> List[EnhancedChunk] (line 323)
-            - _build_context_from_chunks(chunks: List[EnhancedChunk]) -> str (line 332)
-            - _generate_enhanced_response(query: str, context: str) -> str (line 342)
-            - _generate_response_with_prompt(prompt: str) -> str (line 351)
-            - get_mathematical_chunks() -> List[EnhancedChunk] (line 357)
-            - get_asset_chunks() -> List[EnhancedChunk] (line 364)
-            - get_glossary_chunks() -> List[EnhancedChunk] (line 371)
-            - get_chunks_by_type(content_type: ContentType) -> List[EnhancedChunk] (line 378)
-            - get_processing_stats() -> Dict[str, Any] (line 388)
-            - export_enhanced_chunks(format: str = 'json') -> str (line 404)
-            - validate_enhanced_chunks() -> Dict[str, Any] (line 442)
+        - EnhancedProcessingStats (line 91):
+        - _ChunkIndex (line 109):
+        - _ChunkList (line 132):
+        - _restamping(name: str) (line 141)
+        - SciRagEnhanced (line 162):
+            - _initialize_enhanced_processing() (line 259)
+            - load_documents_enhanced(file_paths: List[Union[str, Path]], source_ids: Optional[List[str]] = None, max_workers: Optional[int] = None, use_threads: bool = False) -> List[EnhancedChunk] (line 284)
+            - _deduplicate_chunks(chunks: List[EnhancedChunk]) -> List[EnhancedChunk] (line 366)
+            - enhanced_chunks() -> List[EnhancedChunk] (line 379)
+            - enhanced_chunks(chunks: List[EnhancedChunk]) (line 390)
+            - _get_cached_response(key: Tuple) -> Optional[str] (line 396)
+            - _cache_response(key: Tuple, response: str) (line 404)
+            - _get_chunk_index() -> _ChunkIndex (line 412)
+            - _load_documents_basic(file_paths: List[Union[str, Path]], source_ids: Optional[List[str]] = None) -> List[EnhancedChunk] (line 457)
+            - _load_document_basic(file_path: Path, source_id: str) -> List[EnhancedChunk] (line 466)
+            - _update_content_stats() (line 475)
+            - get_enhanced_response(query: str, content_types: Optional[List[ContentType]] = None, max_chunks: int = 10) -> str (line 483)
+            - get_enhanced_responses(queries: List[str], content_types: Optional[List[ContentType]] = None, max_chunks: int = 10, concurrency: int = QUERY_BATCH_WORKERS) -> List[str] (line 535)
+            - _filter_chunks_by_type(content_types: Optional[List[ContentType]]) -> List[EnhancedChunk] (line 562)
+            - _iter_chunks_by_type(content_types: Optional[List[ContentType]]) -> Iterator[EnhancedChunk] (line 570)
+            - _build_context_from_chunks(chunks: List[EnhancedChunk]) -> str (line 590)
+            - _generate_enhanced_response(query: str, context: str) -> str (line 624)
+            - _generate_response_with_prompt(prompt: str) -> str (line 633)
+            - get_mathematical_chunks() -> List[EnhancedChunk] (line 639)
+            - get_asset_chunks() -> List[EnhancedChunk] (line 646)
+            - get_glossary_chunks() -> List[EnhancedChunk] (line 653)
+            - get_chunks_by_type(content_type: ContentType) -> List[EnhancedChunk] (line 660)
+            - get_processing_stats() -> Dict[str, Any] (line 669)
+            - export_enhanced_chunks(format: str = 'json', out: Optional[TextIO] = None) -> Optional[str] (line 681)
+            - validate_enhanced_chunks() -> Dict[str, Any] (line 744)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Enhanced SciRAG Base Class
@@ -30,11 +41,20 @@ This module provides an enhanced version of SciRAG that integrates
 RAGBook's advanced document processing capabilities while maintaining
 backward compatibility with existing SciRAG functionality.
 """
+import csv
+import hashlib
+import io
+import itertools
 import logging
+import operator
+import threading
 import time
+from collections import OrderedDict, defaultdict
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, TextIO, Union, Tuple
+from dataclasses import dataclass, field, fields
+
+import numpy as np
 
 # Import enhanced processing modules
 try:
@@ -42,6 +62,8 @@ try:
         EnhancedDocumentProcessor, EnhancedChunk, ContentType,
         MathematicalContent, AssetContent, GlossaryContent
     )
+    # Compact JSON encoder for one exported record
+    from .enhanced_processing.document_processor import _dumps_json
     ENHANCED_PROCESSING_AVAILABLE = True
 except ImportError:
     ENHANCED_PROCESSING_AVAILABLE = False
@@ -51,11 +73,21 @@ except ImportError:
     ContentType = None
 
 # Import original SciRAG components
-from .scirag import SciRag
+from .scirag import SciRag, QUERY_BATCH_WORKERS
 from .config import enhanced_config
 
 
-@dataclass
+_CSV_HEADER = ['id', 'text', 'content_type', 'confidence', 'source_id']
+
+# Answers kept per instance for repeated get_enhanced_response calls
+ENHANCED_RESPONSE_CACHE_SIZE = 1024
+
+# Built context strings kept per chunk index, for chunk selections that
+# recur across different queries
+CONTEXT_CACHE_SIZE = 256
+
+
+@dataclass(slots=True)
 class EnhancedProcessingStats:
     """Statistics for enhanced processing operations."""
     documents_processed: int = 0
@@ -65,6 +97,66 @@ class EnhancedProcessingStats:
     glossary_terms_extracted: int = 0
     processing_time: float = 0.0
     errors: int = 0
+    duplicate_chunks_removed: int = 0
+
+
+# EnhancedProcessingStats counters, read together in one call
+_PROCESSING_STAT_FIELDS = tuple(f.name for f in fields(EnhancedProcessingStats))
+_get_processing_stat_values = operator.attrgetter(*_PROCESSING_STAT_FIELDS)
+
+
+@dataclass
+class _ChunkIndex:
+    """Lookups over enhanced_chunks, built in one pass when first needed."""
+    # Content type -> int64 array of positions in enhanced_chunks, ascending
+    positions_by_type: Dict[Any, np.ndarray] = field(default_factory=dict)
+    mathematical: List[EnhancedChunk] = field(default_factory=list)
+    assets: List[EnhancedChunk] = field(default_factory=list)
+    glossary: List[EnhancedChunk] = field(default_factory=list)
+    # Chunks with an id, text and source_id, counted by content type value
+    valid_distribution: Dict[str, int] = field(default_factory=dict)
+    invalid: int = 0
+    # id(chunk) -> (chunk, retrieval text), filled as contexts are built;
+    # holding the chunk keeps its id from being reused
+    retrieval_texts: Dict[int, Tuple[EnhancedChunk, str]] = field(default_factory=dict)
+    # Tuple of chunk ids -> (chunks, context), least recently used first
+    contexts: OrderedDict = field(default_factory=OrderedDict)
+    # _ChunkList.version of the chunks this index was built from
+    version: int = -1
+
+
+# Version stamps for _ChunkList contents, never reused across lists
+_chunk_list_versions = itertools.count()
+
+
+class _ChunkList(list):
+    """List of enhanced chunks that takes a new version on every change."""
+    __slots__ = ('version',)
+
+    def __init__(self, chunks=()):
+        super().__init__(chunks)
+        self.version = next(_chunk_list_versions)
+
+
+def _restamping(name: str):
+    """Wrap the list method name to give the list a new version after it runs."""
+    method = getattr(list, name)
+
+    def mutate(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            # Stamped after the change, so a reader that saw the old
+            # version rebuilds again instead of keeping stale lookups
+            self.version = next(_chunk_list_versions)
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append',
+              'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(_ChunkList, _name, _restamping(_name))
+del _name
 
 
 class SciRagEnhanced(SciRag):
@@ -93,6 +185,7 @@ class SciRagEnhanced(SciRag):
                  chunk_overlap: int = 200,
                  # Fallback parameters
                  fallback_on_error: bool = True,
+                 deduplicate_chunks: bool = False,
                  **kwargs):
         """
         Initialize enhanced SciRAG with optional enhanced processing.
@@ -111,6 +204,7 @@ class SciRagEnhanced(SciRag):
             chunk_size: Target chunk size for enhanced chunking
             chunk_overlap: Overlap between chunks
             fallback_on_error: Fallback to original processing on errors
+            deduplicate_chunks: Drop chunks whose text repeats an earlier chunk
             **kwargs: Additional arguments passed to parent class
         """
         # Initialize parent class
@@ -139,12 +233,18 @@ class SciRagEnhanced(SciRag):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.fallback_on_error = fallback_on_error
+        self.deduplicate_chunks = deduplicate_chunks
 
         # Logging
         self.logger = logging.getLogger(__name__)
 
         # Enhanced processing components
         self.enhanced_processor = None
+        # Generated answers, least recently used first; cleared whenever
+        # enhanced_chunks is reassigned
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self._context_cache_lock = threading.Lock()
         self.enhanced_chunks = []
         self.processing_stats = EnhancedProcessingStats()
 
@@ -153,7 +253,8 @@ class SciRagEnhanced(SciRag):
             self._initialize_enhanced_processing()
 
         self.logger.info(
-            f"Enhanced SciRAG initialized with enhanced_processing={self.enable_enhanced_processing}")
+            "Enhanced SciRAG initialized with enhanced_processing=%s",
+            self.enable_enhanced_processing)
 
     def _initialize_enhanced_processing(self):
         """Initialize enhanced processing components."""
@@ -173,7 +274,7 @@ class SciRagEnhanced(SciRag):
                     "Enhanced processing not available, falling back to basic processing")
                 self.enable_enhanced_processing = False
         except Exception as e:
-            self.logger.error(f"Failed to initialize enhanced processing: {e}")
+            self.logger.error("Failed to initialize enhanced processing: %s", e)
             if self.fallback_on_error:
                 self.enable_enhanced_processing = False
                 self.logger.info("Falling back to basic processing")
@@ -182,16 +283,24 @@ class SciRagEnhanced(SciRag):
 
     def load_documents_enhanced(self,
                                 file_paths: List[Union[str, Path]],
-                                source_ids: Optional[List[str]] = None) -> List[EnhancedChunk]:
+                                source_ids: Optional[List[str]] = None,
+                                max_workers: Optional[int] = None,
+                                use_threads: bool = False) -> List[EnhancedChunk]:
         """
         Load documents with enhanced processing capabilities.
 
+        Documents are independent, so several are processed in parallel
+        across a process pool, each worker building its own processor once.
+
         Args:
             file_paths: List of file paths to process
             source_ids: Optional list of source IDs (defaults to file names)
+            max_workers: Number of workers (defaults to the CPU count);
+                1 processes the documents sequentially in this process
+            use_threads: Use a thread pool instead of a process pool
 
         Returns:
-            List of EnhancedChunk objects
+            List of EnhancedChunk objects, in input order
         """
         if not self.enable_enhanced_processing or not self.enhanced_processor:
             self.logger.warning(
@@ -201,32 +310,38 @@ class SciRagEnhanced(SciRag):
         try:
             start_time = time.time()
 
-            # Convert to Path objects
-            file_paths = [Path(fp) for fp in file_paths]
-
-            # Generate source IDs if not provided
+            # Pair each path, as a Path, with its source ID (defaulting to
+            # the file name) in a single pass
+            paths = (fp if isinstance(fp, Path) else Path(fp) for fp in file_paths)
             if source_ids is None:
-                source_ids = [fp.stem for fp in file_paths]
-
-            # Process documents
-            all_chunks = []
-            for file_path, source_id in zip(file_paths, source_ids):
-                try:
-                    chunks = self.enhanced_processor.process_document(
-                        file_path, source_id
-                    )
-                    all_chunks.extend(chunks)
+                jobs = [(fp, fp.stem) for fp in paths]
+            else:
+                jobs = list(zip(paths, source_ids))
+
+            # Process documents; chunk lists per document are concatenated
+            # once at the end
+            document_chunks = []
+            results = self.enhanced_processor.iter_processed_documents(
+                jobs, max_workers, use_threads)
+            for (file_path, source_id), (chunks, error) in zip(jobs, results):
+                if error is None:
+                    document_chunks.append(chunks)
                     self.processing_stats.documents_processed += 1
-                except Exception as e:
-                    self.logger.error(
-                        f"Error processing document {file_path}: {e}")
-                    self.processing_stats.errors += 1
+                    continue
 
-                    if self.fallback_on_error:
-                        # Fallback to basic processing for this document
-                        basic_chunks = self._load_document_basic(
-                            file_path, source_id)
-                        all_chunks.extend(basic_chunks)
+                self.logger.error(
+                    "Error processing document %s: %s", file_path, error)
+                self.processing_stats.errors += 1
+
+                if self.fallback_on_error:
+                    # Fallback to basic processing for this document
+                    basic_chunks = self._load_document_basic(
+                        file_path, source_id)
+                    document_chunks.append(basic_chunks)
+
+            all_chunks = list(itertools.chain.from_iterable(document_chunks))
+            if self.deduplicate_chunks:
+                all_chunks = self._deduplicate_chunks(all_chunks)
 
             # Update statistics
             self.enhanced_chunks = all_chunks
@@ -234,20 +349,111 @@ class SciRagEnhanced(SciRag):
             self.processing_stats.processing_time = time.time() - start_time
 
             # Count specialized content
-            self._update_content_stats(all_chunks)
+            self._update_content_stats()
 
             self.logger.info(
-                f"Enhanced processing completed: {len(all_chunks)} chunks created")
-            return all_chunks
+                "Enhanced processing completed: %d chunks created", len(all_chunks))
+            return self.enhanced_chunks
 
         except Exception as e:
-            self.logger.error(f"Enhanced processing failed: {e}")
+            self.logger.error("Enhanced processing failed: %s", e)
             if self.fallback_on_error:
                 self.logger.info("Falling back to basic processing")
                 return self._load_documents_basic(file_paths, source_ids)
             else:
                 raise
 
+    def _deduplicate_chunks(self, chunks: List[EnhancedChunk]) -> List[EnhancedChunk]:
+        """Keep the first chunk of each distinct text, in order."""
+        seen = set()
+        unique_chunks = []
+        for chunk in chunks:
+            digest = hashlib.blake2b(chunk.text.encode('utf-8'), digest_size=16).digest()
+            if digest not in seen:
+                seen.add(digest)
+                unique_chunks.append(chunk)
+        self.processing_stats.duplicate_chunks_removed += len(chunks) - len(unique_chunks)
+        return unique_chunks
+
+    @property
+    def enhanced_chunks(self) -> List[EnhancedChunk]:
+        """
+        Chunks produced by the last load_documents_enhanced call.
+
+        Adding, removing or replacing chunks in this list refreshes the
+        lookups built over it. After editing a chunk's fields in place,
+        assign the list back to enhanced_chunks.
+        """
+        return self._enhanced_chunks
+
+    @enhanced_chunks.setter
+    def enhanced_chunks(self, chunks: List[EnhancedChunk]):
+        self._enhanced_chunks = _ChunkList(chunks)
+        self._chunk_index = None
+        with self._response_cache_lock:
+            self._response_cache.clear()
+
+    def _get_cached_response(self, key: Tuple) -> Optional[str]:
+        """Return the cached answer for key, or None."""
+        with self._response_cache_lock:
+            response = self._response_cache.get(key)
+            if response is not None:
+                self._response_cache.move_to_end(key)
+            return response
+
+    def _cache_response(self, key: Tuple, response: str):
+        """Remember an answer, evicting the least recently used ones."""
+        with self._response_cache_lock:
+            self._response_cache[key] = response
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > ENHANCED_RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def _get_chunk_index(self) -> _ChunkIndex:
+        """Return the chunk lookups, rebuilding them after enhanced_chunks changed."""
+        chunks = self._enhanced_chunks
+        index = self._chunk_index
+        if index is None or index.version != chunks.version:
+            index = _ChunkIndex(version=chunks.version)
+            positions_by_type = defaultdict(list)
+            valid_distribution = defaultdict(int)
+            invalid = 0
+            # EnhancedChunk.is_mathematical/is_asset/is_glossary, inlined
+            # as enum identity checks
+            equation = ContentType.EQUATION
+            figure, table = ContentType.FIGURE, ContentType.TABLE
+            definition = ContentType.DEFINITION
+            for position, chunk in enumerate(chunks):
+                # A malformed chunk is counted invalid rather than failing
+                # every lookup
+                if (not isinstance(chunk, EnhancedChunk)
+                        or not isinstance(chunk.content_type, ContentType)):
+                    invalid += 1
+                    continue
+                content_type = chunk.content_type
+                positions_by_type[content_type].append(position)
+                if content_type is equation:
+                    if chunk.mathematical_content is not None:
+                        index.mathematical.append(chunk)
+                elif content_type is figure or content_type is table:
+                    if chunk.asset_content is not None:
+                        index.assets.append(chunk)
+                elif content_type is definition:
+                    if chunk.glossary_content is not None:
+                        index.glossary.append(chunk)
+                # Valid chunks also have an id, text and source_id
+                if chunk.id and chunk.text and chunk.source_id:
+                    valid_distribution[content_type.value] += 1
+                else:
+                    invalid += 1
+            index.valid_distribution = dict(valid_distribution)
+            index.invalid = invalid
+            index.positions_by_type = {
+                content_type: np.array(positions, dtype=np.int64)
+                for content_type, positions in positions_by_type.items()}
+            self._chunk_index = index
+        return index
+
     def _load_documents_basic(self,
                               file_paths: List[Union[str, Path]],
                               source_ids: Optional[List[str]] = None) -> List[EnhancedChunk]:
@@ -266,15 +472,13 @@ class SciRagEnhanced(SciRag):
         # For now, return empty list as placeholder
         return []
 
-    def _update_content_stats(self, chunks: List[EnhancedChunk]):
-        """Update content-specific statistics."""
-        for chunk in chunks:
-            if chunk.is_mathematical():
-                self.processing_stats.mathematical_content_processed += 1
-            if chunk.is_asset():
-                self.processing_stats.assets_processed += 1
-            if chunk.is_glossary():
-                self.processing_stats.glossary_terms_extracted += 1
+    def _update_content_stats(self):
+        """Update content-specific statistics for enhanced_chunks."""
+        # The chunk index pass already classifies every chunk
+        index = self._get_chunk_index()
+        self.processing_stats.mathematical_content_processed += len(index.mathematical)
+        self.processing_stats.assets_processed += len(index.assets)
+        self.processing_stats.glossary_terms_extracted += len(index.glossary)
 
     def get_enhanced_response(self,
                               query: str,
@@ -297,12 +501,19 @@ class SciRagEnhanced(SciRag):
             return self.get_response(query)
 
         try:
-            # Filter chunks by content type if specified
-            filtered_chunks = self._filter_chunks_by_type(content_types)
-
-            # Limit number of chunks
-            if len(filtered_chunks) > max_chunks:
-                filtered_chunks = filtered_chunks[:max_chunks]
+            # The filtered chunks don't depend on the order of content_types;
+            # answers from before enhanced_chunks last changed never match
+            cache_key = (self.enhanced_chunks.version, query,
+                         tuple(sorted({ct.value for ct in content_types or ()})),
+                         max_chunks)
+            response = self._get_cached_response(cache_key)
+            if response is not None:
+                return response
+
+            # Filter chunks by content type if specified, stopping once
+            # max_chunks are collected
+            filtered_chunks = list(itertools.islice(
+                self._iter_chunks_by_type(content_types), max_chunks))
 
             # Get context from filtered chunks
             context = self._build_context_from_chunks(filtered_chunks)
@@ -310,34 +521,105 @@ class SciRagEnhanced(SciRag):
             # Generate response using the context
             response = self._generate_enhanced_response(query, context)
 
+            self._cache_response(cache_key, response)
             return response
 
         except Exception as e:
-            self.logger.error(f"Enhanced response generation failed: {e}")
+            self.logger.error("Enhanced response generation failed: %s", e)
             if self.fallback_on_error:
                 self.logger.info("Falling back to basic response")
                 return self.get_response(query)
             else:
                 raise
 
+    def get_enhanced_responses(self,
+                               queries: List[str],
+                               content_types: Optional[List[ContentType]] = None,
+                               max_chunks: int = 10,
+                               concurrency: int = QUERY_BATCH_WORKERS) -> List[str]:
+        """
+        Answer several queries concurrently with get_enhanced_response.
+
+        Each query is an independent model request, so their network latency
+        overlaps; repeated queries are answered once.
+
+        Args:
+            queries: Query strings
+            content_types: Optional list of content types to filter by
+            max_chunks: Maximum number of chunks to use per query
+            concurrency: Maximum number of queries in flight
+
+        Returns:
+            Enhanced response strings, in the same order as queries
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        responses = self._map_queries(
+            lambda query: self.get_enhanced_response(query, content_types, max_chunks),
+            unique_queries, concurrency)
+        answers = dict(zip(unique_queries, responses))
+        return [answers[query] for query in queries]
+
     def _filter_chunks_by_type(
             self, content_types: Optional[List[ContentType]]) -> List[EnhancedChunk]:
         """Filter chunks by content type."""
         if not content_types:
             return self.enhanced_chunks
 
-        return [chunk for chunk in self.enhanced_chunks
-                if chunk.content_type in content_types]
+        return list(self._iter_chunks_by_type(content_types))
+
+    def _iter_chunks_by_type(
+            self, content_types: Optional[List[ContentType]]) -> Iterator[EnhancedChunk]:
+        """Lazily yield the chunks of the given content types, in corpus order."""
+        chunks = self.enhanced_chunks
+        if not content_types:
+            return iter(chunks)
+
+        positions_by_type = self._get_chunk_index().positions_by_type
+        arrays = [positions_by_type[content_type]
+                  for content_type in dict.fromkeys(content_types)
+                  if content_type in positions_by_type]
+        if not arrays:
+            return iter(())
+        if len(arrays) == 1:
+            positions = arrays[0]
+        else:
+            # Union of disjoint position sets, back in corpus order
+            positions = np.sort(np.concatenate(arrays))
+        return map(chunks.__getitem__, positions.tolist())
 
     def _build_context_from_chunks(self, chunks: List[EnhancedChunk]) -> str:
-        """Build context string from enhanced chunks."""
-        context_parts = []
+        """
+        Build context string from enhanced chunks.
 
+        Each chunk's retrieval text, and the context for each selection of
+        chunks, is built once and reused until enhanced_chunks changes.
+        """
+        # The entry holds the chunks, so their ids can't be reused
+        key = tuple(map(id, chunks))
+        index = self._get_chunk_index()
+        contexts = index.contexts
+        with self._context_cache_lock:
+            entry = contexts.get(key)
+            if entry is not None:
+                contexts.move_to_end(key)
+                return entry[1]
+
+        # Collect each chunk's retrieval text (text plus metadata) so join
+        # sizes the result once and copies every piece a single time
+        retrieval_texts = index.retrieval_texts
+        texts = []
         for chunk in chunks:
-            # Use enhanced retrieval text that includes metadata
-            context_parts.append(chunk.get_retrieval_text())
-
-        return "\n\n".join(context_parts)
+            entry = retrieval_texts.get(id(chunk))
+            if entry is None or entry[0] is not chunk:
+                entry = retrieval_texts[id(chunk)] = (chunk, chunk.get_retrieval_text())
+            texts.append(entry[1])
+        context = "\n\n".join(texts)
+
+        with self._context_cache_lock:
+            contexts[key] = (tuple(chunks), context)
+            while len(contexts) > CONTEXT_CACHE_SIZE:
+                contexts.popitem(last=False)
+        return context
 
     def _generate_enhanced_response(self, query: str, context: str) -> str:
         """Generate response using enhanced context."""
@@ -359,21 +641,21 @@ class SciRagEnhanced(SciRag):
         if not self.enhanced_chunks:
             return []
 
-        return [chunk for chunk in self.enhanced_chunks if chunk.is_mathematical()]
+        return list(self._get_chunk_index().mathematical)
 
     def get_asset_chunks(self) -> List[EnhancedChunk]:
         """Get chunks containing asset content."""
         if not self.enhanced_chunks:
             return []
 
-        return [chunk for chunk in self.enhanced_chunks if chunk.is_asset()]
+        return list(self._get_chunk_index().assets)
 
     def get_glossary_chunks(self) -> List[EnhancedChunk]:
         """Get chunks containing glossary content."""
         if not self.enhanced_chunks:
             return []
 
-        return [chunk for chunk in self.enhanced_chunks if chunk.is_glossary()]
+        return list(self._get_chunk_index().glossary)
 
     def get_chunks_by_type(
             self,
@@ -382,48 +664,70 @@ class SciRagEnhanced(SciRag):
         if not self.enhanced_chunks:
             return []
 
-        return [chunk for chunk in self.enhanced_chunks
-                if chunk.content_type == content_type]
+        return list(self._iter_chunks_by_type([content_type]))
 
     def get_processing_stats(self) -> Dict[str, Any]:
         """Get enhanced processing statistics."""
-        return {
+        stats = {
             'enhanced_processing_enabled': self.enable_enhanced_processing,
             'mathematical_processing_enabled': self.enable_mathematical_processing,
             'asset_processing_enabled': self.enable_asset_processing,
             'glossary_extraction_enabled': self.enable_glossary_extraction,
-            'enhanced_chunking_enabled': self.enable_enhanced_chunking,
-            'documents_processed': self.processing_stats.documents_processed,
-            'chunks_created': self.processing_stats.chunks_created,
-            'mathematical_content_processed': self.processing_stats.mathematical_content_processed,
-            'assets_processed': self.processing_stats.assets_processed,
-            'glossary_terms_extracted': self.processing_stats.glossary_terms_extracted,
-            'processing_time': self.processing_stats.processing_time,
-            'errors': self.processing_stats.errors}
-
-    def export_enhanced_chunks(self, format: str = 'json') -> str:
-        """Export enhanced chunks in specified format."""
+            'enhanced_chunking_enabled': self.enable_enhanced_chunking}
+        stats.update(zip(_PROCESSING_STAT_FIELDS,
+                         _get_processing_stat_values(self.processing_stats)))
+        return stats
+
+    def export_enhanced_chunks(self, format: str = 'json',
+                               out: Optional[TextIO] = None) -> Optional[str]:
+        """
+        Export enhanced chunks in specified format.
+
+        Chunks are serialized one at a time, so no copy of the whole export
+        is held in memory when writing to a file. JSON is written as an
+        array with one chunk per line, using orjson when it is installed.
+
+        Args:
+            format: Export format ('json' or 'csv')
+            out: Writable text file object (open CSV files with newline='');
+                when omitted the export is returned as a string
+
+        Returns:
+            The exported string, or None when written to out
+        """
+        export_format = format.lower()
         if not self.enhanced_chunks:
-            if format.lower() == 'json':
-                return "[]"
-            elif format.lower() == 'csv':
-                return "id,text,content_type,confidence,source_id\n"
+            if export_format == 'json':
+                result = "[]"
+            elif export_format == 'csv':
+                result = "id,text,content_type,confidence,source_id\n"
             else:
                 return "No enhanced chunks available"
+            if out is None:
+                return result
+            out.write(result)
+            return None
+
+        if export_format not in ('json', 'csv'):
+            raise ValueError(f"Unsupported export format: {format}")
 
-        if format.lower() == 'json':
-            import json
-            return json.dumps([chunk.to_dict()
-                              for chunk in self.enhanced_chunks], indent=2)
-        elif format.lower() == 'csv':
-            import csv
-            import io
-            output = io.StringIO()
-            writer = csv.writer(output)
+        buffer = None
+        if out is None:
+            out = buffer = io.StringIO(newline='')
+
+        if export_format == 'json':
+            out.write('[')
+            separator = '\n'
+            for chunk in self.enhanced_chunks:
+                out.write(separator)
+                out.write(_dumps_json(chunk.to_dict()))
+                separator = ',\n'
+            out.write('\n]')
+        else:
+            writer = csv.writer(out)
 
             # Write header
-            writer.writerow(['id', 'text', 'content_type',
-                            'confidence', 'source_id'])
+            writer.writerow(_CSV_HEADER)
 
             # Write data
             for chunk in self.enhanced_chunks:
@@ -435,9 +739,7 @@ class SciRagEnhanced(SciRag):
                     chunk.source_id
                 ])
 
-            return output.getvalue()
-        else:
-            raise ValueError(f"Unsupported export format: {format}")
+        return buffer.getvalue() if buffer is not None else None
 
     def validate_enhanced_chunks(self) -> Dict[str, Any]:
         """Validate enhanced chunks for quality and consistency."""
@@ -449,30 +751,23 @@ class SciRagEnhanced(SciRag):
                 'content_type_distribution': {}
             }
 
-        valid_chunks = 0
-        invalid_chunks = 0
-        content_type_distribution = {}
-
-        for chunk in self.enhanced_chunks:
-            try:
-                # Basic validation
-                if not chunk.id or not chunk.text or not chunk.source_id:
-                    invalid_chunks += 1
-                    continue
-
-                # Content type distribution
-                content_type = chunk.content_type.value
-                content_type_distribution[content_type] = content_type_distribution.get(
-                    content_type, 0) + 1
-
-                valid_chunks += 1
-
-            except Exception:
-                invalid_chunks += 1
+        # Validity is checked once per chunk when the index is built; only
+        # structural corruption of the chunk list itself raises here
+        try:
+            index = self._get_chunk_index()
+        except Exception as e:
+            self.logger.error("Chunk validation failed: %s", e)
+            return {
+                'total_chunks': len(self.enhanced_chunks),
+                'valid_chunks': 0,
+                'invalid_chunks': len(self.enhanced_chunks),
+                'content_type_distribution': {},
+                'error': str(e)
+            }
 
         return {
             'total_chunks': len(self.enhanced_chunks),
-            'valid_chunks': valid_chunks,
-            'invalid_chunks': invalid_chunks,
-            'content_type_distribution': content_type_distribution
+            'valid_chunks': sum(index.valid_distribution.values()),
+            'invalid_chunks': index.invalid,
+            'content_type_distribution': dict(index.valid_distribution)
         }
\ No newline at end of file
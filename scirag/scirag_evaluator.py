@@ -3,41 +3,57 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - ResponseEvaluation (line 41):
-        - AIEvaluator (line 52):
-            - _create_ai_judge_agent() -> AssistantAgent (line 65)
-            - _create_user_proxy_agent() -> UserProxyAgent (line 107)
-            - evaluate_single_response(question: str, generated_answer: str, ideal_answer: str, sources: Optional[List[str]] = None, system_name: str = 'RAG System') -> Dict[str, Any] (line 117)
-            - _create_error_result(error_msg: str) -> Dict[str, Any] (line 202)
-        - GeminiEvaluator (line 211):
-            - _count_tokens(text: str) -> int (line 246)
-            - _check_rate_limits(text: str) (line 256)
-            - _exponential_backoff_sleep(attempt: int, base_error: str = '') -> float (line 296)
-            - _initialize_gemini() (line 313)
-            - _get_system_instruction() -> str (line 369)
-            - evaluate_single_response(question: str, generated_answer: str, ideal_answer: str, sources: Optional[List[str]] = None, system_name: str = 'RAG System') -> Dict[str, Any] (line 393)
-            - _create_error_result(error_msg: str) -> Dict[str, Any] (line 516)
-            - get_rate_limit_status() -> Dict[str, Any] (line 525)
-        - SingleRAGEvaluationSystem (line 545):
-            - check_required_columns(df: pd.DataFrame) -> bool (line 591)
-            - evaluate_single_dataframe(df: pd.DataFrame, system_name: str, max_evaluations: Optional[int] = None, save_results: bool = True) -> pd.DataFrame (line 612)
-            - _save_individual_results(df: pd.DataFrame, system_name: str) (line 766)
+        - ResponseEvaluation (line 57):
+        - AIEvaluator (line 105):
+            - evaluate_single_response(question: str, generated_answer: str, ideal_answer: str, sources: Optional[List[str]] = None, system_name: str = 'RAG System') -> Dict[str, Any] (line 126)
+            - aevaluate_single_response(question: str, generated_answer: str, ideal_answer: str, sources: Optional[List[str]] = None, system_name: str = 'RAG System', client: Optional[AsyncOpenAI] = None) -> Dict[str, Any] (line 152)
+            - evaluate_batch(evaluations: List[Tuple[str, str, str]], poll_interval: float = 30.0) -> List[Dict[str, Any]] (line 191)
+            - _build_evaluation_task(question: str, generated_answer: str, ideal_answer: str) -> str (line 272)
+            - _build_request(evaluation_task: str) -> Dict[str, Any] (line 296)
+            - _cache_path(request: Dict[str, Any]) -> Optional[str] (line 309)
+            - _load_cached(cache_path: Optional[str]) -> Optional[Dict[str, Any]] (line 318)
+            - _store_cached(cache_path: Optional[str], evaluation_result: Dict[str, Any]) (line 329)
+            - _parse_response(response) -> Dict[str, Any] (line 348)
+            - _parse_evaluation(arguments: str) -> Dict[str, Any] (line 356)
+            - _create_error_result(error_msg: str) -> Dict[str, Any] (line 377)
+        - GeminiEvaluator (line 386):
+            - _count_tokens(text: str) -> int (line 421)
+            - _check_rate_limits(text: str) (line 431)
+            - _exponential_backoff_sleep(attempt: int, base_error: str = '') -> float (line 471)
+            - _initialize_gemini() (line 488)
+            - _get_system_instruction() -> str (line 544)
+            - evaluate_single_response(question: str, generated_answer: str, ideal_answer: str, sources: Optional[List[str]] = None, system_name: str = 'RAG System') -> Dict[str, Any] (line 568)
+            - _create_error_result(error_msg: str) -> Dict[str, Any] (line 691)
+            - get_rate_limit_status() -> Dict[str, Any] (line 700)
+        - SingleRAGEvaluationSystem (line 720):
+            - check_required_columns(df: pd.DataFrame) -> bool (line 766)
+            - evaluate_single_dataframe(df: pd.DataFrame, system_name: str, max_evaluations: Optional[int] = None, save_results: bool = True, max_concurrency: int = 16, mode: str = 'online') -> pd.DataFrame (line 787)
+            - _evaluate_jobs(jobs: List[Tuple], system_name: str, max_concurrency: int, on_result: Optional[Callable[[Any, Dict[str, Any]], None]] = None) -> List[Dict[str, Any]] (line 1003)
+            - _aevaluate_jobs(jobs: List[Tuple], system_name: str, max_concurrency: int, on_result: Optional[Callable[[Any, Dict[str, Any]], None]] = None) -> List[Dict[str, Any]] (line 1046)
+            - _print_evaluation(evaluation_result: Dict[str, Any]) (line 1077)
+            - _save_individual_results(df: pd.DataFrame, system_name: str) (line 1085)
     --- END AUTO-GENERATED DOCSTRING ---
 """
 import pandas as pd
+import asyncio
+import hashlib
 import time
 import json
 import os
+import tempfile
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple, Union
+from typing import Dict, Any, Optional, List, Tuple, Union, Callable
 from pydantic import BaseModel, Field
-import autogen
-from autogen import UserProxyAgent, AssistantAgent
+from openai import OpenAI, AsyncOpenAI
+from openai.types.chat import ChatCompletion
 import tiktoken
 # Use the new Google Gen AI SDK
 import google.generativeai as genai
 from google.oauth2 import service_account
 
+# Streamed evaluation results are flushed to disk every this many rows
+RESULTS_FLUSH_INTERVAL = 200
+
 class ResponseEvaluation(BaseModel):
     """Structured evaluation of a scientific response"""
     accuracy_score: int = Field(
@@ -49,22 +65,11 @@ class ResponseEvaluation(BaseModel):
         description="Brief explanation of the evaluation scores and comparison with ideal answer"
     )
 
-class AIEvaluator:
-    """AI Evaluator for RAG system performance using AG2 (AutoGen 2)"""
-    
-    def __init__(self, model: str = "gpt-4o", temperature: float = 0.1):
-        """Initialize the AI Evaluator"""
-        self.model = model
-        self.temperature = temperature
-        self.ai_judge = self._create_ai_judge_agent()
-        self.user_proxy = self._create_user_proxy_agent()
-        
-        # Disable Docker for AutoGen
-        os.environ["AUTOGEN_USE_DOCKER"] = "False"
-    
-    def _create_ai_judge_agent(self) -> AssistantAgent:
-        """Create and configure the AI judge agent"""
-        system_message = """You are an expert scientific evaluator assessing the quality of scientific response against reference answers.
+# The judge's prompt and tool spec are the same for every evaluator, so
+# they are built once per process
+_RESPONSE_SCHEMA = ResponseEvaluation.model_json_schema()
+
+_JUDGE_SYSTEM_MSG = """You are an expert scientific evaluator assessing the quality of scientific response against reference answers.
 
 Your task is to evaluate responses using one critical criterion:
 
@@ -85,34 +90,38 @@ EVALUATION GUIDELINES:
 - Award 100 if the answer captures the essential correct scientific understanding
 
 Provide your evaluation using the evaluate_response function with the numerical score and detailed rationale explaining why you chose 100 or 0."""
-        
-        return AssistantAgent(
-            name="ai_judge",
-            system_message=system_message,
-            llm_config={
-                "model": self.model,
-                "tools": [
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": "evaluate_response",
-                            "description": "Evaluate a scientific response",
-                            "parameters": ResponseEvaluation.model_json_schema()
-                        }
-                    }
-                ]
-            }
-        )
+
+_JUDGE_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "evaluate_response",
+            "description": "Evaluate a scientific response",
+            "parameters": _RESPONSE_SCHEMA
+        }
+    }
+]
+
+class AIEvaluator:
+    """AI Evaluator for RAG system performance using OpenAI chat completions"""
     
-    def _create_user_proxy_agent(self) -> UserProxyAgent:
-        """Create and configure the user proxy agent"""
-        return UserProxyAgent(
-            name="user",
-            human_input_mode="NEVER",
-            max_consecutive_auto_reply=1,
-            is_termination_msg=lambda x: True,
-            code_execution_config={"use_docker": False}
-        )
+    def __init__(self, model: str = "gpt-4o", temperature: float = 0.1, cache_dir: Optional[str] = None):
+        """
+        Initialize the AI Evaluator
+        
+        Args:
+            model: OpenAI model used as the judge
+            temperature: Sampling temperature for the judge
+            cache_dir: Directory to cache successful evaluations in, keyed by
+                the full judge request, so repeated runs skip the API (None
+                disables caching)
+        """
+        self.model = model
+        self.temperature = temperature
+        self.cache_dir = cache_dir
+        self.client = OpenAI()
+        self.system_msg = _JUDGE_SYSTEM_MSG
+        self.tools = _JUDGE_TOOLS
     
     def evaluate_single_response(
         self,
@@ -124,10 +133,149 @@ Provide your evaluation using the evaluate_response function with the numerical
     ) -> Dict[str, Any]:
         """Evaluate a single RAG response"""
         
+        request = self._build_request(self._build_evaluation_task(question, generated_answer, ideal_answer))
+        cache_path = self._cache_path(request)
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = self.client.chat.completions.create(**request)
+            evaluation_result = self._parse_response(response)
+                
+        except Exception as e:
+            return self._create_error_result(f"Evaluation failed: {str(e)}")
+        
+        self._store_cached(cache_path, evaluation_result)
+        return evaluation_result
+    
+    async def aevaluate_single_response(
+        self,
+        question: str,
+        generated_answer: str,
+        ideal_answer: str,
+        sources: Optional[List[str]] = None,
+        system_name: str = "RAG System",
+        client: Optional[AsyncOpenAI] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate a single RAG response without blocking the event loop
+        
+        Args:
+            client: Async client to send the request with. The client is bound
+                to the event loop it is first used in, so share one across a
+                batch; a short-lived client is opened when omitted.
+        """
+        if client is None:
+            async with AsyncOpenAI() as client:
+                return await self.aevaluate_single_response(
+                    question, generated_answer, ideal_answer, sources, system_name, client
+                )
+        
+        request = self._build_request(self._build_evaluation_task(question, generated_answer, ideal_answer))
+        cache_path = self._cache_path(request)
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await client.chat.completions.create(**request)
+            evaluation_result = self._parse_response(response)
+                
+        except Exception as e:
+            return self._create_error_result(f"Evaluation failed: {str(e)}")
+        
+        self._store_cached(cache_path, evaluation_result)
+        return evaluation_result
+    
+    def evaluate_batch(
+        self,
+        evaluations: List[Tuple[str, str, str]],
+        poll_interval: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate many responses through the OpenAI Batch API
+        
+        Batch requests cost half as much as direct ones but may take up to
+        24 hours to complete; this blocks until the batch finishes.
+        
+        Args:
+            evaluations: (question, generated_answer, ideal_answer) triples
+            poll_interval: Seconds to wait between batch status checks
+            
+        Returns:
+            Evaluation results in the same order as `evaluations`
+        """
+        results = [None] * len(evaluations)
+        cache_paths = [None] * len(evaluations)
+        
+        # Each request is identified by its position in `evaluations`;
+        # cached evaluations are not submitted again
+        lines = []
+        for position, (question, generated_answer, ideal_answer) in enumerate(evaluations):
+            request = self._build_request(self._build_evaluation_task(question, generated_answer, ideal_answer))
+            cache_paths[position] = self._cache_path(request)
+            results[position] = self._load_cached(cache_paths[position])
+            if results[position] is None:
+                lines.append(json.dumps({
+                    "custom_id": str(position),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": request
+                }))
+        
+        if not lines:
+            return results
+        
+        try:
+            input_file = self.client.files.create(
+                file=("evaluations.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            print(f"Submitted batch {batch.id} with {len(lines)} evaluations")
+            
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+            print(f"Batch {batch.id} finished with status: {batch.status}")
+            
+            # Successful requests land in the output file, failed ones in the error file
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if not file_id:
+                    continue
+                for line in self.client.files.content(file_id).text.splitlines():
+                    record = json.loads(line)
+                    response = record.get("response") or {}
+                    if response.get("status_code") == 200:
+                        result = self._parse_response(ChatCompletion.model_validate(response["body"]))
+                    else:
+                        error = record.get("error") or response.get("body", {}).get("error")
+                        result = self._create_error_result(f"Evaluation failed: {error}")
+                    position = int(record["custom_id"])
+                    results[position] = result
+                    self._store_cached(cache_paths[position], result)
+            missing_error = f"No evaluation result obtained (batch {batch.status})"
+                
+        except Exception as e:
+            missing_error = f"Batch evaluation failed: {str(e)}"
+        
+        return [
+            result if result is not None else self._create_error_result(missing_error)
+            for result in results
+        ]
+    
+    def _build_evaluation_task(self, question: str, generated_answer: str, ideal_answer: str) -> str:
+        """Build the judge prompt for one response"""
+        
         # Format sources for citation evaluation
         # sources_text = "\n".join(sources) if sources else "No sources provided"
         
-        evaluation_task = f"""
+        return f"""
 Please evaluate this system's response against the ideal answer:
 
 QUESTION: {question}
@@ -144,60 +292,87 @@ Accuracy (0-100): How factually correct is the answer compared to the ideal?
 
 Use the evaluate_response function to provide your structured evaluation with detailed rationale.
 """
+    
+    def _build_request(self, evaluation_task: str) -> Dict[str, Any]:
+        """Build the chat completion arguments, forcing the evaluate_response tool"""
+        return {
+            "model": self.model,
+            "temperature": self.temperature,
+            "messages": [
+                {"role": "system", "content": self.system_msg},
+                {"role": "user", "content": evaluation_task}
+            ],
+            "tools": self.tools,
+            "tool_choice": {"type": "function", "function": {"name": "evaluate_response"}}
+        }
+    
+    def _cache_path(self, request: Dict[str, Any]) -> Optional[str]:
+        """Return the cache file for a judge request, or None when caching is off"""
+        if self.cache_dir is None:
+            return None
+        
+        key = hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+        # Split across subdirectories so no single directory grows too large
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+    
+    def _load_cached(self, cache_path: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached evaluation at cache_path, if there is one"""
+        if cache_path is None:
+            return None
         
         try:
-            # Reset agents for fresh evaluation
-            self.user_proxy.reset()
-            self.ai_judge.reset()
-            
-            # Initiate the evaluation chat
-            self.user_proxy.initiate_chat(
-                self.ai_judge,
-                message=evaluation_task,
-                max_turns=1
-            )
-            
-            # Extract evaluation results
-            last_message = self.ai_judge.last_message()
-            evaluation_result = None
-            
-            if last_message and "tool_calls" in last_message:
-                tool_calls = last_message["tool_calls"]
-                if tool_calls and len(tool_calls) > 0:
-                    tool_call = tool_calls[0]
-                    if tool_call.get("function", {}).get("name") == "evaluate_response":
-                        try:
-                            evaluation_result = json.loads(tool_call["function"].get("arguments", "{}"))
-                        except json.JSONDecodeError as e:
-                            print(f"Failed to parse evaluation: {e}")
-                            return self._create_error_result(f"Parse error: {e}")
-            
-            # Fallback to old function_call format for compatibility
-            elif last_message and "function_call" in last_message:
-                function_call = last_message["function_call"]
-                if function_call.get("name") == "evaluate_response":
-                    try:
-                        evaluation_result = json.loads(function_call.get("arguments", "{}"))
-                    except json.JSONDecodeError as e:
-                        print(f"Failed to parse evaluation: {e}")
-                        return self._create_error_result(f"Parse error: {e}")
-            
-            if evaluation_result:
-                # Calculate composite score
-                accuracy_score = evaluation_result.get('accuracy_score', 0)
-            
-                
-                return {
-                    "eval_accuracy_score": accuracy_score,
-                    "eval_rationale": evaluation_result.get('rationale', ''),
-                    "eval_successful": True,
-                    "eval_error": None
-                }
-            else:
-                return self._create_error_result("No evaluation result obtained")
-                
-        except Exception as e:
-            return self._create_error_result(f"Evaluation failed: {str(e)}")
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _store_cached(self, cache_path: Optional[str], evaluation_result: Dict[str, Any]):
+        """Cache a successful evaluation, replacing the file atomically"""
+        if cache_path is None or not evaluation_result.get("eval_successful"):
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=os.path.dirname(cache_path), suffix=".tmp", delete=False
+            ) as f:
+                json.dump(evaluation_result, f)
+            try:
+                os.replace(f.name, cache_path)
+            except OSError:
+                os.unlink(f.name)
+                raise
+        except OSError as e:
+            print(f"Failed to cache evaluation: {e}")
+    
+    def _parse_response(self, response) -> Dict[str, Any]:
+        """Extract the evaluation from a chat completion response"""
+        tool_calls = response.choices[0].message.tool_calls
+        if tool_calls and tool_calls[0].function.name == "evaluate_response":
+            return self._parse_evaluation(tool_calls[0].function.arguments)
+        
+        return self._create_error_result("No evaluation result obtained")
+    
+    def _parse_evaluation(self, arguments: str) -> Dict[str, Any]:
+        """Turn the evaluate_response tool arguments into an evaluation result"""
+        try:
+            evaluation_result = json.loads(arguments)
+        except json.JSONDecodeError as e:
+            print(f"Failed to parse evaluation: {e}")
+            return self._create_error_result(f"Parse error: {e}")
+        
+        if not evaluation_result:
+            return self._create_error_result("No evaluation result obtained")
+        
+        # Calculate composite score
+        accuracy_score = evaluation_result.get('accuracy_score', 0)
+        
+        return {
+            "eval_accuracy_score": accuracy_score,
+            "eval_rationale": evaluation_result.get('rationale', ''),
+            "eval_successful": True,
+            "eval_error": None
+        }
     
     def _create_error_result(self, error_msg: str) -> Dict[str, Any]:
         """Create a standardized error result"""
@@ -564,7 +739,7 @@ class SingleRAGEvaluationSystem:
         self.evaluator_backend = evaluator_backend.lower()
         
         if self.evaluator_backend == "autogen":
-            # Use original AutoGen implementation
+            # Use the OpenAI judge (the backend keeps its original AutoGen name)
             self.evaluator = AIEvaluator(model=evaluator_model, **evaluator_kwargs)
         elif self.evaluator_backend == "gemini":
             # Use new Gemini implementation
@@ -614,7 +789,9 @@ class SingleRAGEvaluationSystem:
         df: pd.DataFrame, 
         system_name: str,
         max_evaluations: Optional[int] = None,
-        save_results: bool = True
+        save_results: bool = True,
+        max_concurrency: int = 16,
+        mode: str = "online"
     ) -> pd.DataFrame:
         """
         Evaluate a single RAG system dataframe with known column structure
@@ -628,11 +805,22 @@ class SingleRAGEvaluationSystem:
                 - success: Success flag (optional)
             system_name: Name of the RAG system for identification
             max_evaluations: Maximum number of evaluations to perform (None for all)
-            save_results: Whether to save results to file
+            save_results: Whether to save results to file; rows are written in
+                input order as soon as they and every earlier row are
+                evaluated, so an interrupted run keeps them
+            max_concurrency: Maximum number of judge requests in flight at once
+                with the autogen backend (1 evaluates one row at a time)
+            mode: "online" to send requests directly, or "batch" to submit them
+                all through the OpenAI Batch API (autogen backend only)
             
         Returns:
             DataFrame with evaluation results added
         """
+        if mode not in ("online", "batch"):
+            raise ValueError(f"Unknown mode: {mode}. Must be 'online' or 'batch'")
+        if mode == "batch" and self.evaluator_backend != "autogen":
+            raise ValueError("Batch mode requires the 'autogen' evaluator_backend")
+        
         print(f"\n{'='*60}")
         print(f"EVALUATING: {system_name} (using {self.evaluator_backend} backend)")
         print(f"{'='*60}")
@@ -646,24 +834,25 @@ class SingleRAGEvaluationSystem:
         # Create a copy of the dataframe
         eval_df = df.copy()
         
-        # Filter to successful responses if success column exists
+        # Filter to successful responses if success column exists, otherwise
+        # check for non-null answers and ideals; build one mask, select once
         if 'success' in df.columns:
-            evaluable_rows = eval_df[eval_df['success'] == True]
-            print(f"Filtering by success column: {len(evaluable_rows)} successful out of {len(eval_df)} total")
+            mask = (eval_df['success'] == True).to_numpy(dtype=bool, na_value=False)
+            filter_summary = f"Filtering by success column: {mask.sum()} successful out of {len(eval_df)} total"
         else:
-            # Check for non-null answers and ideals
+            mask = eval_df['ideal_solution'].notna().to_numpy()
             if 'answer' in df.columns:
-                evaluable_rows = eval_df[
-                    eval_df['ideal_solution'].notna() & 
-                    eval_df['answer'].notna()
-                ]
-            else:
-                evaluable_rows = eval_df[eval_df['ideal_solution'].notna()]
-            print(f"No success column found, filtering by non-null values: {len(evaluable_rows)} evaluable rows")
+                mask = mask & eval_df['answer'].notna().to_numpy()
+            filter_summary = f"No success column found, filtering by non-null values: {mask.sum()} evaluable rows"
+        # Rows are tracked by position, since index labels may repeat
+        evaluable_positions = mask.nonzero()[0].tolist()
+        evaluable_rows = eval_df.iloc[evaluable_positions]
+        print(filter_summary)
         
         # Limit evaluations if requested
         if max_evaluations:
             evaluable_rows = evaluable_rows.head(max_evaluations)
+            evaluable_positions = evaluable_positions[:max_evaluations]
             print(f"Limited to: {len(evaluable_rows)} evaluations")
         
         if len(evaluable_rows) == 0:
@@ -675,30 +864,34 @@ class SingleRAGEvaluationSystem:
             "eval_accuracy_score", "eval_rationale", "eval_successful", "eval_error",
             "eval_processing_time"
         ]
-        for col in eval_columns:
-            eval_df[col] = None
+        eval_df = eval_df.assign(**dict.fromkeys(eval_columns))
         
         # Show rate limit status for Gemini
         if self.evaluator_backend == "gemini":
             status = self.evaluator.get_rate_limit_status()
             print(f"Rate limit status: {status['requests_used_this_minute']}/{status['max_requests_per_minute']} requests, {status['tokens_used_this_minute']}/{status['max_tokens_per_minute']} tokens")
         
-        # Perform evaluations
-        start_time = time.time()
-        successful_evaluations = 0
+        # Collect the rows that have an answer to evaluate; rows are plain
+        # tuples with the index first, so look up column positions once
+        positions = {column: position for position, column in enumerate(evaluable_rows.columns, 1)}
+        question_pos = positions['question']
+        ideal_pos = positions['ideal_solution']
+        answer_pos = positions.get('answer')
+        response_pos = positions.get('response')
+        question_id_pos = positions.get('question_id')
         
-        for idx, (_, row) in enumerate(evaluable_rows.iterrows(), 1):
-            print(f"\nEvaluating {idx}/{len(evaluable_rows)} - Question ID: {row.get('question_id', idx)}")
-            
+        jobs = []
+        for idx, (position, row) in enumerate(
+                zip(evaluable_positions, evaluable_rows.itertuples(index=True, name=None)), 1):
             # Extract data directly using known column names
-            question = row['question']
-            ideal = row['ideal_solution']
+            question = row[question_pos]
+            ideal = row[ideal_pos]
             
             # Get answer - prefer 'answer' column, fallback to 'response'
-            if 'answer' in df.columns and pd.notna(row['answer']):
-                answer = row['answer']
-            elif 'response' in df.columns and pd.notna(row['response']):
-                answer = row['response']
+            if answer_pos is not None and pd.notna(row[answer_pos]):
+                answer = row[answer_pos]
+            elif response_pos is not None and pd.notna(row[response_pos]):
+                answer = row[response_pos]
             else:
                 answer = ""
                 print(f"    Warning: No answer found for question {idx}")
@@ -708,29 +901,78 @@ class SingleRAGEvaluationSystem:
                 print(f"    ✗ Skipping - No answer available")
                 continue
             
-            # Perform evaluation
-            eval_start_time = time.time()
-            evaluation_result = self.evaluator.evaluate_single_response(
-                question=question,
-                generated_answer=answer,
-                ideal_answer=ideal,
-                system_name=system_name
-            )
-            eval_time = time.time() - eval_start_time
-            evaluation_result['eval_processing_time'] = eval_time
-            
-            # Update dataframe with results
-            row_idx = row.name  # Get the original index
-            for key, value in evaluation_result.items():
-                eval_df.at[row_idx, key] = value
-            
-            # Print progress
-            if evaluation_result.get('eval_successful'):
-                successful_evaluations += 1
-                print( f"Accuracy:{evaluation_result['eval_accuracy_score']}")
-                print(f"  Time: {eval_time:.2f}s")
+            question_id = row[question_id_pos] if question_id_pos is not None else idx
+            label = f"{idx}/{len(evaluable_rows)} - Question ID: {question_id}"
+            jobs.append((position, label, question, answer, ideal))
+        
+        # Stream rows to the results file in input order: a result waits in
+        # pending until every row before it has been written
+        results_file = None
+        if save_results:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"{system_name.replace(' ', '_').lower()}_evaluated_{timestamp}.csv"
+            filepath = os.path.join(self.results_dir, filename)
+            results_file = open(filepath, "w", newline="", encoding="utf-8")
+            eval_df.iloc[:0].to_csv(results_file, index=False)
+        job_positions = {job[0] for job in jobs}
+        pending = {}
+        rows_written = 0
+        rows_flushed = 0
+        
+        def write_ready_rows():
+            nonlocal rows_written, rows_flushed
+            # Written by pandas so cells are formatted exactly as to_csv would
+            while rows_written < len(eval_df):
+                if rows_written in pending:
+                    row = eval_df.iloc[[rows_written]].assign(**pending.pop(rows_written))
+                    row.to_csv(results_file, header=False, index=False)
+                    rows_written += 1
+                elif rows_written in job_positions:
+                    break
+                else:
+                    # A run of rows that are not evaluated is written as is
+                    stop = rows_written + 1
+                    while stop < len(eval_df) and stop not in job_positions:
+                        stop += 1
+                    eval_df.iloc[rows_written:stop].to_csv(results_file, header=False, index=False)
+                    rows_written = stop
+            if rows_written - rows_flushed >= RESULTS_FLUSH_INTERVAL:
+                results_file.flush()
+                rows_flushed = rows_written
+        
+        def write_row(position: int, evaluation_result: Dict[str, Any]):
+            if results_file is None:
+                return
+            pending[position] = evaluation_result
+            write_ready_rows()
+        
+        # Perform evaluations
+        start_time = time.time()
+        
+        try:
+            if mode == "batch":
+                results = self.evaluator.evaluate_batch([job[2:] for job in jobs])
+                for (position, *_), evaluation_result in zip(jobs, results):
+                    # Requests are not timed individually in a batch
+                    evaluation_result['eval_processing_time'] = None
+                    write_row(position, evaluation_result)
             else:
-                print(f"  ✗ Failed: {evaluation_result.get('eval_error', 'Unknown error')}")
+                results = self._evaluate_jobs(jobs, system_name, max_concurrency, write_row)
+            
+            # Rows after the last evaluated one, so the file holds every row
+            if results_file is not None:
+                write_ready_rows()
+        finally:
+            if results_file is not None:
+                results_file.close()
+        
+        successful_evaluations = sum(1 for result in results if result.get('eval_successful'))
+        
+        # Update dataframe with all results in one assignment
+        if results:
+            results_df = pd.DataFrame(results, columns=eval_columns, dtype=object)
+            column_positions = [eval_df.columns.get_loc(column) for column in eval_columns]
+            eval_df.iloc[[job[0] for job in jobs], column_positions] = results_df.to_numpy(dtype=object)
         
         total_time = time.time() - start_time
         
@@ -753,16 +995,93 @@ class SingleRAGEvaluationSystem:
             final_status = self.evaluator.get_rate_limit_status()
             print(f"\nFinal rate limit usage: {final_status['requests_used_this_minute']}/{final_status['max_requests_per_minute']} requests, {final_status['tokens_used_this_minute']}/{final_status['max_tokens_per_minute']} tokens")
         
-        # Save results if requested
         if save_results:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{system_name.replace(' ', '_').lower()}_evaluated_{timestamp}.csv"
-            filepath = os.path.join(self.results_dir, filename)
-            eval_df.to_csv(filepath, index=False)
             print(f"\nResults saved to: {filepath}")
         
         return eval_df
     
+    def _evaluate_jobs(
+        self,
+        jobs: List[Tuple],
+        system_name: str,
+        max_concurrency: int,
+        on_result: Optional[Callable[[Any, Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate (row position, label, question, answer, ideal) jobs in order
+        
+        The autogen backend sends up to `max_concurrency` requests at once
+        unless called from inside a running event loop; the Gemini backend
+        keeps to its rate limiter and evaluates one row at a time.
+        `on_result` is called with the row position and result of each
+        evaluation as it completes.
+        """
+        if self.evaluator_backend == "autogen" and max_concurrency > 1:
+            try:
+                asyncio.get_running_loop()
+                in_loop = True
+            except RuntimeError:
+                in_loop = False
+            
+            if not in_loop:
+                return asyncio.run(self._aevaluate_jobs(jobs, system_name, max_concurrency, on_result))
+        
+        results = []
+        for position, label, question, answer, ideal in jobs:
+            print(f"\nEvaluating {label}")
+            eval_start_time = time.time()
+            evaluation_result = self.evaluator.evaluate_single_response(
+                question=question,
+                generated_answer=answer,
+                ideal_answer=ideal,
+                system_name=system_name
+            )
+            evaluation_result['eval_processing_time'] = time.time() - eval_start_time
+            self._print_evaluation(evaluation_result)
+            if on_result is not None:
+                on_result(position, evaluation_result)
+            results.append(evaluation_result)
+        return results
+    
+    async def _aevaluate_jobs(
+        self,
+        jobs: List[Tuple],
+        system_name: str,
+        max_concurrency: int,
+        on_result: Optional[Callable[[Any, Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """Evaluate jobs concurrently, returning results in job order"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(client: AsyncOpenAI, position, label: str, question: str, answer: str, ideal: str) -> Dict[str, Any]:
+            async with semaphore:
+                print(f"\nEvaluating {label}")
+                eval_start_time = time.time()
+                evaluation_result = await self.evaluator.aevaluate_single_response(
+                    question=question,
+                    generated_answer=answer,
+                    ideal_answer=ideal,
+                    system_name=system_name,
+                    client=client
+                )
+            evaluation_result['eval_processing_time'] = time.time() - eval_start_time
+            self._print_evaluation(evaluation_result)
+            if on_result is not None:
+                on_result(position, evaluation_result)
+            return evaluation_result
+        
+        # The client is bound to the running event loop, so it lives for one run
+        async with AsyncOpenAI() as client:
+            return await asyncio.gather(*(bounded(client, *job) for job in jobs))
+    
+    def _print_evaluation(self, evaluation_result: Dict[str, Any]):
+        """Print the outcome of one evaluation"""
+        if evaluation_result.get('eval_successful'):
+            print( f"Accuracy:{evaluation_result['eval_accuracy_score']}")
+            print(f"  Time: {evaluation_result['eval_processing_time']:.2f}s")
+        else:
+            print(f"  ✗ Failed: {evaluation_result.get('eval_error', 'Unknown error')}")
+    
     def _save_individual_results(self, df: pd.DataFrame, system_name: str):
         """Save individual system results"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
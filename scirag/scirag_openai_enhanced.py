@@ -3,16 +3,16 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - SciRagOpenAIEnhanced (line 39):
-            - _generate_response_with_prompt(prompt: str) -> str (line 118)
-            - get_enhanced_response(query: str, content_types: Optional[List[ContentType]] = None, max_chunks: int = 10, include_metadata: bool = True) -> str (line 145)
-            - _build_enhanced_context(chunks: List[EnhancedChunk]) -> str (line 196)
-            - _create_enhanced_prompt(query: str, context: str, content_types: Optional[List[ContentType]]) -> str (line 234)
-            - get_mathematical_response(query: str, max_chunks: int = 5) -> str (line 269)
-            - get_asset_response(query: str, max_chunks: int = 5) -> str (line 277)
-            - get_glossary_response(query: str, max_chunks: int = 5) -> str (line 285)
-            - analyze_mathematical_content(query: str) -> Dict[str, Any] (line 293)
-            - search_by_content_type(query: str, content_type: ContentType, max_results: int = 10) -> List[Dict[str, Any]] (line 337)
+        - SciRagOpenAIEnhanced (line 41):
+            - _generate_response_with_prompt(prompt: str) -> str (line 119)
+            - get_enhanced_response(query: str, content_types: Optional[List[ContentType]] = None, max_chunks: int = 10, include_metadata: bool = True) -> str (line 146)
+            - _build_enhanced_context(chunks: List[EnhancedChunk]) -> str (line 205)
+            - _create_enhanced_prompt(query: str, context: str, content_types: Optional[List[ContentType]]) -> str (line 243)
+            - get_mathematical_response(query: str, max_chunks: int = 5) -> str (line 278)
+            - get_asset_response(query: str, max_chunks: int = 5) -> str (line 286)
+            - get_glossary_response(query: str, max_chunks: int = 5) -> str (line 294)
+            - analyze_mathematical_content(query: str) -> Dict[str, Any] (line 302)
+            - search_by_content_type(query: str, content_type: ContentType, max_results: int = 10) -> List[Dict[str, Any]] (line 346)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Enhanced SciRAG OpenAI Provider
@@ -20,7 +20,9 @@ Enhanced SciRAG OpenAI Provider
 This module provides an enhanced version of the SciRAG OpenAI provider
 that integrates RAGBook's advanced document processing capabilities.
 """
+import itertools
 import logging
+import os
 from typing import List, Dict, Any, Optional, Union
 from pathlib import Path
 
@@ -85,7 +87,6 @@ class SciRagOpenAIEnhanced(SciRagEnhanced):
         # Initialize OpenAI client
         if client is None:
             if api_key is None:
-                import os
                 api_key = os.getenv("OPENAI_API_KEY")
                 if not api_key:
                     raise ValueError("OpenAI API key must be provided")
@@ -164,12 +165,19 @@ class SciRagOpenAIEnhanced(SciRagEnhanced):
             return self.get_response(query)
         
         try:
-            # Filter chunks by content type if specified
-            filtered_chunks = self._filter_chunks_by_type(content_types)
+            # The prompt lists content_types in the given order; answers
+            # from before enhanced_chunks last changed never match
+            cache_key = (self.enhanced_chunks.version, query,
+                         tuple(ct.value for ct in content_types or ()),
+                         max_chunks, include_metadata)
+            response = self._get_cached_response(cache_key)
+            if response is not None:
+                return response
             
-            # Limit number of chunks
-            if len(filtered_chunks) > max_chunks:
-                filtered_chunks = filtered_chunks[:max_chunks]
+            # Filter chunks by content type if specified, stopping once
+            # max_chunks are collected
+            filtered_chunks = list(itertools.islice(
+                self._iter_chunks_by_type(content_types), max_chunks))
             
             # Build enhanced context
             if include_metadata:
@@ -183,6 +191,7 @@ class SciRagOpenAIEnhanced(SciRagEnhanced):
             # Generate response
             response = self._generate_response_with_prompt(prompt)
             
+            self._cache_response(cache_key, response)
             return response
             
         except Exception as e:
@@ -3,39 +3,86 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - Paper (line 39):
-        - CostInfo (line 51):
-        - PerplexityAgent (line 58):
-            - _calculate_cost(model: str, usage: Dict) -> float (line 149)
-            - _update_cost_tracking(cost: float, input_tokens: int, output_tokens: int) (line 167)
-            - get_cost_summary(session_only: bool = False) -> str (line 180)
-            - reset_session_costs() (line 192)
-            - _create_perplexity_prompt() -> str (line 195)
-            - _execute_perplexity_query(payload: Dict) -> Dict (line 224)
-            - _create_constrained_query(question: str) -> str (line 257)
-            - format_agent_output(response: str) -> str (line 270)
-            - format_agent_output_fallback(response: str) -> str (line 298)
-            - _extract_citation_numbers(text: str) -> List[str] (line 330)
-            - _format_sources_from_numbers(source_numbers: List) -> str (line 334)
-            - _clean_response_for_reasoning_models(content: str) -> str (line 362)
-            - get_response(query: str) -> str (line 381)
-            - parse_structured_response(json_response: str) -> str (line 430)
-            - _format_response_with_links(response: str, citations: List[str]) -> str (line 477)
-            - _format_sources_with_papers(response: str) -> str (line 500)
+        - Paper (line 86):
+        - CostInfo (line 98):
+        - PerplexityAgent (line 105):
+            - _calculate_cost(model: str, usage: Dict) -> float (line 237)
+            - _update_cost_tracking(cost: float, input_tokens: int, output_tokens: int) (line 255)
+            - get_cost_summary(session_only: bool = False) -> str (line 268)
+            - reset_session_costs() (line 280)
+            - _create_perplexity_prompt() -> str (line 283)
+            - _execute_perplexity_query(payload: Dict) -> Dict (line 312)
+            - _aexecute_perplexity_query(client, payload: Dict) -> Dict (line 331)
+            - _record_query_cost(payload: Dict, response_data: Dict) (line 345)
+            - _create_constrained_query(question: str) -> str (line 357)
+            - format_agent_output(response: str) -> str (line 368)
+            - format_agent_output_fallback(response: str) -> str (line 392)
+            - _extract_citation_numbers(text: str) -> List[int] (line 415)
+            - _format_sources_from_numbers(source_numbers: List[Union[int, str]]) -> str (line 418)
+            - _clean_response_for_reasoning_models(content: str) -> str (line 450)
+            - get_response(query: str) -> str (line 466)
+            - get_response_batch(queries: List[str], concurrency: int = 8) -> List[str] (line 484)
+            - get_responses(queries: List[str], concurrency: int = 8) -> List[str] (line 513)
+            - _build_payload(query: str) -> Dict (line 537)
+            - _format_perplexity_response(perplexity_response: Dict) -> str (line 551)
+            - parse_structured_response(json_response: str) -> str (line 563)
+            - _format_from_parsed(parsed: Dict) -> str (line 573)
+            - _truncate_answer(answer: str) -> str (line 611)
+            - _format_unparsed(response: str, error: Exception) -> str (line 620)
+            - _format_response_with_links(response: str, citations: List[str]) -> str (line 628)
+            - _format_sources_with_papers(response: str) -> str (line 642)
     --- END AUTO-GENERATED DOCSTRING ---
 """
 import os
 import re
+import asyncio
+import logging
 import requests
-from typing import List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
 # Import the base SciRag class
 from .scirag import SciRag
 from .config import PERPLEXITY_MODEL,AnswerFormat
 
-@dataclass
+PERPLEXITY_API_URL = "https://api.perplexity.ai/chat/completions"
+
+# Inline citation markers such as [1], [2]
+_CITE_RE = re.compile(r'\[(\d+)\]')
+
+# Whitespace ending a sentence: a terminator, then any citation markers that
+# belong to the sentence, then whitespace before a word that doesn't start
+# lowercase (so "e.g. the" or "et al. find" don't count)
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])((?:\s*\[\d+\])*)\s+(?=[^a-z\[])')
+
+# The prompt asks for at most this many sentences; longer answers are cut
+MAX_ANSWER_SENTENCES = 3
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a precise scientific literature assistant. Follow instructions exactly and provide accurate, well-cited responses in the specified JSON format."
+}
+
+@dataclass(slots=True, frozen=True)
 class Paper:
     """Represents a cosmology paper in our knowledge base"""
     id: int
@@ -86,10 +133,25 @@ class PerplexityAgent(SciRag):
             gen_model=gen_model,
             **kwargs
         )
+        self.logger = logging.getLogger(__name__)
+        
         # Initialize cost tracking
         self.session_cost = CostInfo()
         self.total_cost = CostInfo()
         
+        # Reuse connections to the Perplexity API across queries
+        self._api_key = os.getenv("PERPLEXITY_API_KEY")
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False
+        )
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        
         # Core paper database - exactly as specified
         self.papers = [
             Paper(
@@ -139,11 +201,37 @@ class PerplexityAgent(SciRag):
             )
         ]
         
+        # The paper list is fixed, so format it once for the prompt and queries
+        self._paper_list_text = "\n".join(
+            f"{i}. {paper.citation}" for i, paper in enumerate(self.papers, 1)
+        )
+        
         # Override the rag_prompt with Perplexity-specific prompt
         self.rag_prompt = self._create_perplexity_prompt()
         # Create a mapping of citation numbers to paper info for sources
-        self.citation_to_paper = {
-            str(i): paper for i, paper in enumerate(self.papers, 1)
+        self.citation_to_paper: Dict[int, Paper] = dict(enumerate(self.papers, 1))
+        # Resolve the link for each paper once, preferring arXiv over DOI;
+        # keyed by the citation text as it appears in responses
+        self._citation_urls: Dict[str, str] = {}
+        for num, paper in self.citation_to_paper.items():
+            if paper.arxiv_id:
+                self._citation_urls[str(num)] = f"https://arxiv.org/abs/{paper.arxiv_id}"
+            elif paper.doi:
+                self._citation_urls[str(num)] = f"https://doi.org/{paper.doi}"
+        
+        # Request fields shared by every query; get_response only adds the user message
+        self._json_schema = AnswerFormat.model_json_schema()
+        self._payload_template = {
+            "model": PERPLEXITY_MODEL,
+            "search_domain_filter": ["arxiv.org", "adsabs.harvard.edu"],
+            "search_recency_filter": "month",
+            "temperature": 0.01,
+            "max_tokens": 2000,
+            # Add structured output formatting
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"schema": self._json_schema}
+            }
         }
     
     def _calculate_cost(self, model: str, usage: Dict) -> float:
@@ -194,7 +282,7 @@ class PerplexityAgent(SciRag):
         self.session_cost = CostInfo()
     def _create_perplexity_prompt(self) -> str:
         """Create the specialized prompt for Perplexity-style responses"""
-        paper_list = "\n".join([f"{i}. {paper.citation}" for i, paper in enumerate(self.papers, 1)])
+        paper_list = self._paper_list_text
         
         return f"""You are a scientific literature search agent specializing in cosmology.
 
@@ -223,43 +311,53 @@ Your response must be in JSON format with exactly these fields:
     
     def _execute_perplexity_query(self, payload: Dict) -> Dict:
         """Execute a query using Perplexity API"""
-        api_key = os.getenv("PERPLEXITY_API_KEY")
-        if not api_key:
+        if not self._api_key:
             raise ValueError("PERPLEXITY_API_KEY environment variable not set")
         
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
         try:
-            response = requests.post(
-                "https://api.perplexity.ai/chat/completions",
-                headers=headers,
-                json=payload
+            response = self._session.post(
+                PERPLEXITY_API_URL,
+                headers={"Authorization": f"Bearer {self._api_key}"},
+                json=payload,
+                timeout=(5, 60)
             )
             response.raise_for_status()
             response_data = response.json()
-            # Extract usage information and calculate cost
-            usage = response_data.get("usage", {})
-            model = payload.get("model", "sonar")
-            
-            cost, input_tokens, output_tokens = self._calculate_cost(model, usage)
-            self._update_cost_tracking(cost, input_tokens, output_tokens)
-            
-            # Log cost information (optional)
-            print(f"Query cost: ${cost:.4f} | Input: {input_tokens} tokens | Output: {output_tokens} tokens")
-            
-            return response.json()
+            self._record_query_cost(payload, response_data)
+            return response_data
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Error calling Perplexity API: {e}")
     
+    async def _aexecute_perplexity_query(self, client, payload: Dict) -> Dict:
+        """Execute a query using Perplexity API on an httpx.AsyncClient"""
+        if not self._api_key:
+            raise ValueError("PERPLEXITY_API_KEY environment variable not set")
+        
+        try:
+            response = await client.post(PERPLEXITY_API_URL, json=payload)
+            response.raise_for_status()
+            response_data = response.json()
+            self._record_query_cost(payload, response_data)
+            return response_data
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"Error calling Perplexity API: {e}")
+    
+    def _record_query_cost(self, payload: Dict, response_data: Dict):
+        """Update cost tracking from the usage block of an API response"""
+        # Extract usage information and calculate cost
+        usage = response_data.get("usage", {})
+        model = payload.get("model", "sonar")
+        
+        cost, input_tokens, output_tokens = self._calculate_cost(model, usage)
+        self._update_cost_tracking(cost, input_tokens, output_tokens)
+        
+        # Log cost information (optional)
+        print(f"Query cost: ${cost:.4f} | Input: {input_tokens} tokens | Output: {output_tokens} tokens")
+    
     def _create_constrained_query(self, question: str) -> str:
         """Create a query that constrains the search to our specific papers"""
-        paper_list = "\n".join([f"{i}. {paper.citation}" for i, paper in enumerate(self.papers, 1)])
-        
         query = f"""We perform retrieval on the following set of papers:
-{paper_list}
+{self._paper_list_text}
 
 Question: {question}
 
@@ -272,7 +370,7 @@ Search for information relevant to this question within the specified papers and
         # Debug: Print the response we're trying to parse
         try:
             # Parse the JSON response
-            parsed = json.loads(response)
+            parsed = _json_loads(response)
             answer = parsed.get("answer", "")
             source_numbers = parsed.get("sources", [])
             
@@ -289,49 +387,35 @@ Search for information relevant to this question within the specified papers and
 """
         
         except json.JSONDecodeError as e:
-            print(f"Failed to parse structured JSON response: {e}")
-            print(f"Raw response: {response[:300]}...")
-            
-            # Fallback to original parsing method
-            return self.format_agent_output_fallback(response)
+            return self._format_unparsed(response, e)
         
     def format_agent_output_fallback(self, response: str) -> str:
         """Fallback formatting when structured JSON parsing fails"""
         print(f"Using fallback formatting for response: {response[:200]}...")
         
-        # Try to extract answer and sources from markdown-like format
-        if "**Answer**:" in response and "**Sources**:" in response:
-            parts = response.split("**Sources**:")
-            answer = parts[0].replace("**Answer**:", "").strip()
-            
-            # Format sources with paper info
-            sources_formatted = self._format_sources_with_papers(answer)
-            
-            return f"""**Answer**:
-
-{answer}
-
-**Sources**:
-
-{sources_formatted}
-"""
+        # Try to extract answer and sources from markdown-like format;
+        # otherwise treat the entire response as the answer
+        head, sep, _ = response.partition("**Sources**:")
+        if sep and "**Answer**:" in head:
+            answer = head.replace("**Answer**:", "").strip()
         else:
-            # Response doesn't have expected format, treat entire response as answer
-            sources_formatted = self._format_sources_with_papers(response)
-            
-            return f"""**Answer**:
+            answer = response
+        
+        # Format sources with paper info
+        sources_formatted = self._format_sources_with_papers(answer)
+        
+        return f"""**Answer**:
 
-{response}
+{answer}
 
 **Sources**:
 
 {sources_formatted}
 """ 
-    def _extract_citation_numbers(self, text: str) -> List[str]:
-        """Extract citation numbers from text like [1], [2], etc."""
-        citations = re.findall(r'\[(\d+)\]', text)
-        return list(set(citations))  # Remove duplicates
-    def _format_sources_from_numbers(self, source_numbers: List) -> str:
+    def _extract_citation_numbers(self, text: str) -> List[int]:
+        """Extract unique citation numbers from text like [1], [2], etc., in numeric order"""
+        return sorted({int(num) for num in _CITE_RE.findall(text)})
+    def _format_sources_from_numbers(self, source_numbers: List[Union[int, str]]) -> str:
         """Format sources from citation numbers to full paper info - handles various formats"""
         if not source_numbers:
             return "(No sources provided)"
@@ -340,20 +424,24 @@ Search for information relevant to this question within the specified papers and
         # Extract all unique numbers from all source items
         all_numbers = set()
         for source_item in source_numbers:
-            # Convert to string and strip brackets: "[1]" -> "1", 1 -> "1", etc.
+            if type(source_item) is int:
+                if source_item >= 0:
+                    all_numbers.add(source_item)
+                continue
+            # Convert to string and strip brackets: "[1]" -> "1", "1" -> 1, etc.
             num_str = str(source_item).strip('[]')
-            if num_str.isdigit():  # Make sure it's a valid number
-                all_numbers.add(num_str)
+            if num_str.isdecimal():  # Make sure it's a valid number
+                all_numbers.add(int(num_str))
         
         
         # Format each unique number
         formatted_sources = []
-        for num_str in sorted(all_numbers, key=int):  # Sort numerically
-            if num_str in self.citation_to_paper:
-                paper = self.citation_to_paper[num_str]
-                formatted_sources.append(f"[{num_str}] {paper.title} - {paper.citation}")
+        for num in sorted(all_numbers):
+            paper = self.citation_to_paper.get(num)
+            if paper is not None:
+                formatted_sources.append(f"[{num}] {paper.title} - {paper.citation}")
             else:
-                formatted_sources.append(f"[{num_str}] Unknown source")
+                formatted_sources.append(f"[{num}] Unknown source")
         
         result = "\n".join(formatted_sources) if formatted_sources else "(No valid sources found)"
         return result
@@ -364,13 +452,10 @@ Search for information relevant to this question within the specified papers and
         if not content:
             return content
         
-        # For reasoning models, the JSON comes after the </think> tag
-        if "<think>" in content and "</think>" in content:
-            # Extract everything after the last </think> tag
-            parts = content.split("</think>")
-            if len(parts) > 1:
-                json_part = parts[-1].strip()
-                return json_part
+        # For reasoning models, the JSON comes after the last </think> tag
+        end = content.rfind("</think>")
+        if end != -1 and "<think>" in content:
+            return content[end + len("</think>"):].strip()
         
         # If no thinking tags, return as is
         return content.strip()
@@ -390,33 +475,81 @@ Search for information relevant to this question within the specified papers and
             str: Formatted response with citations
         """
         
-        constrained_query = self._create_constrained_query(query)
-        
-        payload = {
-            "model": PERPLEXITY_MODEL,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a precise scientific literature assistant. Follow instructions exactly and provide accurate, well-cited responses in the specified JSON format."
-                },
-                {
-                    "role": "user",
-                    "content": constrained_query
-                }
-            ],
-            "search_domain_filter": ["arxiv.org", "adsabs.harvard.edu"],
-            "search_recency_filter": "month",
-            "temperature": 0.01,
-            "max_tokens": 2000,
-            # Add structured output formatting
-            "response_format": {
-                "type": "json_schema",
-                "json_schema": {"schema": AnswerFormat.model_json_schema()}
-            }
-        }
+        payload = self._build_payload(query)
         
         perplexity_response = self._execute_perplexity_query(payload)
         
+        return self._format_perplexity_response(perplexity_response)
+    
+    async def get_response_batch(self, queries: List[str], concurrency: int = 8) -> List[str]:
+        """
+        Answer several questions concurrently with at most `concurrency` requests in flight
+        
+        Args:
+            queries: The cosmology questions to answer
+            concurrency: Maximum number of simultaneous API requests
+            
+        Returns:
+            List[str]: Formatted responses, in the same order as `queries`
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for batched Perplexity queries")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def bounded(client, query: str) -> str:
+            async with semaphore:
+                perplexity_response = await self._aexecute_perplexity_query(client, self._build_payload(query))
+            return self._format_perplexity_response(perplexity_response)
+        
+        # The client is bound to the running event loop, so it lives for one batch
+        async with httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {self._api_key}"},
+            limits=httpx.Limits(max_connections=16),
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        ) as client:
+            return await asyncio.gather(*(bounded(client, query) for query in queries))
+    
+    def get_responses(self, queries: List[str], concurrency: int = 8) -> List[str]:
+        """
+        Synchronous entry point for get_response_batch
+        
+        Falls back to answering the questions one by one when httpx is not
+        installed or when called from inside a running event loop.
+        
+        Args:
+            queries: The cosmology questions to answer
+            concurrency: Maximum number of simultaneous API requests
+            
+        Returns:
+            List[str]: Formatted responses, in the same order as `queries`
+        """
+        try:
+            asyncio.get_running_loop()
+            in_loop = True
+        except RuntimeError:
+            in_loop = False
+        
+        if HTTPX_AVAILABLE and not in_loop:
+            return asyncio.run(self.get_response_batch(queries, concurrency))
+        return [self.get_response(query) for query in queries]
+    
+    def _build_payload(self, query: str) -> Dict:
+        """Fill the request template with the constrained query"""
+        constrained_query = self._create_constrained_query(query)
+        
+        payload = dict(self._payload_template)
+        payload["messages"] = [
+            _SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": constrained_query
+            }
+        ]
+        return payload
+    
+    def _format_perplexity_response(self, perplexity_response: Dict) -> str:
+        """Extract, clean and format the message content of an API response"""
         content = perplexity_response["choices"][0]["message"]["content"]
         
         # Clean any thinking tags if using reasoning models
@@ -431,34 +564,42 @@ Search for information relevant to this question within the specified papers and
         """Parse the structured JSON response and format it properly"""
         try:
             # Parse the JSON response
-            parsed = json.loads(json_response)
-            answer = parsed.get("answer", "")
-            source_info = parsed.get("sources", [])  # Default to empty list
-            
-            # Debug: Print what we received
-            print(f"Parsed answer: {answer[:100]}...")
-            print(f"Parsed sources: {source_info}")
-            print(f"Source info type: {type(source_info)}")
-            
-            # Ensure source_info is a list
-            if isinstance(source_info, str):
-                # If it's a string like "[1], [2]" or "1,2", try to parse it
-                if source_info.strip():
-                    # Extract numbers from string format
-                    numbers = re.findall(r'\d+', source_info)
-                    source_info = numbers  # Keep as plain numbers, not "[1]" format
-                else:
-                    source_info = []
-            elif not isinstance(source_info, list):
-                # Convert other types to list
-                source_info = [source_info] if source_info else []
-            
-            print(f"Processed sources: {source_info}")
-            
-            # Format sources with full paper information
-            formatted_sources = self._format_sources_from_numbers(source_info)
-            
-            return f"""**Answer**:
+            parsed = _json_loads(json_response)
+        except json.JSONDecodeError as e:
+            return self._format_unparsed(json_response, e)
+        
+        return self._format_from_parsed(parsed)
+    
+    def _format_from_parsed(self, parsed: Dict) -> str:
+        """Format an already parsed structured response"""
+        answer = self._truncate_answer(parsed.get("answer", ""))
+        source_info = parsed.get("sources", [])  # Default to empty list
+        
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(f"Parsed answer: {answer[:100]}...")
+            self.logger.debug(f"Parsed sources: {source_info} ({type(source_info)})")
+        
+        # Ensure source_info is a list
+        if isinstance(source_info, str):
+            # If it's a string like "[1], [2]" or "1,2", try to parse it
+            if source_info.strip():
+                # Extract numbers from string format
+                numbers = re.findall(r'\d+', source_info)
+                source_info = numbers  # Keep as plain numbers, not "[1]" format
+            else:
+                source_info = []
+        elif not isinstance(source_info, list):
+            # Convert other types to list
+            source_info = [source_info] if source_info else []
+        
+        if debug:
+            self.logger.debug(f"Processed sources: {source_info}")
+        
+        # Format sources with full paper information
+        formatted_sources = self._format_sources_from_numbers(source_info)
+        
+        return f"""**Answer**:
 
 {answer}
 
@@ -466,36 +607,37 @@ Search for information relevant to this question within the specified papers and
 
 {formatted_sources}
 """
+    
+    def _truncate_answer(self, answer: str) -> str:
+        """Cut the answer after MAX_ANSWER_SENTENCES sentences"""
+        if not isinstance(answer, str):
+            return answer
+        for count, match in enumerate(_SENTENCE_BREAK_RE.finditer(answer), 1):
+            if count == MAX_ANSWER_SENTENCES:
+                return answer[:match.end(1)]
+        return answer
+    
+    def _format_unparsed(self, response: str, error: Exception) -> str:
+        """Report a JSON parse failure and format the raw response instead"""
+        print(f"Failed to parse structured JSON response: {error}")
+        print(f"Raw response: {response[:300]}...")
         
-        except json.JSONDecodeError as e:
-            print(f"Failed to parse structured JSON response: {e}")
-            print(f"Raw response: {json_response[:300]}...")
-            
-            # Fallback to original parsing method
-            return self.format_agent_output_fallback(json_response)
+        # Fallback to original parsing method
+        return self.format_agent_output_fallback(response)
     
     def _format_response_with_links(self, response: str, citations: List[str]) -> str:
         """Format the response with clickable citation links"""
+        urls = self._citation_urls
+        if citations:
+            # Links returned with the response take precedence over our paper links
+            urls = {**urls, **{str(i): url for i, url in enumerate(citations, 1)}}
+        
         def citation_repl(match):
             number_str = match.group(1)
-            try:
-                index = int(number_str) - 1
-                if 0 <= index < len(citations):
-                    return f'[[{number_str}]({citations[index]})]'
-                else:
-                    # Map to our internal papers if citation number matches
-                    paper_index = int(number_str) - 1
-                    if 0 <= paper_index < len(self.papers):
-                        paper = self.papers[paper_index]
-                        if paper.arxiv_id:
-                            return f'[[{number_str}](https://arxiv.org/abs/{paper.arxiv_id})]'
-                        elif paper.doi:
-                            return f'[[{number_str}](https://doi.org/{paper.doi})]'
-                return match.group(0)
-            except (ValueError, IndexError):
-                return match.group(0)
-        
-        return re.sub(r'\[(\d+)\]', citation_repl, response)
+            url = urls.get(number_str)
+            return f'[[{number_str}]({url})]' if url is not None else match.group(0)
+        
+        return _CITE_RE.sub(citation_repl, response)
     
     def _format_sources_with_papers(self, response: str) -> str:
         """Format sources section with paper names and citations"""
@@ -505,9 +647,9 @@ Search for information relevant to this question within the specified papers and
             return "(Sources not found in standard format)"
         
         formatted_sources = []
-        for num in sorted(citation_numbers, key=int):
-            if num in self.citation_to_paper:
-                paper = self.citation_to_paper[num]
+        for num in citation_numbers:
+            paper = self.citation_to_paper.get(num)
+            if paper is not None:
                 formatted_sources.append(f"[{num}] {paper.title} - {paper.citation}")
         
         return "\n".join(formatted_sources) if formatted_sources else "(Sources not found in standard format)"
@@ -3,28 +3,64 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - remove_numerical_references(text) (line 80)
-        - print_usage_summary(tokens_dict, cost_dict) (line 86)
-        - SciRagVertexAI (line 115):
-            - _get_vertex_ai_pricing() (line 177)
-            - _calculate_cost(input_tokens: int, output_tokens: int) -> float (line 186)
-            - _log_usage_and_cost(input_tokens: int, output_tokens: int, total_cost: float) (line 206)
-            - get_cost_summary() -> dict (line 232)
-            - _count_tokens(text: str) -> int (line 254)
-            - create_vector_db(folder_id=folder_id) (line 264)
-            - delete_vector_db() (line 339)
-            - get_chunks(query: str) (line 344)
-            - get_response(query: str) (line 365)
-            - format_agent_output(response) (line 389)
-        - _remove_extra_fields(model: Any, response: dict[str, object]) -> None (line 420)
-        - CommonBaseModel (line 459):
-            - _from_response(cls: Type[T], *, response: dict[str, object], kwargs: dict[str, object]) -> T (line 474)
-            - to_json_dict() -> dict[str, object] (line 482)
-        - CaseInSensitiveEnum (line 486):
-            - _missing_(cls, value: Any) -> Optional['CaseInSensitiveEnum'] (line 490)
-        - FunctionCallingConfigMode (line 509):
-        - FunctionCallingConfig (line 518):
-        - ToolConfig (line 528):
+        - RetrievalCache (line 141):
+            - make_key(corpus_name: str, query: str) -> str (line 159)
+            - get(key: str) (line 164)
+            - set(key: str, value) (line 182)
+            - clear() (line 201)
+        - _quantize_int8(vector: np.ndarray) (line 217)
+        - _filter_topk(distances: np.ndarray, threshold: float, k: int) -> np.ndarray (line 224)
+        - SimilarQueryCache (line 232):
+            - lookup(embedding: np.ndarray) (line 249)
+            - add(query: str, embedding: np.ndarray, response) (line 274)
+            - set_chunk_embeddings(query: str, chunk_embeddings: np.ndarray) (line 284)
+            - clear() (line 291)
+        - _delete_cached_content(client, name) (line 312)
+        - _PromptCache (line 320):
+        - _is_missing_cache_error(error: Exception) -> bool (line 338)
+        - remove_numerical_references(text) (line 344)
+        - print_usage_summary(tokens_dict, cost_dict) (line 350)
+        - SciRagVertexAI (line 379):
+            - _open_retrieval_cache(cache_dir) (line 412)
+            - rag_retrieval_tool() (line 423)
+            - _list_rag_corpora() (line 439)
+            - _invalidate_corpus_cache() (line 484)
+            - _get_vertex_ai_pricing() (line 489)
+            - _calculate_cost(input_tokens: int, output_tokens: int) -> float (line 498)
+            - _log_usage_and_cost(input_tokens: int, output_tokens: int, total_cost: float) (line 518)
+            - get_cost_summary() -> dict (line 544)
+            - _count_tokens(text: str) -> int (line 566)
+            - _create_corpus() (line 576)
+            - _import_files_args(rag_corpus) (line 593)
+            - _use_corpus(rag_corpus, import_op=None) (line 603)
+            - create_vector_db(folder_id=folder_id) (line 616)
+            - acreate_vector_db(folder_id=folder_id) (line 670)
+            - wait_for_ingest(poll: float = INGEST_POLL_INTERVAL, max_poll: float = INGEST_MAX_POLL_INTERVAL) (line 682)
+            - _require_ingested() (line 706)
+            - delete_vector_db() (line 717)
+            - _embed_texts(texts: List[str]) (line 726)
+            - _embed_query(query: str) (line 743)
+            - _rerank(q: np.ndarray, chunks: np.ndarray, k: int = TOP_K, threshold: float = DISTANCE_THRESHOLD) -> np.ndarray (line 749)
+            - _select_contexts(response, indices) (line 759)
+            - _top_contexts(cls, response, k: int) (line 766)
+            - _rerank_similar(embedding: np.ndarray, similar) (line 772)
+            - get_chunks(query: str) (line 786)
+            - get_response(query: str) (line 826)
+            - aget_response(query: str) (line 850)
+            - aget_response_batch(queries: List[str], concurrency: int = ASYNC_QUERY_CONCURRENCY) -> List[str] (line 883)
+            - _generate_content_config(cache_name) (line 903)
+            - _finish_response(input_tokens: int, response) -> str (line 932)
+            - _get_prompt_cache(stale_name=None) (line 941)
+            - format_agent_output(response) (line 978)
+        - _remove_extra_fields(model: Any, response: dict[str, object]) -> None (line 1009)
+        - CommonBaseModel (line 1048):
+            - _from_response(cls: Type[T], *, response: dict[str, object], kwargs: dict[str, object]) -> T (line 1063)
+            - to_json_dict() -> dict[str, object] (line 1071)
+        - CaseInSensitiveEnum (line 1075):
+            - _missing_(cls, value: Any) -> Optional['CaseInSensitiveEnum'] (line 1079)
+        - FunctionCallingConfigMode (line 1098):
+        - FunctionCallingConfig (line 1107):
+        - ToolConfig (line 1117):
     --- END AUTO-GENERATED DOCSTRING ---
 """
 from typing import List
@@ -33,7 +69,16 @@ import asyncio
 import time
 import os
 import shutil
+import threading
+import weakref
+import functools
+import hashlib
+import logging
+import pickle
+import sqlite3
+from collections import OrderedDict
 from pathlib import Path
+import numpy as np
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
@@ -47,6 +92,7 @@ from .config import AnswerFormat
 import json
 
 from google.genai.types import (
+    CreateCachedContentConfig,
     GenerateContentConfig,
     Retrieval,
     Tool,
@@ -62,6 +108,8 @@ from vertexai.preview.rag import (
     RagVectorDbConfig, RagEmbeddingModelConfig, VertexPredictionEndpoint,
     TransformationConfig, ChunkingConfig
 )
+from vertexai.preview import rag
+from vertexai.language_models import TextEmbeddingModel
 
 
 from .config import (vertex_client,
@@ -73,9 +121,225 @@ from .config import (vertex_client,
                      display_name,
                      authenticate_gdrive,
                      folder_id,SCOPES,
-                     markdown_files_path)
+                     markdown_files_path,
+                     PROJECT, LOCATION)
 
 from .scirag import SciRag
+
+# Selected corpus per (project, location), shared by all instances so only
+# the first construction lists the corpora
+_CORPUS_CACHE = {}
+_CORPUS_CACHE_LOCK = threading.Lock()
+
+# On-disk cache of retrieval_query responses, kept in the cache_dir passed
+# to SciRagVertexAI
+RETRIEVAL_CACHE_FILENAME = "retrieval.sqlite3"
+RETRIEVAL_CACHE_TTL = 86400  # seconds
+RETRIEVAL_CACHE_MAX_ENTRIES = 10000
+
+
+class RetrievalCache:
+    """Disk-backed LRU cache of pickled retrieval responses in a SQLite table."""
+
+    def __init__(self, path: Path,
+                 ttl: float = RETRIEVAL_CACHE_TTL,
+                 max_entries: int = RETRIEVAL_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by get_chunks_batch worker threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS retrieval ("
+                "key TEXT PRIMARY KEY, value BLOB, expires REAL, accessed REAL)")
+
+    @staticmethod
+    def make_key(corpus_name: str, query: str) -> str:
+        """Hash everything that determines a retrieval result."""
+        return hashlib.sha256(
+            f"{corpus_name}|{TOP_K}|{DISTANCE_THRESHOLD}|{query}".encode()).hexdigest()
+
+    def get(self, key: str):
+        """Return the cached response for key, or None on a miss."""
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT value FROM retrieval WHERE key = ? AND expires > ?",
+                    (key, now)).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute(
+                    "UPDATE retrieval SET accessed = ? WHERE key = ?", (now, key))
+            return pickle.loads(row[0])
+        except Exception as e:
+            # An unreadable database or entry is a miss
+            print(f"Warning: Could not read cached retrieval response: {e}")
+            return None
+
+    def set(self, key: str, value):
+        """Store value under key, evicting the least recently used entries."""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"Warning: Could not cache retrieval response: {e}")
+            return
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO retrieval VALUES (?, ?, ?, ?)",
+                    (key, blob, now + self.ttl, now))
+                self._conn.execute(
+                    "DELETE FROM retrieval WHERE key IN (SELECT key FROM retrieval "
+                    "ORDER BY accessed DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+        except sqlite3.Error as e:
+            print(f"Warning: Could not cache retrieval response: {e}")
+
+    def clear(self):
+        """Drop every cached response."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM retrieval")
+        except sqlite3.Error as e:
+            print(f"Warning: Could not clear retrieval cache: {e}")
+
+
+# Near-duplicate query reuse: recent queries keep a deeper result list, and
+# a new query whose embedding is this similar reuses it
+SIMILAR_QUERY_THRESHOLD = 0.95
+SIMILAR_QUERY_CAPACITY = 256
+SIMILAR_QUERY_TOP_K = max(20, TOP_K)
+
+
+def _quantize_int8(vector: np.ndarray):
+    """Symmetric per-vector int8 quantization; returns (int8 vector, scale)."""
+    peak = float(np.abs(vector).max())
+    scale = peak / 127 if peak else 1.0
+    return np.round(vector / scale).astype(np.int8), np.float32(scale)
+
+
+def _filter_topk(distances: np.ndarray, threshold: float, k: int) -> np.ndarray:
+    """Indices of the k smallest distances within threshold, nearest first."""
+    keep = np.flatnonzero(distances <= threshold)
+    if k < len(keep):
+        keep = keep[np.argpartition(distances[keep], k)[:k]]
+    return keep[np.argsort(distances[keep], kind="stable")]
+
+
+class SimilarQueryCache:
+    """In-memory LRU of recent query embeddings and their retrieval responses."""
+
+    def __init__(self, capacity: int = SIMILAR_QUERY_CAPACITY,
+                 threshold: float = SIMILAR_QUERY_THRESHOLD):
+        self.capacity = capacity
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        # query -> [int8 unit embedding, scale, response, unit chunk
+        # embeddings or None], least recently used first
+        self._entries = OrderedDict()
+        # Stacked int8 embeddings and their scales in _entries order,
+        # rebuilt lazily after changes
+        self._matrix = None
+        self._scales = None
+        self._keys = None
+
+    def lookup(self, embedding: np.ndarray):
+        """Return (query, response, chunk embeddings) of the most similar cached query, or None."""
+        with self._lock:
+            if not self._entries:
+                return None
+            if self._matrix is None:
+                self._keys = list(self._entries)
+                entries = self._entries.values()
+                self._matrix = np.stack([entry[0] for entry in entries])
+                self._scales = np.array([entry[1] for entry in entries], dtype=np.float32)
+            # Cosine similarity against every cached query in one integer
+            # product, accumulated in int32 and rescaled by both scales
+            q, q_scale = _quantize_int8(embedding)
+            raw = np.einsum("nd,d->n", self._matrix, q, dtype=np.int32)
+            scores = raw * (self._scales * q_scale)
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            query = self._keys[best]
+            if best != len(self._keys) - 1:
+                self._entries.move_to_end(query)
+                self._matrix = None
+            _, _, response, chunk_embeddings = self._entries[query]
+            return query, response, chunk_embeddings
+
+    def add(self, query: str, embedding: np.ndarray, response):
+        """Remember a query's unit embedding, stored as int8, and its response."""
+        quantized, scale = _quantize_int8(embedding)
+        with self._lock:
+            self._entries[query] = [quantized, scale, response, None]
+            self._entries.move_to_end(query)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+            self._matrix = None
+
+    def set_chunk_embeddings(self, query: str, chunk_embeddings: np.ndarray):
+        """Attach the unit embeddings of a cached response's contexts."""
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is not None:
+                entry[3] = chunk_embeddings
+
+    def clear(self):
+        """Forget every cached query."""
+        with self._lock:
+            self._entries.clear()
+            self._matrix = None
+
+
+# Requests in flight per aget_response_batch call
+ASYNC_QUERY_CONCURRENCY = 16
+
+# Status polling of an async corpus import: initial and maximum delay (s)
+INGEST_POLL_INTERVAL = 5.0
+INGEST_MAX_POLL_INTERVAL = 60.0
+
+# Lifetime of the explicit context cache holding the static prompt and tools (s)
+PROMPT_CACHE_TTL = 3600
+# A cache is replaced this long before it expires, so requests stop naming
+# it before the server deletes it (s)
+PROMPT_CACHE_REFRESH_MARGIN = 60
+
+
+def _delete_cached_content(client, name):
+    """Delete a server-side context cache, warning on failure."""
+    try:
+        client.caches.delete(name=name)
+    except Exception as e:
+        print(f"Warning: Could not delete prompt cache {name}: {e}")
+
+
+class _PromptCache:
+    """A context cache shared by every instance with the same model, corpus and prompt."""
+
+    def __init__(self, client, name, expires: float):
+        self.name = name
+        self.expires = expires
+        if name is not None:
+            # Deleted once the entry is replaced, or at exit; the finalizer
+            # holds the client and name, never a SciRagVertexAI instance
+            weakref.finalize(self, _delete_cached_content, client, name)
+
+
+# (model, corpus name, prompt) -> _PromptCache; a name of None records a
+# failed attempt, retried once the entry expires
+_PROMPT_CACHES = {}
+_PROMPT_CACHES_LOCK = threading.Lock()
+
+
+def _is_missing_cache_error(error: Exception) -> bool:
+    """Whether a generation failed because its context cache no longer exists."""
+    return getattr(error, 'code', None) == 404 or getattr(error, 'status', None) == 'NOT_FOUND'
+
+
 # Enhanced cost tracking functions
 def remove_numerical_references(text):
     """Remove numerical references from text"""
@@ -119,61 +383,109 @@ class SciRagVertexAI(SciRag):
                  markdown_files_path = markdown_files_path,
                  corpus_name = display_name,
                  gen_model = GEMINI_GEN_MODEL,
+                 cache_dir = None,
                  ):
         super().__init__(client, credentials, markdown_files_path, corpus_name, gen_model)
+        self.logger = logging.getLogger(__name__)
         self.pricing = self._get_vertex_ai_pricing()
         self.cost_dict['Model'] = []
+        # Retrieval responses persist across runs only when cache_dir is given
+        self._chunk_cache = self._open_retrieval_cache(cache_dir)
+        self._similar_queries = SimilarQueryCache()
+        self._embedding_model = None
+        # Generation configs by prompt cache name (None: no cache)
+        self._content_configs = {}
+        # Pending import operation started by acreate_vector_db
+        self._import_op = None
+
+        cache_key = (PROJECT, LOCATION)
+        with _CORPUS_CACHE_LOCK:
+            rag_corpus = _CORPUS_CACHE.get(cache_key)
+            if rag_corpus is None:
+                rag_corpus = self._list_rag_corpora()
+                if rag_corpus is not None:
+                    _CORPUS_CACHE[cache_key] = rag_corpus
+        if rag_corpus is not None:
+            self.rag_corpus = rag_corpus
+
+    @staticmethod
+    def _open_retrieval_cache(cache_dir):
+        """Open the retrieval cache in cache_dir, or None if disabled or unusable."""
+        if cache_dir is None:
+            return None
+        try:
+            return RetrievalCache(Path(cache_dir) / RETRIEVAL_CACHE_FILENAME)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Could not open retrieval cache, not caching: {e}")
+            return None
+
+    @functools.cached_property
+    def rag_retrieval_tool(self):
+        """Retrieval tool over the selected corpus, built on first use."""
+        return Tool(
+            retrieval=Retrieval(
+                vertex_rag_store=VertexRagStore(
+                    rag_resources=[
+                        VertexRagStoreRagResource(
+                            rag_corpus=self.rag_corpus.name  # Currently only 1 corpus is allowed.
+                        )
+                    ],
+                    similarity_top_k=TOP_K,
+                    vector_distance_threshold=DISTANCE_THRESHOLD,
+                )
+            )
+        )
 
-        print("Listing RAG Corpora:")
+    def _list_rag_corpora(self):
+        """List the RAG corpora and return the last one, or None."""
+        logger = self.logger
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Listing RAG Corpora:")
+        _dbg = logger.debug
 
-        corpora_found = False
+        rag_corpus = None
         for corpus in list_corpora():
-            corpora_found = True
-            print(f"--- Corpus: {corpus.display_name} ---")
-            print(f"  Name (Resource Path): {corpus.name}")
-            print(f"  Display Name: {corpus.display_name}")
-
-            # Access other common attributes:
-            # Use hasattr() to safely check if an attribute exists before trying to access it,
-            # as some fields might not be present for all corpora or in all states.
+            rag_corpus = corpus
+            if not debug:
+                continue
 
+            _dbg(f"--- Corpus: {corpus.display_name} ---")
+            _dbg(f"  Name (Resource Path): {corpus.name}")
+            _dbg(f"  Display Name: {corpus.display_name}")
 
-            if hasattr(corpus, 'create_time') and corpus.create_time:
-                # Directly use corpus.create_time (which is a DatetimeWithNanoseconds object
-                # or similar datetime-compatible object) with strftime
-                print(f"  Create Time: {corpus.create_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            # Access other common attributes:
+            # Use getattr() with a default, as some fields might not be present
+            # for all corpora or in all states.
 
-            if hasattr(corpus, 'update_time') and corpus.update_time:
-                # Directly use corpus.update_time with strftime
-                print(f"  Update Time: {corpus.update_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            create_time = getattr(corpus, 'create_time', None)
+            if create_time:
+                # create_time is a DatetimeWithNanoseconds object or similar
+                # datetime-compatible object
+                _dbg(f"  Create Time: {create_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
-            if hasattr(corpus, 'state') and corpus.state:
-                print(f"  State: {corpus.state}") # e.g., Corpus.State.ACTIVE, Corpus.State.CREATING
+            update_time = getattr(corpus, 'update_time', None)
+            if update_time:
+                _dbg(f"  Update Time: {update_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
+            state = getattr(corpus, 'state', None)
+            if state:
+                _dbg(f"  State: {state}") # e.g., Corpus.State.ACTIVE, Corpus.State.CREATING
 
-            # You can inspect the object's attributes further if needed
-            # print(f"  Full object representation: {corpus}") # This can be very verbose
+            _dbg("-" * 30)
 
-            self.rag_corpus = corpus
+        if rag_corpus is None:
+            logger.warning("No RAG corpora found in your project/region.")
+            return None
 
-            self.rag_retrieval_tool = Tool(
-                retrieval=Retrieval(
-                    vertex_rag_store=VertexRagStore(
-                        rag_resources=[
-                            VertexRagStoreRagResource(
-                                rag_corpus=self.rag_corpus.name  # Currently only 1 corpus is allowed.
-                            )
-                        ],
-                        similarity_top_k=TOP_K,
-                        vector_distance_threshold=DISTANCE_THRESHOLD,
-                    )
-                )
-            )
+        return rag_corpus
 
-            print("-" * 30)
+    @staticmethod
+    def _invalidate_corpus_cache():
+        """Forget the cached corpus after corpora are created or deleted."""
+        with _CORPUS_CACHE_LOCK:
+            _CORPUS_CACHE.pop((PROJECT, LOCATION), None)
 
-        if not corpora_found:
-            print("No RAG corpora found in your project/region.")
     def _get_vertex_ai_pricing(self):
         """Get Vertex AI pricing for Gemini 2.5 Flash Preview model"""
         pricing = {
@@ -261,8 +573,8 @@ class SciRagVertexAI(SciRag):
             # Fallback: rough estimate of 1 token per 4 characters
             return len(text) // 4
 
-    def create_vector_db(self, folder_id = folder_id):
-
+    def _create_corpus(self):
+        """Create an empty corpus using the configured embedding model."""
         rag_corpus = create_corpus(
             display_name=self.corpus_name,
             backend_config=RagVectorDbConfig(
@@ -275,7 +587,35 @@ class SciRagVertexAI(SciRag):
         )
 
         print(f"Created corpus: {rag_corpus.name}")
+        return rag_corpus
+
+    @staticmethod
+    def _import_files_args(rag_corpus):
+        """Arguments shared by the blocking and async file imports."""
+        return dict(
+            corpus_name=rag_corpus.name,
+            paths=["gs://cmbagent"],
+            transformation_config=TransformationConfig(
+                chunking_config=ChunkingConfig(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+            ),
+        )
+
+    def _use_corpus(self, rag_corpus, import_op=None):
+        """Switch to a newly created corpus and drop state tied to the old one."""
+        self.rag_corpus = rag_corpus
+        self._import_op = import_op
+        # Rebuild the retrieval tool for the new corpus on next use; prompt
+        # caches are keyed by corpus, so the next request gets a new one
+        self.__dict__.pop('rag_retrieval_tool', None)
+        self._content_configs.clear()
+        self._invalidate_corpus_cache()
+        if self._chunk_cache is not None:
+            self._chunk_cache.clear()
+        self._similar_queries.clear()
+
+    def create_vector_db(self, folder_id = folder_id):
 
+        rag_corpus = self._create_corpus()
 
 
         # service = authenticate_gdrive()
@@ -297,13 +637,7 @@ class SciRagVertexAI(SciRag):
         # import sys
         # sys.exit()
 
-        import_files(
-            corpus_name=rag_corpus.name,
-            paths=["gs://cmbagent"],
-            transformation_config=TransformationConfig(
-                chunking_config=ChunkingConfig(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
-            ),
-        )
+        import_files(**self._import_files_args(rag_corpus))
         # rag.import_files(
         #     corpus_name=rag_corpus.name,
         #     paths=[str(markdown_file_path) for markdown_file_path in markdown_files_path.glob("*.md")],
@@ -331,17 +665,139 @@ class SciRagVertexAI(SciRag):
 
         print(f"Imported files to corpus: {rag_corpus.name}")
 
-        self.rag_corpus = rag_corpus
+        self._use_corpus(rag_corpus)
+
+    async def acreate_vector_db(self, folder_id = folder_id):
+        """
+        Create the corpus and start importing files without waiting for ingestion.
+
+        The import runs as a long-running operation on Vertex; await
+        wait_for_ingest() before querying the new corpus.
+        """
+        rag_corpus = await asyncio.to_thread(self._create_corpus)
+        import_op = await import_files_async(**self._import_files_args(rag_corpus))
+        print(f"Started importing files to corpus: {rag_corpus.name}")
+        self._use_corpus(rag_corpus, import_op)
+
+    async def wait_for_ingest(self, poll: float = INGEST_POLL_INTERVAL,
+                              max_poll: float = INGEST_MAX_POLL_INTERVAL):
+        """
+        Wait for the import started by acreate_vector_db to finish.
+
+        Args:
+            poll: Initial delay between status checks, in seconds
+            max_poll: Upper bound for the exponentially growing delay
+
+        Raises:
+            Whatever error the import operation finished with
+        """
+        import_op = self._import_op
+        if import_op is None:
+            return
+        try:
+            while not await import_op.done():
+                await asyncio.sleep(poll)
+                poll = min(poll * 2, max_poll)
+            await import_op.result()
+        finally:
+            self._import_op = None
+        print(f"Imported files to corpus: {self.rag_corpus.name}")
+
+    def _require_ingested(self):
+        """Refuse to query a corpus whose files are still being imported."""
+        if self._import_op is not None:
+            raise RuntimeError(
+                "Files are still being imported into the corpus; "
+                "await wait_for_ingest() before querying it."
+            )
 
 
 
     
     def delete_vector_db(self):
         rag.delete_corpus(name=self.rag_corpus.name)
+        self._invalidate_corpus_cache()
+        if self._chunk_cache is not None:
+            self._chunk_cache.clear()
+        self._similar_queries.clear()
 
 
 
+    def _embed_texts(self, texts: List[str]):
+        """Return a contiguous (N, d) float32 array of unit-norm embeddings, or None."""
+        try:
+            if self._embedding_model is None:
+                self._embedding_model = TextEmbeddingModel.from_pretrained(
+                    VERTEX_EMBEDDING_MODEL.rsplit("/", 1)[-1])
+            embeddings = self._embedding_model.get_embeddings(texts)
+        except Exception as e:
+            print(f"Warning: Could not embed text for similarity cache: {e}")
+            return None
+        matrix = np.array([e.values for e in embeddings], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        if not norms.all():
+            return None
+        matrix /= norms
+        return matrix
+
+    def _embed_query(self, query: str):
+        """Return the query's unit-norm embedding, or None if it can't be computed."""
+        matrix = self._embed_texts([query])
+        return None if matrix is None else matrix[0]
+
+    @staticmethod
+    def _rerank(q: np.ndarray, chunks: np.ndarray, k: int = TOP_K,
+                threshold: float = DISTANCE_THRESHOLD) -> np.ndarray:
+        """Indices of the k chunks nearest to q within threshold, best first.
+
+        Both arguments are unit-norm float32, so one matrix-vector product
+        gives every cosine distance, filtered the way retrieval_query would.
+        """
+        return _filter_topk(1.0 - chunks @ q, threshold, k)
+
+    @staticmethod
+    def _select_contexts(response, indices):
+        """Build a retrieval response holding only the contexts at indices, in order."""
+        contexts = response.contexts.contexts
+        return type(response)(contexts=type(response.contexts)(
+            contexts=[contexts[i] for i in indices]))
+
+    @classmethod
+    def _top_contexts(cls, response, k: int):
+        """Keep only the first k retrieved contexts of a retrieval response."""
+        if len(response.contexts.contexts) <= k:
+            return response
+        return cls._select_contexts(response, range(k))
+
+    def _rerank_similar(self, embedding: np.ndarray, similar):
+        """Reorder a near-duplicate query's contexts by similarity to this query."""
+        similar_query, response, chunk_embeddings = similar
+        contexts = response.contexts.contexts
+        if not contexts:
+            return response
+        if chunk_embeddings is None:
+            # Embedded once per cached response, then reused by later hits
+            chunk_embeddings = self._embed_texts([c.text for c in contexts])
+            if chunk_embeddings is None:
+                return self._top_contexts(response, TOP_K)
+            self._similar_queries.set_chunk_embeddings(similar_query, chunk_embeddings)
+        return self._select_contexts(response, self._rerank(embedding, chunk_embeddings))
+
     def get_chunks(self, query: str):
+        self._require_ingested()
+        if self._chunk_cache is not None:
+            key = self._chunk_cache.make_key(self.rag_corpus.name, query)
+            response = self._chunk_cache.get(key)
+            if response is not None:
+                return response
+
+        # Reuse the deeper result list of a near-duplicate recent query
+        embedding = self._embed_query(query)
+        if embedding is not None:
+            similar = self._similar_queries.lookup(embedding)
+            if similar is not None:
+                return self._rerank_similar(embedding, similar)
+
         response = rag.retrieval_query(
             rag_resources=[
                 rag.RagResource(
@@ -351,40 +807,173 @@ class SciRagVertexAI(SciRag):
                 )
             ],
             rag_retrieval_config=rag.RagRetrievalConfig(
-                top_k=TOP_K,  # Optional
+                top_k=SIMILAR_QUERY_TOP_K,  # Optional
                 filter=rag.Filter(
                     vector_distance_threshold=DISTANCE_THRESHOLD,  # Optional
                 ),
             ),
                     text=query,
                 )
+        if embedding is not None:
+            self._similar_queries.add(query, embedding, response)
+        response = self._top_contexts(response, TOP_K)
+        if self._chunk_cache is not None:
+            self._chunk_cache.set(key, response)
         return response
 
 
 
     def get_response(self, query: str):
+        self._require_ingested()
          # Count input tokens
 
         input_tokens = self._count_tokens(query)
         
-        response = self.client.models.generate_content(
-            model=self.gen_model,
-            contents=self.enhanced_query(query),
-            config=GenerateContentConfig(tools=[self.rag_retrieval_tool],
-                                         temperature=TEMPERATURE,
-                                         system_instruction=self.rag_prompt,
-                                         tool_config=tool_config,
-                                         response_mime_type='application/json',
-                                         response_schema=AnswerFormat,
-                                         ),
-        )
+        cache_name = self._get_prompt_cache()
+        try:
+            response = self.client.models.generate_content(
+                model=self.gen_model,
+                contents=self.enhanced_query(query),
+                config=self._generate_content_config(cache_name),
+            )
+        except Exception as e:
+            if cache_name is None or not _is_missing_cache_error(e):
+                raise
+            # The cache expired or was deleted server side; replace it once
+            response = self.client.models.generate_content(
+                model=self.gen_model,
+                contents=self.enhanced_query(query),
+                config=self._generate_content_config(self._get_prompt_cache(stale_name=cache_name)),
+            )
+        return self._finish_response(input_tokens, response)
+
+    async def aget_response(self, query: str):
+        """
+        Asynchronous get_response over the client's aio interface.
+
+        Args:
+            query: The question to answer
+
+        Returns:
+            str: Formatted answer with sources
+        """
+        self._require_ingested()
+        input_tokens = self._count_tokens(query)
+
+        # Creating the prompt cache is a blocking call, made about once per TTL
+        cache_name = await asyncio.to_thread(self._get_prompt_cache)
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.gen_model,
+                contents=self.enhanced_query(query),
+                config=self._generate_content_config(cache_name),
+            )
+        except Exception as e:
+            if cache_name is None or not _is_missing_cache_error(e):
+                raise
+            # The cache expired or was deleted server side; replace it once
+            cache_name = await asyncio.to_thread(self._get_prompt_cache, cache_name)
+            response = await self.client.aio.models.generate_content(
+                model=self.gen_model,
+                contents=self.enhanced_query(query),
+                config=self._generate_content_config(cache_name),
+            )
+        return self._finish_response(input_tokens, response)
+
+    async def aget_response_batch(self, queries: List[str],
+                                  concurrency: int = ASYNC_QUERY_CONCURRENCY) -> List[str]:
+        """
+        Answer several questions concurrently on one event loop.
+
+        Args:
+            queries: The questions to answer
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            List[str]: Formatted answers, in the same order as queries
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(query: str) -> str:
+            async with semaphore:
+                return await self.aget_response(query)
+
+        return await asyncio.gather(*(bounded(query) for query in queries))
+
+    def _generate_content_config(self, cache_name):
+        """Return the generation config, using the prompt cache when available.
+
+        Configs are immutable per cache name, so each is built once and reused.
+        """
+        config = self._content_configs.get(cache_name)
+        if config is not None:
+            return config
+        if cache_name is not None:
+            # Configs for replaced caches are never used again
+            for stale in [name for name in self._content_configs if name is not None]:
+                del self._content_configs[stale]
+            # The system prompt and tools are served from the context cache
+            config = GenerateContentConfig(temperature=TEMPERATURE,
+                                           cached_content=cache_name,
+                                           response_mime_type='application/json',
+                                           response_schema=AnswerFormat,
+                                           )
+        else:
+            config = GenerateContentConfig(tools=[self.rag_retrieval_tool],
+                                           temperature=TEMPERATURE,
+                                           system_instruction=self.rag_prompt,
+                                           tool_config=tool_config,
+                                           response_mime_type='application/json',
+                                           response_schema=AnswerFormat,
+                                           )
+        self._content_configs[cache_name] = config
+        return config
+
+    def _finish_response(self, input_tokens: int, response) -> str:
+        """Record usage and cost for a generation, then format its answer."""
         output_text = response.text
         output_tokens = self._count_tokens(output_text)
         # Calculate and log cost
         total_cost = self._calculate_cost(input_tokens, output_tokens)
         self._log_usage_and_cost(input_tokens, output_tokens, total_cost)
-        return self.format_agent_output(response.text)
-    
+        return self.format_agent_output(output_text)
+
+    def _get_prompt_cache(self, stale_name=None):
+        """
+        Return the name of the context cache holding the static prompt and tools.
+
+        One cache is shared by every instance with the same model, corpus and
+        prompt. It is replaced shortly before its TTL runs out, or right away
+        when a request reported it missing (pass that name as stale_name).
+        Returns None when caching is unavailable, e.g. when the prompt is
+        below the model's minimum cacheable size; get_response then sends
+        the prompt with every request.
+        """
+        key = (self.gen_model, self.rag_corpus.name, self.rag_prompt)
+        with _PROMPT_CACHES_LOCK:
+            entry = _PROMPT_CACHES.get(key)
+            now = time.monotonic()
+            if (entry is not None and now < entry.expires
+                    and (stale_name is None or entry.name != stale_name)):
+                return entry.name
+
+            name = None
+            try:
+                cache = self.client.caches.create(
+                    model=self.gen_model,
+                    config=CreateCachedContentConfig(
+                        system_instruction=self.rag_prompt,
+                        tools=[self.rag_retrieval_tool],
+                        tool_config=tool_config,
+                        ttl=f"{PROMPT_CACHE_TTL}s",
+                    ),
+                )
+                name = cache.name
+            except Exception as e:
+                print(f"Warning: Could not create prompt cache, sending the prompt with each request: {e}")
+            _PROMPT_CACHES[key] = _PromptCache(
+                self.client, name, now + PROMPT_CACHE_TTL - PROMPT_CACHE_REFRESH_MARGIN)
+        return name
 
     def format_agent_output(self, response):
         parsed = json.loads(response)
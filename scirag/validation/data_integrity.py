@@ -15,9 +15,9 @@
             - validate_processing_pipeline(input_data: Any, output_chunks: List[EnhancedChunk]) -> Tuple[bool, List[str]] (line 190)
             - _validate_pipeline_consistency(input_data: Any, output_chunks: List[EnhancedChunk]) (line 221)
             - validate_mathematical_processing(equation_tex: str, processed_result: Dict[str, Any]) -> Tuple[bool, List[str]] (line 243)
-            - _validate_kgrams_consistency(tokens: List[str], kgrams: List[str]) -> bool (line 300)
-            - generate_integrity_report(chunks: List[EnhancedChunk]) -> Dict[str, Any] (line 313)
-            - export_validation_report(chunks: List[EnhancedChunk], format: str = 'json') -> str (line 362)
+            - _validate_kgrams_consistency(tokens: List[str], kgrams: List[Tuple[str, ...]]) -> bool (line 300)
+            - generate_integrity_report(chunks: List[EnhancedChunk]) -> Dict[str, Any] (line 315)
+            - export_validation_report(chunks: List[EnhancedChunk], format: str = 'json') -> str (line 364)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Data integrity checker for Enhanced SciRAG.
@@ -297,7 +297,7 @@ class DataIntegrityChecker:
         
         return is_valid, all_messages
     
-    def _validate_kgrams_consistency(self, tokens: List[str], kgrams: List[str]) -> bool:
+    def _validate_kgrams_consistency(self, tokens: List[str], kgrams: List[Tuple[str, ...]]) -> bool:
         """Validate that k-grams are consistent with tokens."""
         if not tokens or not kgrams:
             return True
@@ -305,6 +305,8 @@ class DataIntegrityChecker:
         # Basic check: k-grams should be substrings of token sequences
         token_string = ' '.join(tokens)
         for kgram in kgrams:
+            if isinstance(kgram, tuple):
+                kgram = ' '.join(kgram)
             if kgram not in token_string:
                 return False
         
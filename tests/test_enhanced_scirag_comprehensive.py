@@ -4,38 +4,45 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - TestBackwardCompatibility (line 82):
-            - test_original_scirag_imports() (line 85)
-            - test_enhanced_scirag_imports() (line 96)
-            - test_feature_flags() (line 107)
-        - TestEnhancedProcessingComponents (line 121):
-            - test_mathematical_processor() (line 124)
-            - test_content_classifier() (line 138)
-            - test_enhanced_chunker() (line 152)
-            - test_asset_processor() (line 163)
-            - test_glossary_extractor() (line 175)
-        - TestEnhancedChunkDataStructures (line 187):
-            - test_enhanced_chunk_creation() (line 190)
-            - test_mathematical_content() (line 205)
-            - test_asset_content() (line 217)
-            - test_glossary_content() (line 229)
-        - TestDocumentProcessingPipeline (line 242):
-            - test_enhanced_document_processor() (line 245)
-            - test_processing_with_mathematical_content() (line 283)
-        - TestErrorHandlingAndGracefulDegradation (line 320):
-            - test_processing_with_invalid_content() (line 323)
-            - test_processing_with_corrupted_file() (line 339)
-            - test_fallback_behavior() (line 353)
-        - TestPerformanceAndMemoryUsage (line 360):
-            - test_memory_usage() (line 363)
-            - test_processing_time() (line 390)
-        - TestIntegrationAndEndToEnd (line 424):
-            - test_enhanced_scirag_initialization() (line 427)
-            - test_enhanced_chunk_serialization() (line 444)
-            - test_content_type_filtering() (line 472)
-        - TestConfigurationAndFeatureFlags (line 494):
-            - test_feature_flag_combinations() (line 497)
-            - test_environment_variable_configuration() (line 520)
+        - TestBackwardCompatibility (line 89):
+            - test_original_scirag_imports() (line 92)
+            - test_enhanced_scirag_imports() (line 103)
+            - test_feature_flags() (line 114)
+        - TestEnhancedProcessingComponents (line 128):
+            - test_mathematical_processor() (line 131)
+            - test_content_classifier() (line 145)
+            - test_enhanced_chunker() (line 159)
+            - test_asset_processor() (line 170)
+            - test_glossary_extractor() (line 182)
+        - TestEnhancedChunkDataStructures (line 194):
+            - test_enhanced_chunk_creation() (line 197)
+            - test_mathematical_content() (line 212)
+            - test_asset_content() (line 224)
+            - test_glossary_content() (line 236)
+        - TaggingDocumentProcessor (line 249):
+            - process_document(file_path, source_id) (line 257)
+        - TestDocumentProcessingPipeline (line 264):
+            - test_enhanced_document_processor() (line 267)
+            - test_worker_processes_use_processor_subclass(tmp_path) (line 305)
+            - test_prefetch_reader_stops_with_consumer(tmp_path) (line 322)
+            - test_processing_with_mathematical_content() (line 343)
+        - TestErrorHandlingAndGracefulDegradation (line 380):
+            - test_processing_with_invalid_content() (line 383)
+            - test_processing_with_corrupted_file() (line 399)
+            - test_fallback_behavior() (line 413)
+            - test_validation_with_malformed_chunks() (line 419)
+        - TestPerformanceAndMemoryUsage (line 442):
+            - test_memory_usage() (line 445)
+            - test_processing_time() (line 472)
+        - TestIntegrationAndEndToEnd (line 506):
+            - test_enhanced_scirag_initialization() (line 509)
+            - test_enhanced_chunk_serialization() (line 526)
+            - test_content_type_filtering() (line 554)
+            - test_chunk_lookups_follow_in_place_changes() (line 575)
+            - test_openai_cached_responses_follow_in_place_changes() (line 612)
+        - TestConfigurationAndFeatureFlags (line 641):
+            - test_feature_flag_combinations() (line 644)
+            - test_environment_variable_configuration() (line 667)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Comprehensive Test Suite for Enhanced SciRAG with RAGBook Integration
@@ -239,6 +246,21 @@ class TestEnhancedChunkDataStructures:
         assert glossary_content.context == "astrophysics"
 
 
+class TaggingDocumentProcessor(EnhancedDocumentProcessor):
+    """Document processor subclass that tags its chunks, for worker tests."""
+
+    def __init__(self, tag="tagged", **kwargs):
+        super().__init__(**kwargs)
+        self.tag = tag
+        self._worker_config['tag'] = tag
+
+    def process_document(self, file_path, source_id):
+        chunks = super().process_document(file_path, source_id)
+        for chunk in chunks:
+            chunk.metadata['tag'] = self.tag
+        return chunks
+
+
 class TestDocumentProcessingPipeline:
     """Test the complete document processing pipeline."""
 
@@ -280,6 +302,44 @@ class TestDocumentProcessingPipeline:
             finally:
                 os.unlink(f.name)
 
+    def test_worker_processes_use_processor_subclass(self, tmp_path):
+        """Test that process pool workers rebuild the processor's own class."""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"doc_{i}.md"
+            path.write_text(f"# Document {i}\n\nThis is test paragraph {i}.\n")
+            paths.append(path)
+
+        processor = TaggingDocumentProcessor(tag="worker", chunk_size=500)
+        chunks = processor.process_multiple_documents(
+            paths, [f"doc_{i}" for i in range(3)], max_workers=2)
+
+        assert chunks
+        assert [chunk.source_id for chunk in chunks] == sorted(
+            chunk.source_id for chunk in chunks)
+        assert all(chunk.metadata['tag'] == "worker" for chunk in chunks)
+
+    def test_prefetch_reader_stops_with_consumer(self, tmp_path):
+        """Test that the prefetch reader thread exits when iteration stops early."""
+        import threading
+
+        jobs = []
+        for i in range(8):
+            path = tmp_path / f"doc_{i}.md"
+            path.write_text(f"Document {i}\n")
+            jobs.append((path, f"doc_{i}"))
+
+        processor = EnhancedDocumentProcessor()
+        documents = processor.prefetch_documents(jobs)
+        file_path, source_id, content = next(documents)
+        assert (file_path, source_id, content) == (jobs[0][0], "doc_0", b"Document 0\n")
+        documents.close()
+
+        for thread in threading.enumerate():
+            if thread.name == 'document-prefetch':
+                thread.join(timeout=5)
+                assert not thread.is_alive()
+
     def test_processing_with_mathematical_content(self):
         """Test processing documents with mathematical content."""
         processor = EnhancedDocumentProcessor()
@@ -356,6 +416,28 @@ class TestErrorHandlingAndGracefulDegradation:
         # when enhanced processing encounters errors
         pass
 
+    def test_validation_with_malformed_chunks(self):
+        """Test that malformed chunks are counted invalid without breaking lookups."""
+        scirag = SciRagEnhanced(enable_enhanced_processing=False)
+        equation = EnhancedChunk(
+            "2", "E = mc^2", "source", 1, ContentType.EQUATION,
+            mathematical_content=MathematicalContent(
+                equation_tex=r"E = mc^2", math_norm="E=mc^2"))
+        scirag.enhanced_chunks = [
+            EnhancedChunk("1", "Regular text", "source", 0, None),
+            equation,
+            object(),
+            EnhancedChunk("3", "Figure text", "source", 2, "figure"),
+            EnhancedChunk("4", "", "source", 3, ContentType.PROSE)]
+
+        result = scirag.validate_enhanced_chunks()
+        assert result['total_chunks'] == 5
+        assert result['valid_chunks'] == 1
+        assert result['invalid_chunks'] == 4
+        assert result['content_type_distribution'] == {'equation': 1}
+        assert scirag.get_mathematical_chunks() == [equation]
+        assert scirag.get_chunks_by_type(ContentType.EQUATION) == [equation]
+
 
 class TestPerformanceAndMemoryUsage:
     """Test performance and memory usage."""
@@ -490,6 +572,71 @@ class TestIntegrationAndEndToEnd:
         assert len(equation_chunks) == 1
         assert len(figure_chunks) == 1
 
+    def test_chunk_lookups_follow_in_place_changes(self):
+        """Test that filters and contexts see chunks added or replaced in place."""
+        scirag = SciRagEnhanced(enable_enhanced_processing=False)
+        scirag.enhanced_chunks = [
+            EnhancedChunk("1", "Regular text", "source", 0, ContentType.PROSE),
+            EnhancedChunk("2", "E = mc^2", "source", 1, ContentType.EQUATION)]
+        assert len(scirag.get_chunks_by_type(ContentType.EQUATION)) == 1
+        assert scirag.get_mathematical_chunks() == []
+        assert scirag._build_context_from_chunks(
+            scirag.enhanced_chunks[:1]) == "Regular text"
+
+        equation = EnhancedChunk(
+            "3", "F = ma", "source", 2, ContentType.EQUATION,
+            mathematical_content=MathematicalContent(
+                equation_tex=r"F = ma", math_norm="F=ma"))
+        scirag.enhanced_chunks.append(equation)
+        assert len(scirag.get_chunks_by_type(ContentType.EQUATION)) == 2
+        assert scirag.get_mathematical_chunks() == [equation]
+
+        scirag.enhanced_chunks.extend([
+            EnhancedChunk("4", "Figure content", "source", 3, ContentType.FIGURE)])
+        assert len(scirag.get_chunks_by_type(ContentType.FIGURE)) == 1
+
+        scirag.enhanced_chunks[0] = EnhancedChunk(
+            "5", "Replaced text", "source", 0, ContentType.EQUATION)
+        assert scirag.get_chunks_by_type(ContentType.PROSE) == []
+        assert [chunk.id for chunk in scirag.get_chunks_by_type(
+            ContentType.EQUATION)] == ["5", "2", "3"]
+        assert scirag._build_context_from_chunks(
+            scirag.enhanced_chunks[:1]) == "Replaced text"
+        assert scirag.validate_enhanced_chunks()['total_chunks'] == 4
+
+        del scirag.enhanced_chunks[1:]
+        assert [chunk.id for chunk in scirag.get_chunks_by_type(
+            ContentType.EQUATION)] == ["5"]
+        assert scirag.get_asset_chunks() == []
+
+    def test_openai_cached_responses_follow_in_place_changes(self):
+        """Test that cached OpenAI answers are dropped when chunks change in place."""
+        if not OPENAI_ENHANCED_AVAILABLE:
+            pytest.skip("OpenAI Enhanced SciRAG not available")
+
+        scirag = SciRagOpenAIEnhanced(client=object())
+        prompts = []
+
+        def generate(prompt):
+            prompts.append(prompt)
+            return f"answer {len(prompts)}"
+
+        scirag._generate_response_with_prompt = generate
+        scirag.enhanced_chunks = [
+            EnhancedChunk("1", "Regular text", "source", 0, ContentType.PROSE)]
+        assert scirag.get_enhanced_response("What is E?") == "answer 1"
+        assert scirag.get_enhanced_response("What is E?") == "answer 1"
+
+        scirag.enhanced_chunks.append(
+            EnhancedChunk("2", "E = mc^2", "source", 1, ContentType.EQUATION))
+        assert scirag.get_enhanced_response("What is E?") == "answer 2"
+        assert "E = mc^2" in prompts[-1]
+
+        scirag.enhanced_chunks[0] = EnhancedChunk(
+            "3", "Replaced text", "source", 0, ContentType.PROSE)
+        assert scirag.get_enhanced_response("What is E?") == "answer 3"
+        assert "Replaced text" in prompts[-1]
+
 
 class TestConfigurationAndFeatureFlags:
     """Test configuration and feature flags."""
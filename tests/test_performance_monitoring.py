@@ -4,27 +4,35 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - TestPerformanceBenchmarks (line 56):
-            - test_document_processing_performance() (line 59)
-            - test_mathematical_processing_performance() (line 102)
-            - test_content_classification_performance() (line 132)
-        - TestMemoryUsage (line 162):
-            - test_memory_usage_during_processing() (line 165)
-            - test_memory_cleanup_after_processing() (line 193)
-        - TestErrorRateMonitoring (line 224):
-            - test_error_tracking() (line 227)
-            - test_health_check_functionality() (line 247)
-        - TestResponseTimeMonitoring (line 265):
-            - test_response_time_tracking() (line 268)
-            - test_response_time_thresholds() (line 293)
-        - TestSystemHealthChecks (line 311):
-            - test_cpu_usage_monitoring() (line 314)
-            - test_memory_usage_monitoring() (line 323)
-            - test_health_check_comprehensive() (line 332)
-            - test_metrics_export() (line 351)
-        - TestPerformanceRegression (line 373):
-            - test_processing_time_regression() (line 376)
-            - test_memory_usage_regression() (line 420)
+        - TestPerformanceBenchmarks (line 65):
+            - test_document_processing_performance() (line 68)
+            - test_mathematical_processing_performance() (line 111)
+            - test_content_classification_performance() (line 141)
+        - TestMemoryUsage (line 171):
+            - test_memory_usage_during_processing() (line 174)
+            - test_memory_cleanup_after_processing() (line 202)
+        - TestErrorRateMonitoring (line 233):
+            - test_error_tracking() (line 236)
+            - test_health_check_functionality() (line 256)
+        - TestResponseTimeMonitoring (line 274):
+            - test_response_time_tracking() (line 277)
+            - test_response_time_thresholds() (line 302)
+            - test_response_time_window() (line 320)
+            - test_zero_history() (line 336)
+        - TestRingBuffer (line 350):
+            - test_append_and_wrap() (line 353)
+            - test_clear() (line 371)
+            - test_zero_capacity() (line 382)
+            - test_negative_capacity() (line 392)
+        - TestSystemHealthChecks (line 398):
+            - test_cpu_usage_monitoring() (line 401)
+            - test_memory_usage_monitoring() (line 410)
+            - test_health_check_comprehensive() (line 419)
+            - test_health_check_reads_live_thresholds() (line 438)
+            - test_metrics_export() (line 455)
+        - TestPerformanceRegression (line 477):
+            - test_processing_time_regression() (line 480)
+            - test_memory_usage_regression() (line 524)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Performance and Monitoring Test Suite for Enhanced SciRAG
@@ -44,13 +52,14 @@ import os
 from pathlib import Path
 from typing import List, Dict, Any
 import statistics
+import numpy as np
 
 # Import enhanced processing components
 from scirag.enhanced_processing import (
     EnhancedDocumentProcessor, MathematicalProcessor, ContentClassifier,
     EnhancedChunker, AssetProcessor, GlossaryExtractor
 )
-from scirag.enhanced_processing.monitoring import EnhancedProcessingMonitor
+from scirag.enhanced_processing.monitoring import EnhancedProcessingMonitor, RingBuffer
 
 
 class TestPerformanceBenchmarks:
@@ -308,6 +317,84 @@ class TestResponseTimeMonitoring:
         # Should indicate performance issues
 
 
+    def test_response_time_window(self):
+        """Test that running statistics cover only the latest max_history samples."""
+        monitor = EnhancedProcessingMonitor(max_history=5)
+        response_times = [0.5, 0.1, 0.9, 0.3, 0.2, 0.4, 0.8, 0.05, 0.6, 0.7, 0.15, 0.25]
+        
+        for i, response_time in enumerate(response_times):
+            monitor.record_success(f"operation_{i}", response_time)
+            window = response_times[max(0, i - 4):i + 1]
+            metrics = monitor.get_metrics()
+            assert metrics['avg_response_time'] == pytest.approx(statistics.mean(window))
+            assert metrics['max_response_time'] == max(window)
+            assert metrics['min_response_time'] == min(window)
+        
+        assert monitor.success_count == len(response_times)
+        assert list(monitor.response_times) == response_times[-5:]
+    
+    def test_zero_history(self):
+        """Test that a monitor without history still counts operations."""
+        monitor = EnhancedProcessingMonitor(max_history=0)
+        
+        monitor.record_success("operation", 0.1)
+        monitor.record_error("operation", "failed")
+        
+        metrics = monitor.get_metrics()
+        assert metrics['success_count'] == 1
+        assert metrics['error_count'] == 1
+        assert metrics['avg_response_time'] == 0.0
+        assert monitor.get_error_history() == []
+
+
+class TestRingBuffer:
+    """Test the NumPy ring buffer behind the monitor history."""
+    
+    def test_append_and_wrap(self):
+        """Test that the oldest values are overwritten once the buffer is full."""
+        buffer = RingBuffer(3)
+        assert len(buffer) == 0
+        assert buffer.to_array().tolist() == []
+        
+        for value in range(1, 6):
+            buffer.append(value)
+        
+        assert len(buffer) == 3
+        assert buffer.to_array().tolist() == [3.0, 4.0, 5.0]
+        assert list(buffer) == [3.0, 4.0, 5.0]
+        assert sorted(buffer.view().tolist()) == [3.0, 4.0, 5.0]
+        assert buffer[0] == 3.0
+        assert buffer[-1] == 5.0
+        with pytest.raises(IndexError):
+            buffer[3]
+    
+    def test_clear(self):
+        """Test that clearing empties the buffer for reuse."""
+        buffer = RingBuffer(2, dtype=np.int64)
+        buffer.append(1)
+        buffer.append(2)
+        buffer.clear()
+        assert len(buffer) == 0
+        
+        buffer.append(7)
+        assert list(buffer) == [7]
+    
+    def test_zero_capacity(self):
+        """Test that a zero capacity buffer keeps nothing."""
+        buffer = RingBuffer(0)
+        buffer.append(1.0)
+        
+        assert len(buffer) == 0
+        assert list(buffer) == []
+        with pytest.raises(IndexError):
+            buffer[-1]
+    
+    def test_negative_capacity(self):
+        """Test that a negative capacity is rejected."""
+        with pytest.raises(ValueError):
+            RingBuffer(-1)
+
+
 class TestSystemHealthChecks:
     """Test system health check functionality."""
     
@@ -348,6 +435,23 @@ class TestSystemHealthChecks:
         assert isinstance(health_status['memory_usage'], float)
         assert isinstance(health_status['error_rate'], float)
     
+    def test_health_check_reads_live_thresholds(self):
+        """Test that health checks and metrics follow threshold changes."""
+        monitor = EnhancedProcessingMonitor()
+        monitor.record_success("operation", 0.3)
+        thresholds = monitor.get_metrics()['thresholds']
+        
+        assert monitor.check_health()['status'] == 'healthy'
+        monitor.set_threshold('max_response_time', 0.2)
+        assert thresholds['max_response_time'] == 0.2
+        health_status = monitor.check_health()
+        assert health_status['status'] == 'unhealthy'
+        assert health_status['avg_response_time'] == pytest.approx(0.3)
+        
+        with pytest.raises(TypeError):
+            thresholds['max_response_time'] = 1.0
+        assert monitor.get_thresholds() == dict(thresholds)
+    
     def test_metrics_export(self):
         """Test metrics export functionality."""
         monitor = EnhancedProcessingMonitor()
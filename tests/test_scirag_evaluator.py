@@ -0,0 +1,363 @@
+"""
+    --- AUTO-GENERATED DOCSTRING ---
+    Table of content is automatically generated by Agent Docstrings v1.3.5
+    
+    Classes/Functions:
+        - _judge_arguments(task) (line 50)
+        - _completion_body(arguments) (line 59)
+        - FakeCompletions (line 82):
+            - create(**request) (line 88)
+        - FakeFiles (line 97):
+            - create(file, purpose) (line 103)
+            - content(file_id) (line 108)
+        - FakeBatches (line 112):
+            - create(input_file_id, endpoint, completion_window) (line 119)
+            - retrieve(batch_id) (line 124)
+        - FakeOpenAI (line 145):
+        - fake_openai(monkeypatch) (line 155)
+        - TestJudgeCache (line 160):
+            - test_cache_key(tmp_path, fake_openai) (line 164)
+            - test_cached_evaluation_skips_api(tmp_path, fake_openai) (line 185)
+            - test_failed_write_leaves_no_entry(tmp_path, fake_openai, monkeypatch) (line 203)
+            - test_failures_not_cached(tmp_path, fake_openai) (line 220)
+        - TestBatchEvaluation (line 232):
+            - test_results_follow_input_order(tmp_path, fake_openai) (line 236)
+            - test_missing_results_are_errors(fake_openai, monkeypatch) (line 261)
+        - TestStreamedResults (line 283):
+            - _responses() (line 287)
+            - test_file_matches_returned_frame(tmp_path, fake_openai) (line 298)
+            - test_out_of_order_results_written_in_input_order(tmp_path, fake_openai, monkeypatch) (line 318)
+            - test_interrupted_run_keeps_finished_rows(tmp_path, fake_openai, monkeypatch) (line 343)
+    --- END AUTO-GENERATED DOCSTRING ---
+
+Unit Tests for the OpenAI judge in scirag_evaluator
+
+The OpenAI client is replaced by an in-memory fake, so these tests never
+call the API.
+"""
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+evaluator_module = pytest.importorskip("scirag.scirag_evaluator")
+AIEvaluator = evaluator_module.AIEvaluator
+SingleRAGEvaluationSystem = evaluator_module.SingleRAGEvaluationSystem
+pd = evaluator_module.pd
+
+
+def _judge_arguments(task):
+    """Tool arguments the fake judge returns for an evaluation task."""
+    question = task.split("QUESTION: ")[1].split("\n")[0]
+    if "FAIL" in question:
+        raise RuntimeError(f"judge failed on {question}")
+    return json.dumps({"accuracy_score": 100 if "right" in task else 0,
+                       "rationale": f"judged {question}"})
+
+
+def _completion_body(arguments):
+    """Chat completion payload with one evaluate_response tool call."""
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [{
+            "index": 0,
+            "finish_reason": "tool_calls",
+            "message": {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [{
+                    "id": "call-test",
+                    "type": "function",
+                    "function": {"name": "evaluate_response", "arguments": arguments},
+                }],
+            },
+        }],
+    }
+
+
+class FakeCompletions:
+    """chat.completions stand-in answering with _judge_arguments."""
+
+    def __init__(self):
+        self.requests = []
+
+    def create(self, **request):
+        self.requests.append(request)
+        function = SimpleNamespace(
+            name="evaluate_response",
+            arguments=_judge_arguments(request["messages"][-1]["content"]))
+        message = SimpleNamespace(tool_calls=[SimpleNamespace(function=function)])
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeFiles:
+    """files stand-in keeping uploaded and generated files in memory."""
+
+    def __init__(self):
+        self.contents = {}
+
+    def create(self, file, purpose):
+        file_id = f"file-{len(self.contents)}"
+        self.contents[file_id] = file[1].decode("utf-8")
+        return SimpleNamespace(id=file_id)
+
+    def content(self, file_id):
+        return SimpleNamespace(text=self.contents[file_id])
+
+
+class FakeBatches:
+    """batches stand-in that completes on the first poll, answering out of order."""
+
+    def __init__(self, files):
+        self.files = files
+        self.submitted = []
+
+    def create(self, input_file_id, endpoint, completion_window):
+        self.submitted = [json.loads(line)
+                          for line in self.files.contents[input_file_id].splitlines()]
+        return SimpleNamespace(id="batch-test", status="validating")
+
+    def retrieve(self, batch_id):
+        output, errors = [], []
+        for request in reversed(self.submitted):
+            try:
+                arguments = _judge_arguments(request["body"]["messages"][-1]["content"])
+            except RuntimeError as e:
+                errors.append(json.dumps({
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 500, "body": {"error": {"message": str(e)}}},
+                    "error": None}))
+                continue
+            output.append(json.dumps({
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": _completion_body(arguments)},
+                "error": None}))
+        self.files.contents["output"] = "\n".join(output)
+        self.files.contents["errors"] = "\n".join(errors)
+        return SimpleNamespace(id=batch_id, status="completed",
+                               output_file_id="output", error_file_id="errors")
+
+
+class FakeOpenAI:
+    """OpenAI client stand-in."""
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=FakeCompletions())
+        self.files = FakeFiles()
+        self.batches = FakeBatches(self.files)
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    """Make AIEvaluator build FakeOpenAI clients."""
+    monkeypatch.setattr(evaluator_module, "OpenAI", FakeOpenAI)
+
+
+class TestJudgeCache:
+    """Test the on-disk cache of judge evaluations."""
+
+    @pytest.mark.unit
+    def test_cache_key(self, tmp_path, fake_openai):
+        """Test that the cache file is keyed by the whole judge request."""
+        evaluator = AIEvaluator(cache_dir=str(tmp_path))
+        request = evaluator._build_request(
+            evaluator._build_evaluation_task("Q?", "answer", "ideal"))
+        path = evaluator._cache_path(request)
+
+        assert path == evaluator._cache_path(dict(reversed(list(request.items()))))
+        name = os.path.basename(path)
+        assert os.path.dirname(path) == os.path.join(str(tmp_path), name[:2])
+        assert name.endswith(".json")
+
+        other_task = evaluator._build_request(
+            evaluator._build_evaluation_task("Q?", "other answer", "ideal"))
+        assert evaluator._cache_path(other_task) != path
+        assert evaluator._cache_path({**request, "model": "gpt-4o-mini"}) != path
+        assert evaluator._cache_path({**request, "temperature": 0.5}) != path
+
+        assert AIEvaluator()._cache_path(request) is None
+
+    @pytest.mark.unit
+    def test_cached_evaluation_skips_api(self, tmp_path, fake_openai):
+        """Test that a repeated evaluation is read from the cache."""
+        evaluator = AIEvaluator(cache_dir=str(tmp_path))
+        first = evaluator.evaluate_single_response("Q?", "the right answer", "ideal")
+        assert first["eval_successful"]
+        assert first["eval_accuracy_score"] == 100
+
+        # Another evaluator with the same settings reuses the file
+        again = AIEvaluator(cache_dir=str(tmp_path))
+        assert again.evaluate_single_response("Q?", "the right answer", "ideal") == first
+        assert again.client.chat.completions.requests == []
+
+        # The write went through a temporary file that was renamed into place
+        files = [name for _, _, names in os.walk(tmp_path) for name in names]
+        assert len(files) == 1
+        assert files[0].endswith(".json")
+
+    @pytest.mark.unit
+    def test_failed_write_leaves_no_entry(self, tmp_path, fake_openai, monkeypatch):
+        """Test that an interrupted write never leaves a partial cache file."""
+        evaluator = AIEvaluator(cache_dir=str(tmp_path))
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(evaluator_module.os, "replace", fail_replace)
+        result = evaluator.evaluate_single_response("Q?", "the right answer", "ideal")
+        assert result["eval_successful"]
+
+        request = evaluator._build_request(
+            evaluator._build_evaluation_task("Q?", "the right answer", "ideal"))
+        assert not os.path.exists(evaluator._cache_path(request))
+        assert not any(names for _, _, names in os.walk(tmp_path))
+
+    @pytest.mark.unit
+    def test_failures_not_cached(self, tmp_path, fake_openai):
+        """Test that failed evaluations are retried on the next run."""
+        evaluator = AIEvaluator(cache_dir=str(tmp_path))
+        result = evaluator.evaluate_single_response("FAIL?", "answer", "ideal")
+        assert not result["eval_successful"]
+        assert "judge failed" in result["eval_error"]
+        assert not any(names for _, _, names in os.walk(tmp_path))
+
+        evaluator.evaluate_single_response("FAIL?", "answer", "ideal")
+        assert len(evaluator.client.chat.completions.requests) == 2
+
+
+class TestBatchEvaluation:
+    """Test evaluations through the Batch API."""
+
+    @pytest.mark.unit
+    def test_results_follow_input_order(self, tmp_path, fake_openai):
+        """Test that results come back in input order, whatever the output order."""
+        evaluator = AIEvaluator(cache_dir=str(tmp_path))
+        cached = evaluator.evaluate_single_response("Q1?", "the right answer", "ideal")
+
+        evaluations = [
+            ("Q0?", "the right answer", "ideal"),
+            ("Q1?", "the right answer", "ideal"),
+            ("FAIL?", "answer", "ideal"),
+            ("Q3?", "a wrong answer", "ideal"),
+        ]
+        results = evaluator.evaluate_batch(evaluations, poll_interval=0)
+
+        # The cached evaluation is not submitted again
+        assert [request["custom_id"] for request in evaluator.client.batches.submitted] == \
+            ["0", "2", "3"]
+        assert results[1] == cached
+        assert results[0]["eval_rationale"] == "judged Q0?"
+        assert results[0]["eval_accuracy_score"] == 100
+        assert not results[2]["eval_successful"]
+        assert "judge failed on FAIL?" in results[2]["eval_error"]
+        assert results[3]["eval_rationale"] == "judged Q3?"
+        assert results[3]["eval_accuracy_score"] == 0
+
+    @pytest.mark.unit
+    def test_missing_results_are_errors(self, fake_openai, monkeypatch):
+        """Test that requests absent from the batch output get an error result."""
+        evaluator = AIEvaluator()
+        batches = evaluator.client.batches
+        complete = batches.retrieve
+
+        def drop_first_output(batch_id):
+            batch = complete(batch_id)
+            lines = evaluator.client.files.contents["output"].splitlines()
+            evaluator.client.files.contents["output"] = "\n".join(lines[1:])
+            return batch
+
+        monkeypatch.setattr(batches, "retrieve", drop_first_output)
+        results = evaluator.evaluate_batch(
+            [("Q0?", "answer", "ideal"), ("Q1?", "answer", "ideal")], poll_interval=0)
+
+        # Output lines are in reverse order, so the last request was dropped
+        assert results[0]["eval_rationale"] == "judged Q0?"
+        assert not results[1]["eval_successful"]
+        assert "batch completed" in results[1]["eval_error"]
+
+
+class TestStreamedResults:
+    """Test that evaluate_single_dataframe streams rows to its CSV file."""
+
+    @staticmethod
+    def _responses():
+        return pd.DataFrame({
+            "question_id": [1, 2, 3, 4],
+            "question": ["Q1?", "Q2?", "FAIL?", "Q4?"],
+            "answer": ["the right answer", None, "answer", "a wrong answer"],
+            "ideal_solution": ["ideal", "ideal", "ideal", "ideal"],
+            "asked_on": pd.to_datetime(["2024-01-01", "2024-01-02",
+                                        "2024-01-03", "2024-01-04"]),
+        }, index=[10, 20, 10, 40])
+
+    @pytest.mark.unit
+    def test_file_matches_returned_frame(self, tmp_path, fake_openai):
+        """Test that the streamed file holds every row in input order as to_csv would write it."""
+        system = SingleRAGEvaluationSystem(
+            evaluator_model="gpt-4o", results_dir=str(tmp_path),
+            evaluator_backend="autogen")
+        evaluated = system.evaluate_single_dataframe(
+            self._responses(), "Test System", max_concurrency=1)
+
+        [filename] = os.listdir(tmp_path)
+        assert filename.startswith("test_system_evaluated_")
+        with open(tmp_path / filename, encoding="utf-8") as f:
+            streamed = f.read()
+
+        # Repeated index labels don't duplicate rows
+        assert streamed == evaluated.to_csv(index=False)
+        assert evaluated["eval_accuracy_score"].tolist()[0] == 100
+        assert not evaluated["eval_successful"].tolist()[2]
+        assert pd.isna(evaluated["eval_successful"].tolist()[1])
+
+    @pytest.mark.unit
+    def test_out_of_order_results_written_in_input_order(self, tmp_path, fake_openai, monkeypatch):
+        """Test that results completing out of order are held until earlier rows are written."""
+        system = SingleRAGEvaluationSystem(
+            evaluator_model="gpt-4o", results_dir=str(tmp_path),
+            evaluator_backend="autogen")
+
+        def evaluate_backwards(jobs, system_name, max_concurrency, on_result):
+            results = {}
+            for position, label, question, answer, ideal in reversed(jobs):
+                results[position] = system.evaluator.evaluate_single_response(
+                    question=question, generated_answer=answer,
+                    ideal_answer=ideal, system_name=system_name)
+                results[position]["eval_processing_time"] = 0.5
+                on_result(position, results[position])
+            return [results[job[0]] for job in jobs]
+
+        monkeypatch.setattr(system, "_evaluate_jobs", evaluate_backwards)
+        evaluated = system.evaluate_single_dataframe(self._responses(), "Test System")
+
+        [filename] = os.listdir(tmp_path)
+        with open(tmp_path / filename, encoding="utf-8") as f:
+            assert f.read() == evaluated.to_csv(index=False)
+        assert evaluated["eval_rationale"].tolist()[3] == "judged Q4?"
+
+    @pytest.mark.unit
+    def test_interrupted_run_keeps_finished_rows(self, tmp_path, fake_openai, monkeypatch):
+        """Test that rows evaluated before an interruption are already on disk."""
+        system = SingleRAGEvaluationSystem(
+            evaluator_model="gpt-4o", results_dir=str(tmp_path),
+            evaluator_backend="autogen")
+        evaluate = system.evaluator.evaluate_single_response
+
+        def interrupt_on_last(question, **kwargs):
+            if question == "Q4?":
+                raise KeyboardInterrupt
+            return evaluate(question=question, **kwargs)
+
+        monkeypatch.setattr(system.evaluator, "evaluate_single_response", interrupt_on_last)
+        with pytest.raises(KeyboardInterrupt):
+            system.evaluate_single_dataframe(
+                self._responses(), "Test System", max_concurrency=1)
+
+        [filename] = os.listdir(tmp_path)
+        streamed = pd.read_csv(tmp_path / filename)
+        assert streamed["question_id"].tolist() == [1, 2, 3]
+        assert streamed["eval_rationale"].tolist()[0] == "judged Q1?"
@@ -0,0 +1,69 @@
+"""
+    --- AUTO-GENERATED DOCSTRING ---
+    Table of content is automatically generated by Agent Docstrings v1.3.5
+    
+    Classes/Functions:
+        - agent() (line 28)
+        - TestAnswerTruncation (line 33):
+            - test_short_answers_unchanged(agent) (line 37)
+            - test_long_answer_cut_after_third_sentence(agent) (line 44)
+            - test_citations_stay_with_their_sentence(agent) (line 51)
+            - test_abbreviations_do_not_end_sentences(agent) (line 57)
+            - test_structured_response_truncated(agent) (line 64)
+    --- END AUTO-GENERATED DOCSTRING ---
+
+Unit Tests for the Perplexity agent's response formatting
+
+These tests format canned Perplexity replies without calling the API.
+"""
+import json
+
+import pytest
+
+perplexity_module = pytest.importorskip("scirag.scirag_perplexity")
+PerplexityAgent = perplexity_module.PerplexityAgent
+
+
+@pytest.fixture
+def agent():
+    """Perplexity agent that is never sent a query."""
+    return PerplexityAgent()
+
+
+class TestAnswerTruncation:
+    """Test that structured answers are cut to MAX_ANSWER_SENTENCES sentences."""
+
+    @pytest.mark.unit
+    def test_short_answers_unchanged(self, agent):
+        """Test that answers within the limit are kept as they are."""
+        for answer in ["", "One sentence [1].", "One [1]. Two! Three? [2]"]:
+            assert agent._truncate_answer(answer) == answer
+        assert agent._truncate_answer(None) is None
+
+    @pytest.mark.unit
+    def test_long_answer_cut_after_third_sentence(self, agent):
+        """Test that sentences past the limit are dropped."""
+        answer = "H0 is 67.4 km/s/Mpc [1]. It is measured from the CMB! Is it settled? No. Tension remains."
+        assert agent._truncate_answer(answer) == (
+            "H0 is 67.4 km/s/Mpc [1]. It is measured from the CMB! Is it settled?")
+
+    @pytest.mark.unit
+    def test_citations_stay_with_their_sentence(self, agent):
+        """Test that markers after a terminator belong to the preceding sentence."""
+        answer = "One. Two. Three. [2][3] Four [4]."
+        assert agent._truncate_answer(answer) == "One. Two. Three. [2][3]"
+
+    @pytest.mark.unit
+    def test_abbreviations_do_not_end_sentences(self, agent):
+        """Test that a period followed by a lowercase word is not a sentence break."""
+        answer = "Smith et al. find a value, e.g. the CMB one. Two. Three. Four."
+        assert agent._truncate_answer(answer) == (
+            "Smith et al. find a value, e.g. the CMB one. Two. Three.")
+
+    @pytest.mark.unit
+    def test_structured_response_truncated(self, agent):
+        """Test that parsed JSON responses are formatted with the truncated answer."""
+        response = json.dumps({"answer": "A [1]. B. C. D [2].", "sources": ["1"]})
+        formatted = agent.parse_structured_response(response)
+        assert "A [1]. B. C." in formatted
+        assert "D [2]" not in formatted
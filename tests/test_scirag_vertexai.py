@@ -0,0 +1,190 @@
+"""
+    --- AUTO-GENERATED DOCSTRING ---
+    Table of content is automatically generated by Agent Docstrings v1.3.5
+    
+    Classes/Functions:
+        - clock(monkeypatch) (line 41)
+        - TestRetrievalCache (line 47):
+            - test_hit_and_miss(tmp_path, clock) (line 51)
+            - test_expiry(tmp_path, clock) (line 68)
+            - test_evicts_least_recently_used(tmp_path, clock) (line 76)
+            - test_opt_in(tmp_path) (line 89)
+        - _unit(vector) (line 102)
+        - TestSimilarQueryCache (line 108):
+            - test_near_duplicate_hit() (line 112)
+            - test_best_match_wins() (line 130)
+            - test_evicts_least_recently_used() (line 139)
+            - test_int8_scores_track_float_similarity() (line 152)
+        - TestQuantizeInt8 (line 172):
+            - test_round_trip() (line 176)
+            - test_zero_vector() (line 186)
+    --- END AUTO-GENERATED DOCSTRING ---
+
+Unit Tests for the Vertex AI SciRAG caches
+
+These tests exercise the local caches in scirag_vertexai without calling
+Vertex AI.
+"""
+import itertools
+
+import pytest
+
+vertexai_module = pytest.importorskip("scirag.scirag_vertexai")
+RetrievalCache = vertexai_module.RetrievalCache
+SciRagVertexAI = vertexai_module.SciRagVertexAI
+SimilarQueryCache = vertexai_module.SimilarQueryCache
+_quantize_int8 = vertexai_module._quantize_int8
+np = vertexai_module.np
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace time.time with a clock that ticks one second per call."""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(vertexai_module.time, "time", lambda: float(next(ticks)))
+
+
+class TestRetrievalCache:
+    """Test the on-disk retrieval response cache."""
+
+    @pytest.mark.unit
+    def test_hit_and_miss(self, tmp_path, clock):
+        """Test that stored responses are returned and unknown keys miss."""
+        cache = RetrievalCache(tmp_path / "retrieval.sqlite3")
+        key = cache.make_key("corpus", "what is dark energy?")
+        assert cache.get(key) is None
+
+        cache.set(key, {"contexts": ["a", "b"]})
+        assert cache.get(key) == {"contexts": ["a", "b"]}
+        assert cache.get(cache.make_key("other corpus", "what is dark energy?")) is None
+
+        # Entries survive reopening the database
+        assert RetrievalCache(tmp_path / "retrieval.sqlite3").get(key) == {"contexts": ["a", "b"]}
+
+        cache.clear()
+        assert cache.get(key) is None
+
+    @pytest.mark.unit
+    def test_expiry(self, tmp_path, clock):
+        """Test that entries older than the TTL miss."""
+        cache = RetrievalCache(tmp_path / "retrieval.sqlite3", ttl=2)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        assert cache.get("key") is None
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self, tmp_path, clock):
+        """Test that the least recently read or written entry is evicted first."""
+        cache = RetrievalCache(tmp_path / "retrieval.sqlite3", max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    @pytest.mark.unit
+    def test_opt_in(self, tmp_path):
+        """Test that the cache is off by default and off when it can't be opened."""
+        assert SciRagVertexAI._open_retrieval_cache(None) is None
+
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("")
+        assert SciRagVertexAI._open_retrieval_cache(blocker / "cache") is None
+
+        cache = SciRagVertexAI._open_retrieval_cache(tmp_path / "cache")
+        assert isinstance(cache, RetrievalCache)
+        assert (tmp_path / "cache" / vertexai_module.RETRIEVAL_CACHE_FILENAME).exists()
+
+
+def _unit(vector):
+    """Scale a vector to unit length, as query embeddings are."""
+    vector = np.asarray(vector, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class TestSimilarQueryCache:
+    """Test reuse of retrieval responses across near-duplicate queries."""
+
+    @pytest.mark.unit
+    def test_near_duplicate_hit(self):
+        """Test that a query close enough to a cached one reuses its response."""
+        cache = SimilarQueryCache(threshold=0.95)
+        assert cache.lookup(_unit([1, 0, 0])) is None
+
+        cache.add("dark energy", _unit([1, 0, 0]), "response")
+        assert cache.lookup(_unit([1, 0.1, 0])) == ("dark energy", "response", None)
+        assert cache.lookup(_unit([1, 1, 0])) is None
+
+        chunk_embeddings = np.eye(3, dtype=np.float32)
+        cache.set_chunk_embeddings("dark energy", chunk_embeddings)
+        cache.set_chunk_embeddings("unknown", chunk_embeddings)
+        assert cache.lookup(_unit([1, 0, 0]))[2] is chunk_embeddings
+
+        cache.clear()
+        assert cache.lookup(_unit([1, 0, 0])) is None
+
+    @pytest.mark.unit
+    def test_best_match_wins(self):
+        """Test that the most similar cached query is returned."""
+        cache = SimilarQueryCache(threshold=0.9)
+        cache.add("a", _unit([1, 0.3, 0]), "response a")
+        cache.add("b", _unit([1, 0, 0.1]), "response b")
+        assert cache.lookup(_unit([1, 0, 0.05]))[0] == "b"
+        assert cache.lookup(_unit([1, 0.25, 0]))[0] == "a"
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self):
+        """Test that a lookup hit refreshes an entry and the oldest is evicted."""
+        cache = SimilarQueryCache(capacity=2)
+        cache.add("x", _unit([1, 0, 0]), "x")
+        cache.add("y", _unit([0, 1, 0]), "y")
+        assert cache.lookup(_unit([1, 0, 0]))[0] == "x"
+        cache.add("z", _unit([0, 0, 1]), "z")
+
+        assert cache.lookup(_unit([0, 1, 0])) is None
+        assert cache.lookup(_unit([1, 0, 0]))[0] == "x"
+        assert cache.lookup(_unit([0, 0, 1]))[0] == "z"
+
+    @pytest.mark.unit
+    def test_int8_scores_track_float_similarity(self):
+        """Test that int8 similarities stay close to the float cosine similarity."""
+        rng = np.random.default_rng(0)
+        cached = [_unit(vector) for vector in rng.standard_normal((20, 768))]
+        cache = SimilarQueryCache(capacity=20, threshold=-1.0)
+        for i, embedding in enumerate(cached):
+            cache.add(f"q{i}", embedding, i)
+
+        for i, embedding in enumerate(cached):
+            query = _unit(embedding + 0.3 * rng.standard_normal(768) / np.sqrt(768))
+            exact = np.array([float(query @ other) for other in cached])
+            assert cache.lookup(query)[1] == int(np.argmax(exact)) == i
+
+        # Only a query within the threshold, up to quantization error, hits
+        cache = SimilarQueryCache(threshold=0.95)
+        cache.add("q", cached[0], "response")
+        assert cache.lookup(_unit(cached[0] + 0.2 * cached[1])) is not None  # ~0.98
+        assert cache.lookup(_unit(cached[0] + 0.4 * cached[1])) is None  # ~0.93
+
+
+class TestQuantizeInt8:
+    """Test the int8 quantization of cached query embeddings."""
+
+    @pytest.mark.unit
+    def test_round_trip(self):
+        """Test that dequantized values are within half a step of the input."""
+        vector = np.array([0.5, -0.25, 0.1, -0.5, 0.0], dtype=np.float32)
+        quantized, scale = _quantize_int8(vector)
+
+        assert quantized.dtype == np.int8
+        assert np.abs(quantized).max() == 127
+        assert np.allclose(quantized * scale, vector, atol=scale / 2)
+
+    @pytest.mark.unit
+    def test_zero_vector(self):
+        """Test that a zero vector quantizes without dividing by zero."""
+        quantized, scale = _quantize_int8(np.zeros(4, dtype=np.float32))
+        assert not quantized.any()
+        assert scale == 1.0
@@ -3,41 +3,47 @@
     Table of content is automatically generated by Agent Docstrings v1.3.5
     
     Classes/Functions:
-        - TestMathematicalProcessor (line 59):
-            - test_initialization() (line 63)
-            - test_process_equation_basic(mathematical_processor, sample_equations) (line 70)
-            - test_process_equation_empty(mathematical_processor) (line 96)
-            - test_process_equation_invalid(mathematical_processor) (line 104)
-            - test_create_mathematical_content(mathematical_processor) (line 115)
-        - TestContentClassifier (line 128):
-            - test_initialization() (line 132)
-            - test_classify_prose(content_classifier) (line 141)
-            - test_classify_equation(content_classifier) (line 149)
-            - test_classify_figure(content_classifier) (line 158)
-            - test_classify_table(content_classifier) (line 166)
-        - TestEnhancedChunker (line 174):
-            - test_initialization() (line 178)
-            - test_chunk_text_basic(enhanced_chunker, sample_text) (line 186)
-            - test_chunk_text_empty(enhanced_chunker) (line 202)
-            - test_chunk_text_small(enhanced_chunker) (line 208)
-        - TestAssetProcessor (line 218):
-            - test_initialization() (line 222)
-            - test_process_asset_figure(asset_processor) (line 228)
-            - test_process_asset_table(asset_processor) (line 240)
-            - test_process_asset_none(asset_processor) (line 251)
-        - TestGlossaryExtractor (line 260):
-            - test_initialization() (line 264)
-            - test_extract_glossary_terms(glossary_extractor) (line 270)
-            - test_extract_glossary_terms_empty(glossary_extractor) (line 280)
-            - test_extract_glossary_terms_no_terms(glossary_extractor) (line 286)
-        - TestEnhancedChunk (line 293):
-            - test_chunk_creation() (line 297)
-            - test_chunk_to_dict() (line 316)
-            - test_chunk_get_summary() (line 334)
-            - test_chunk_retrieval_text() (line 353)
-        - TestContentType (line 369):
-            - test_content_type_values() (line 373)
-            - test_content_type_from_value() (line 382)
+        - TestMathematicalProcessor (line 68):
+            - test_initialization() (line 72)
+            - test_process_equation_basic(mathematical_processor, sample_equations) (line 79)
+            - test_process_equation_empty(mathematical_processor) (line 105)
+            - test_process_equation_invalid(mathematical_processor) (line 113)
+            - test_create_mathematical_content(mathematical_processor) (line 124)
+            - test_process_equation_cache() (line 137)
+            - test_process_equation_cache_uses_instance() (line 161)
+            - test_canonicalize_timeout_not_cached(monkeypatch) (line 184)
+        - TestContentClassifier (line 216):
+            - test_initialization() (line 220)
+            - test_classify_prose(content_classifier) (line 229)
+            - test_classify_equation(content_classifier) (line 237)
+            - test_classify_figure(content_classifier) (line 246)
+            - test_classify_table(content_classifier) (line 254)
+            - test_extract_equation(content_classifier) (line 262)
+        - TestEnhancedChunker (line 274):
+            - test_initialization() (line 278)
+            - test_chunk_text_basic(enhanced_chunker, sample_text) (line 286)
+            - test_chunk_text_empty(enhanced_chunker) (line 302)
+            - test_chunk_text_small(enhanced_chunker) (line 308)
+        - TestAssetProcessor (line 318):
+            - test_initialization() (line 322)
+            - test_process_asset_figure(asset_processor) (line 328)
+            - test_process_asset_table(asset_processor) (line 340)
+            - test_process_asset_none(asset_processor) (line 351)
+        - TestGlossaryExtractor (line 360):
+            - test_initialization() (line 364)
+            - test_extract_glossary_terms(glossary_extractor) (line 370)
+            - test_extract_glossary_terms_empty(glossary_extractor) (line 380)
+            - test_extract_glossary_terms_no_terms(glossary_extractor) (line 386)
+            - test_search_glossary_terms(glossary_extractor) (line 393)
+            - test_search_glossary_terms_after_edit(glossary_extractor) (line 414)
+        - TestEnhancedChunk (line 424):
+            - test_chunk_creation() (line 428)
+            - test_chunk_to_dict() (line 447)
+            - test_chunk_get_summary() (line 465)
+            - test_chunk_retrieval_text() (line 484)
+        - TestContentType (line 500):
+            - test_content_type_values() (line 504)
+            - test_content_type_from_value() (line 513)
     --- END AUTO-GENERATED DOCSTRING ---
 
 Unit Tests for Enhanced SciRAG Components
@@ -46,13 +52,16 @@ This module contains unit tests for individual components of the Enhanced SciRAG
 Each test focuses on a single component in isolation.
 """
 import pytest
+import signal
 import tempfile
+import time
 from pathlib import Path
 from typing import List, Dict, Any
 
 from scirag.enhanced_processing import (
     MathematicalProcessor, ContentClassifier, EnhancedChunker,
-    AssetProcessor, GlossaryExtractor, EnhancedChunk, ContentType
+    AssetProcessor, GlossaryExtractor, EnhancedChunk, ContentType,
+    GlossaryContent
 )
 
 
@@ -124,6 +133,85 @@ class TestMathematicalProcessor:
         assert content.complexity_score > 0
         assert content.equation_type == 'equation'
 
+    @pytest.mark.unit
+    def test_process_equation_cache(self):
+        """Test cached results are per subclass and thaw only list values."""
+        class TaggedProcessor(MathematicalProcessor):
+            def _compute_equation(self, equation_tex, canonicalize=True):
+                result = super()._compute_equation(equation_tex, canonicalize)
+                result['equation_type'] = 'tagged'
+                result['span'] = (0, len(equation_tex))
+                return result
+
+        equation = "F = m a + cache"
+        plain = MathematicalProcessor(enable_sympy=False).process_equation(equation)
+        tagged = TaggedProcessor(enable_sympy=False).process_equation(equation)
+        assert plain['equation_type'] != 'tagged'
+        assert 'span' not in plain
+        assert tagged['equation_type'] == 'tagged'
+        assert tagged['span'] == (0, len(equation))
+
+        # Callers get fresh lists, so mutating one leaves the cache intact
+        tagged['math_tokens'].append('extra')
+        again = TaggedProcessor(enable_sympy=False).process_equation(equation)
+        assert isinstance(again['math_tokens'], list)
+        assert 'extra' not in again['math_tokens']
+
+    @pytest.mark.unit
+    def test_process_equation_cache_uses_instance(self):
+        """Test cached results follow the instance configuration, not a fresh instance."""
+        class LabelledProcessor(MathematicalProcessor):
+            def __init__(self, label):
+                super().__init__(enable_sympy=False)
+                self.label = label
+
+            def _cache_config(self):
+                return super()._cache_config() + (self.label,)
+
+            def _compute_equation(self, equation_tex, canonicalize=True):
+                result = super()._compute_equation(equation_tex, canonicalize)
+                result['equation_type'] = self.label
+                return result
+
+        equation = "G = 6.674 + cache"
+        assert LabelledProcessor('first').process_equation(equation)['equation_type'] == 'first'
+        assert LabelledProcessor('second').process_equation(equation)['equation_type'] == 'second'
+        assert LabelledProcessor('first').process_equation(equation)['equation_type'] == 'first'
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not hasattr(signal, 'setitimer'),
+                        reason="SymPy timeouts need setitimer")
+    def test_canonicalize_timeout_not_cached(self, monkeypatch):
+        """Test a result whose SymPy canonicalization timed out is not cached."""
+        from scirag.enhanced_processing import mathematical_processor as mp
+
+        calls = []
+
+        def slow_then_fast(equation_tex):
+            calls.append(equation_tex)
+            if len(calls) == 1:
+                time.sleep(5)
+            return 'canonical'
+
+        monkeypatch.setattr(mp, '_sympify_and_simplify', slow_then_fast)
+        monkeypatch.setattr(mp, '_SYMPY_TIMEOUT', 0.05)
+        mp.clear_equation_cache()
+        processor = MathematicalProcessor(enable_sympy=True)
+        if not processor._sympy_available:
+            pytest.skip("SymPy is not installed")
+
+        try:
+            start = time.time()
+            result = processor.process_equation('x + timeout')
+            assert time.time() - start < 2
+            assert 'math_canonical' not in result
+            assert result['math_tokens'] == ['x', '+', 'timeout']
+            assert processor.process_equation('x + timeout')['math_canonical'] == 'canonical'
+            assert processor.process_equation('x + timeout')['math_canonical'] == 'canonical'
+            assert len(calls) == 2
+        finally:
+            mp.clear_equation_cache()
+
 
 class TestContentClassifier:
     """Test the ContentClassifier component."""
@@ -170,6 +258,18 @@ class TestContentClassifier:
         )
         assert content_type == ContentType.TABLE
 
+    @pytest.mark.unit
+    def test_extract_equation(self, content_classifier):
+        """Test extraction of the first equation body."""
+        assert content_classifier.extract_equation("Plain prose.") is None
+        assert content_classifier.extract_equation("Cost is $5 or more") is None
+        assert content_classifier.extract_equation(
+            "Energy $ E = mc^2 $ and $p = mv$.") == "E = mc^2"
+        text = "\\begin{equation}\n  F = ma\n\\end{equation}"
+        assert content_classifier.extract_equation(text) == "F = ma"
+        start, end = content_classifier.locate_equation(text)
+        assert text[start:end].strip() == "F = ma"
+
 
 class TestEnhancedChunker:
     """Test the EnhancedChunker component."""
@@ -289,6 +389,37 @@ class TestGlossaryExtractor:
         terms = glossary_extractor.extract_glossary_terms(text, "test_doc")
         assert isinstance(terms, list)
 
+    @pytest.mark.unit
+    def test_search_glossary_terms(self, glossary_extractor):
+        """Test glossary search with and without a search index."""
+        glossary = [
+            GlossaryContent(term="black hole",
+                            definition="A region of spacetime with escape velocity above c",
+                            related_terms=["event horizon"]),
+            GlossaryContent(term="redshift", definition="Stretching of light",
+                            context="in cosmology"),
+        ]
+        index = glossary_extractor.build_search_index(glossary)
+
+        for query in ("HOLE", "ck ho", "spacetime with esc", "horiz", "cosmo", "light"):
+            expected = glossary_extractor.search_glossary_terms(glossary, query)
+            assert expected
+            assert glossary_extractor.search_glossary_terms(
+                glossary, query, index=index) == expected
+        assert glossary_extractor.search_glossary_terms(glossary, "ck hx") == []
+        assert glossary_extractor.search_glossary_terms(
+            glossary, "ck hx", index=index) == []
+
+    @pytest.mark.unit
+    def test_search_glossary_terms_after_edit(self, glossary_extractor):
+        """Test that searching without an index sees in-place glossary edits."""
+        glossary = [GlossaryContent(term="redshift", definition="Stretching of light")]
+        assert glossary_extractor.search_glossary_terms(glossary, "quasar") == []
+
+        glossary[0].definition = "Light from a receding quasar"
+        glossary.append(GlossaryContent(term="quasar", definition="Active galactic nucleus"))
+        assert glossary_extractor.search_glossary_terms(glossary, "quasar") == glossary
+
 
 class TestEnhancedChunk:
     """Test the EnhancedChunk data structure."""